@@ -84,6 +84,16 @@ def get_arguments() -> argparse.Namespace:
         action="store_true",
         help="Skips pip install of required packages on startup",
     )
+    parser.add_argument(
+        "--yaml-cache",
+        action="store_true",
+        help="Cache the parsed configuration on disk between restarts",
+    )
+    parser.add_argument(
+        "--trace-startup",
+        action="store_true",
+        help="Write a Chrome trace of the startup to the configuration directory",
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose logging to file."
     )
@@ -305,6 +315,8 @@ def main() -> int:
         log_no_color=args.log_no_color,
         skip_pip=args.skip_pip,
         safe_mode=args.safe_mode,
+        yaml_cache=args.yaml_cache,
+        trace_startup=args.trace_startup,
         debug=args.debug,
         open_ui=args.open_ui,
     )
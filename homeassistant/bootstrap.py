@@ -2,23 +2,38 @@
 import asyncio
 import contextlib
 from datetime import datetime
+import importlib
 import logging
 import logging.handlers
 import os
 import sys
 import threading
 from time import monotonic
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Set
 
 import voluptuous as vol
 import yarl
 
 from homeassistant import config as conf_util, config_entries, core, loader
 from homeassistant.components import http
-from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    REQUIRED_NEXT_PYTHON_DATE,
+    REQUIRED_NEXT_PYTHON_VER,
+)
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import area_registry, device_registry, entity_registry
+from homeassistant.helpers import (
+    area_registry,
+    config_per_platform,
+    device_registry,
+    entity_registry,
+)
+from homeassistant.helpers.timeline import DATA_TIMELINE, Timeline, async_trace
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.requirements import (
+    DATA_REQUIREMENTS_TIME,
+    async_get_installed_packages,
+)
 from homeassistant.setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
@@ -26,8 +41,14 @@ from homeassistant.setup import (
     async_setup_component,
 )
 from homeassistant.util.async_ import gather_with_concurrency
+from homeassistant.util.json import save_json
 from homeassistant.util.logging import async_activate_log_queue_handler
-from homeassistant.util.package import async_get_user_site, is_virtual_env
+from homeassistant.util.package import (
+    async_get_user_site,
+    is_installed,
+    is_virtual_env,
+)
+from homeassistant.util.yaml import YamlCache
 
 if TYPE_CHECKING:
     from .runner import RuntimeConfig
@@ -35,10 +56,14 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+STARTUP_TRACE_FILENAME = "startup_trace.json"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
 
+# hass.data key for the time it took to import modules before setup.
+DATA_PREIMPORT_TIMES = "preimport_times"
+
 LOG_SLOW_STARTUP_INTERVAL = 60
 
 STAGE_1_TIMEOUT = 120
@@ -79,6 +104,7 @@ async def async_setup_hass(
     """Set up Home Assistant."""
     hass = core.HomeAssistant()
     hass.config.config_dir = runtime_config.config_dir
+    timeline = hass.data[DATA_TIMELINE] = Timeline()
 
     async_enable_logging(
         hass,
@@ -98,6 +124,11 @@ async def async_setup_hass(
         _LOGGER.error("Error getting configuration path")
         return None
 
+    if runtime_config.yaml_cache:
+        hass.data[conf_util.DATA_YAML_CACHE] = await hass.async_add_executor_job(
+            YamlCache, hass.config.path(conf_util.YAML_CACHE_FILE)
+        )
+
     _LOGGER.info("Config directory: %s", runtime_config.config_dir)
 
     config_dict = None
@@ -108,7 +139,12 @@ async def async_setup_hass(
         await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
 
         try:
-            config_dict = await conf_util.async_hass_config_yaml(hass)
+            config_dict = await async_trace(
+                hass,
+                "configuration",
+                "bootstrap",
+                conf_util.async_hass_config_yaml(hass),
+            )
         except HomeAssistantError as err:
             _LOGGER.error(
                 "Failed to parse configuration.yaml: %s. Activating safe mode",
@@ -148,6 +184,7 @@ async def async_setup_hass(
         hass.config.internal_url = old_config.internal_url
         hass.config.external_url = old_config.external_url
         hass.config.config_dir = old_config.config_dir
+        hass.data[DATA_TIMELINE] = timeline
 
     if safe_mode:
         _LOGGER.info("Starting in safe mode")
@@ -163,6 +200,25 @@ async def async_setup_hass(
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
+    async def async_finish_timeline(_: core.Event) -> None:
+        """Stop recording the startup timeline."""
+        timeline.async_finish()
+        blocking = timeline.blocking()
+        if blocking:
+            _LOGGER.warning(
+                "Integrations that blocked the event loop during startup: %s",
+                ", ".join(f"{span.name} ({span.blocked:.2f}s)" for span in blocking),
+            )
+
+        if runtime_config.trace_startup:
+            await hass.async_add_executor_job(
+                save_json,
+                hass.config.path(STARTUP_TRACE_FILENAME),
+                timeline.as_chrome_trace(),
+            )
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, async_finish_timeline)
+
     return hass
 
 
@@ -203,11 +259,16 @@ async def async_from_config_dict(
     _LOGGER.debug("Setting up %s", CORE_INTEGRATIONS)
 
     if not all(
-        await asyncio.gather(
-            *(
-                async_setup_component(hass, domain, config)
-                for domain in CORE_INTEGRATIONS
-            )
+        await async_trace(
+            hass,
+            "core",
+            "bootstrap",
+            asyncio.gather(
+                *(
+                    async_setup_component(hass, domain, config)
+                    for domain in CORE_INTEGRATIONS
+                )
+            ),
         )
     ):
         _LOGGER.error("Home Assistant core failed to initialize. ")
@@ -232,7 +293,11 @@ async def async_from_config_dict(
     await _async_set_up_integrations(hass, config)
 
     stop = monotonic()
-    _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
+    _LOGGER.info(
+        "Home Assistant initialized in %.2fs, processing requirements took %.2fs",
+        stop - start,
+        hass.data.get(DATA_REQUIREMENTS_TIME, 0),
+    )
 
     if REQUIRED_NEXT_PYTHON_DATE and sys.version_info[:3] < REQUIRED_NEXT_PYTHON_VER:
         msg = (
@@ -421,6 +486,114 @@ async def async_setup_multi_components(
         )
 
 
+def _preimport_module(
+    preimport_times: Dict[str, float],
+    installed: Dict[str, str],
+    name: str,
+    requirements: Iterable[str],
+) -> bool:
+    """Import a module if its requirements are installed."""
+    # Importing an outdated requirement would keep it loaded after the
+    # upgrade during setup, so leave those modules to setup.
+    if not all(is_installed(req, installed) for req in requirements):
+        return False
+
+    start = monotonic()
+    try:
+        importlib.import_module(name)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.debug("Unable to pre-import %s", name, exc_info=True)
+        return False
+
+    preimport_times[name] = monotonic() - start
+    return True
+
+
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant,
+    config: Dict[str, Any],
+    integrations: Dict[str, loader.Integration],
+) -> None:
+    """Import the integrations and their platforms in the executor.
+
+    Importing them during setup would block the event loop. Integrations are
+    imported after their dependencies, independent ones in parallel.
+    """
+    preimport_times = hass.data[DATA_PREIMPORT_TIMES] = {}
+    installed = await async_get_installed_packages(hass)
+    semaphore = asyncio.Semaphore(MAX_LOAD_CONCURRENTLY)
+    tasks: Dict[str, asyncio.Future] = {}
+    start = monotonic()
+
+    async def async_import(name: str, requirements: Iterable[str]) -> bool:
+        """Import a module in the executor."""
+        async with semaphore:
+            return await hass.async_add_executor_job(
+                _preimport_module, preimport_times, installed, name, requirements
+            )
+
+    async def async_import_integration(integration: loader.Integration) -> bool:
+        """Import an integration after its dependencies."""
+        deps = [tasks[dep] for dep in integration.dependencies if dep in tasks]
+        if not all(await asyncio.gather(*deps)):
+            return False
+        return await async_import(integration.pkg_path, integration.requirements)
+
+    for domain, integration in integrations.items():
+        tasks[domain] = asyncio.ensure_future(async_import_integration(integration))
+
+    await asyncio.gather(*tasks.values())
+
+    @core.callback
+    def imported(domain: str) -> bool:
+        """Return if an integration has been imported."""
+        return domain in tasks and tasks[domain].result()
+
+    # Platforms set up from the configuration, like template.sensor
+    platforms = []
+
+    for domain in integrations:
+        if not imported(domain):
+            continue
+
+        for platform_name, _ in config_per_platform(config, domain):
+            if (
+                isinstance(platform_name, str)
+                and (platform_name, domain) not in platforms
+            ):
+                platforms.append((platform_name, domain))
+
+    platform_integrations = await gather_with_concurrency(
+        loader.MAX_LOAD_CONCURRENTLY,
+        *(
+            loader.async_get_integration(hass, platform_name)
+            for platform_name, _ in platforms
+        ),
+        return_exceptions=True,
+    )
+
+    await asyncio.gather(
+        *(
+            async_import(f"{integration.pkg_path}.{domain}", integration.requirements)
+            for (_, domain), integration in zip(platforms, platform_integrations)
+            if isinstance(integration, loader.Integration)
+            and all(imported(dep) for dep in integration.dependencies)
+        )
+    )
+
+    _LOGGER.debug(
+        "Pre-imported %s modules in %.2fs, slowest: %s",
+        len(preimport_times),
+        monotonic() - start,
+        ", ".join(
+            f"{name} ({duration:.2f}s)"
+            for name, duration in sorted(
+                preimport_times.items(), key=lambda item: item[1], reverse=True
+            )[:10]
+        ),
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: Dict[str, Any]
 ) -> None:
@@ -438,13 +611,18 @@ async def _async_set_up_integrations(
 
         integrations_to_process = [
             int_or_exc
-            for int_or_exc in await gather_with_concurrency(
-                loader.MAX_LOAD_CONCURRENTLY,
-                *(
-                    loader.async_get_integration(hass, domain)
-                    for domain in old_to_resolve
+            for int_or_exc in await async_trace(
+                hass,
+                "resolve",
+                "bootstrap",
+                gather_with_concurrency(
+                    loader.MAX_LOAD_CONCURRENTLY,
+                    *(
+                        loader.async_get_integration(hass, domain)
+                        for domain in old_to_resolve
+                    ),
+                    return_exceptions=True,
                 ),
-                return_exceptions=True,
             )
             if isinstance(int_or_exc, loader.Integration)
         ]
@@ -474,7 +652,12 @@ async def _async_set_up_integrations(
     # Load logging as soon as possible
     if logging_domains:
         _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config, setup_started)
+        await async_trace(
+            hass,
+            "logging",
+            "bootstrap",
+            async_setup_multi_components(hass, logging_domains, config, setup_started),
+        )
 
     # Start up debuggers. Start these first in case they want to wait.
     debuggers = domains_to_setup & DEBUGGER_INTEGRATIONS
@@ -508,11 +691,17 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
 
-    # Load the registries
+    # Load the registries while the integrations are imported
     await asyncio.gather(
         device_registry.async_load(hass),
         entity_registry.async_load(hass),
         area_registry.async_load(hass),
+        async_trace(
+            hass,
+            "preimport",
+            "bootstrap",
+            _async_preimport_integrations(hass, config, integration_cache),
+        ),
     )
 
     # Start setup
@@ -522,8 +711,13 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(
-                    hass, stage_1_domains, config, setup_started
+                await async_trace(
+                    hass,
+                    "stage 1",
+                    "bootstrap",
+                    async_setup_multi_components(
+                        hass, stage_1_domains, config, setup_started
+                    ),
                 )
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 1 - moving forward")
@@ -537,8 +731,13 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(
-                    hass, stage_2_domains, config, setup_started
+                await async_trace(
+                    hass,
+                    "stage 2",
+                    "bootstrap",
+                    async_setup_multi_components(
+                        hass, stage_2_domains, config, setup_started
+                    ),
                 )
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
@@ -547,6 +746,8 @@ async def _async_set_up_integrations(
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+            await async_trace(
+                hass, "wrap up", "bootstrap", hass.async_block_till_done()
+            )
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
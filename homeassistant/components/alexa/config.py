@@ -10,6 +10,7 @@ class AbstractConfig(ABC):
     """Hold the configuration for Alexa."""
 
     _unsub_proactive_report = None
+    change_report_queue = None
 
     def __init__(self, hass):
         """Initialize abstract config."""
@@ -1,5 +1,6 @@
 """Alexa state report code."""
 import asyncio
+from collections import Counter
 import json
 import logging
 from typing import Optional
@@ -7,7 +8,12 @@ from typing import Optional
 import aiohttp
 import async_timeout
 
-from homeassistant.const import HTTP_ACCEPTED, MATCH_ALL, STATE_ON
+from homeassistant.const import (
+    HTTP_ACCEPTED,
+    HTTP_TOO_MANY_REQUESTS,
+    MATCH_ALL,
+    STATE_ON,
+)
 from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.significant_change import create_checker
 import homeassistant.util.dt as dt_util
@@ -19,6 +25,146 @@ from .messages import AlexaResponse
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
 
+# Number of ChangeReport messages that are sent at the same time
+MAX_PARALLEL_REPORTS = 5
+
+# Seconds an access token is reused before asking the config again. This is
+# well within the margin the token providers refresh tokens ahead of expiry.
+TOKEN_REUSE_TIME = 60
+
+# Seconds to wait before sending again when Alexa throttles us
+BACKOFF_INITIAL = 1
+BACKOFF_MAX = 300
+
+
+class ChangeReportQueue:
+    """Queue of ChangeReport messages waiting to be sent to Alexa.
+
+    Only the latest properties of an endpoint are kept, so a burst of state
+    changes results in a single message per endpoint.
+    """
+
+    def __init__(self, hass, config):
+        """Initialize the queue."""
+        self.hass = hass
+        self.config = config
+        self.metrics = Counter(queued=0, coalesced=0, sent=0, dropped=0, throttled=0)
+        self.last_latency = None
+        self.max_latency = 0.0
+        self._latency_total = 0.0
+        self._pending = {}
+        self._task = None
+        self._token = None
+        self._token_expires = 0
+        self._backoff = 0
+        self._stopped = False
+
+    @property
+    def average_latency(self):
+        """Return the average time between queueing and sending a report."""
+        if not self.metrics["sent"]:
+            return None
+        return self._latency_total / self.metrics["sent"]
+
+    @callback
+    def async_queue(self, alexa_entity, alexa_properties):
+        """Queue the properties of an entity to be reported."""
+        if self._stopped:
+            return
+
+        endpoint = alexa_entity.alexa_id()
+        queued_at = self.hass.loop.time()
+
+        if endpoint in self._pending:
+            self.metrics["coalesced"] += 1
+            queued_at = self._pending[endpoint][2]
+        else:
+            self.metrics["queued"] += 1
+
+        self._pending[endpoint] = (alexa_entity, alexa_properties, queued_at)
+
+        if self._task is None:
+            self._task = self.hass.async_create_task(self._async_process())
+
+    @callback
+    def async_stop(self):
+        """Drop all pending reports and stop sending."""
+        self._stopped = True
+        self.metrics["dropped"] += len(self._pending)
+        self._pending.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_get_token(self):
+        """Return an access token, reusing a recent one."""
+        now = self.hass.loop.time()
+        if self._token is None or now >= self._token_expires:
+            self._token = await self.config.async_get_access_token()
+            self._token_expires = now + TOKEN_REUSE_TIME
+        return self._token
+
+    async def _async_process(self):
+        """Send the pending reports until the queue is empty."""
+        task = asyncio.current_task()
+        try:
+            while self._pending:
+                if self._backoff:
+                    await asyncio.sleep(self._backoff)
+
+                batch = []
+                for endpoint in list(self._pending)[:MAX_PARALLEL_REPORTS]:
+                    batch.append((endpoint, self._pending.pop(endpoint)))
+
+                token = await self._async_get_token()
+                statuses = await asyncio.gather(
+                    *(
+                        async_send_changereport_message(
+                            self.hass, self.config, item[0], item[1], token=token
+                        )
+                        for _, item in batch
+                    )
+                )
+                self._async_handle_results(batch, statuses)
+        finally:
+            if self._task is task:
+                self._task = None
+
+    @callback
+    def _async_handle_results(self, batch, statuses):
+        """Update the metrics and backoff from the responses of a batch."""
+        now = self.hass.loop.time()
+        throttled = False
+
+        for (endpoint, item), status in zip(batch, statuses):
+            if status == HTTP_ACCEPTED:
+                latency = now - item[2]
+                self.metrics["sent"] += 1
+                self.last_latency = latency
+                self.max_latency = max(self.max_latency, latency)
+                self._latency_total += latency
+                continue
+
+            # The token might have been rejected, get a fresh one next time
+            self._token = None
+
+            if status == HTTP_TOO_MANY_REQUESTS:
+                throttled = True
+                self.metrics["throttled"] += 1
+                # Try again later, unless newer properties have been queued
+                self._pending.setdefault(endpoint, item)
+            else:
+                self.metrics["dropped"] += 1
+
+        if throttled:
+            self._backoff = min(self._backoff * 2 or BACKOFF_INITIAL, BACKOFF_MAX)
+            _LOGGER.warning(
+                "Alexa is throttling ChangeReports, retrying in %s seconds",
+                self._backoff,
+            )
+        else:
+            self._backoff = 0
+
 
 async def async_enable_proactive_mode(hass, smart_home_config):
     """Enable the proactive mode.
@@ -42,6 +188,9 @@ async def async_enable_proactive_mode(hass, smart_home_config):
         return old_extra_arg is not None and old_extra_arg != new_extra_arg
 
     checker = await create_checker(hass, DOMAIN, extra_significant_check)
+    queue = smart_home_config.change_report_queue = ChangeReportQueue(
+        hass, smart_home_config
+    )
 
     async def async_entity_state_listener(
         changed_entity: str,
@@ -87,6 +236,9 @@ async def async_enable_proactive_mode(hass, smart_home_config):
                 )
             return
 
+        if not checker.async_prefilter(new_state):
+            return
+
         alexa_properties = list(alexa_changed_entity.serialize_properties())
 
         if not checker.async_is_significant_change(
@@ -94,23 +246,38 @@ async def async_enable_proactive_mode(hass, smart_home_config):
         ):
             return
 
-        await async_send_changereport_message(
-            hass, smart_home_config, alexa_changed_entity, alexa_properties
-        )
+        queue.async_queue(alexa_changed_entity, alexa_properties)
 
-    return hass.helpers.event.async_track_state_change(
+    unsub = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
 
+    @callback
+    def async_disable():
+        """Stop reporting state changes."""
+        unsub()
+        queue.async_stop()
+
+    return async_disable
+
 
 async def async_send_changereport_message(
-    hass, config, alexa_entity, alexa_properties, *, invalidate_access_token=True
+    hass,
+    config,
+    alexa_entity,
+    alexa_properties,
+    *,
+    invalidate_access_token=True,
+    token=None,
 ):
     """Send a ChangeReport message for an Alexa entity.
 
+    Returns the status of the response, or None if it could not be sent.
+
     https://developer.amazon.com/docs/smarthome/state-reporting-for-a-smart-home-skill.html#report-state-with-changereport-events
     """
-    token = await config.async_get_access_token()
+    if token is None:
+        token = await config.async_get_access_token()
 
     headers = {"Authorization": f"Bearer {token}"}
 
@@ -140,15 +307,15 @@ async def async_send_changereport_message(
 
     except (asyncio.TimeoutError, aiohttp.ClientError):
         _LOGGER.error("Timeout sending report to Alexa")
-        return
+        return None
 
     response_text = await response.text()
 
     _LOGGER.debug("Sent: %s", json.dumps(message_serialized))
     _LOGGER.debug("Received (%s): %s", response.status, response_text)
 
-    if response.status == HTTP_ACCEPTED:
-        return
+    if response.status in (HTTP_ACCEPTED, HTTP_TOO_MANY_REQUESTS):
+        return response.status
 
     response_json = json.loads(response_text)
 
@@ -166,6 +333,7 @@ async def async_send_changereport_message(
         response_json["payload"]["code"],
         response_json["payload"]["description"],
     )
+    return response.status
 
 
 async def async_send_add_or_update_message(hass, config, entity_ids):
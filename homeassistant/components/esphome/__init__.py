@@ -31,7 +31,10 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import template
 import homeassistant.helpers.config_validation as cv
 import homeassistant.helpers.device_registry as dr
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_connect_keyed,
+)
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.json import JSONEncoder
@@ -97,7 +100,7 @@ async def async_setup_entry(hass: HomeAssistantType, entry: ConfigEntry) -> bool
 
     @callback
     def async_on_state(state: EntityState) -> None:
-        """Send dispatcher updates when a new state is received."""
+        """Distribute updates when a new state is received."""
         entry_data.async_update_state(hass, state)
 
     @callback
@@ -442,18 +445,7 @@ async def platform_async_setup_entry(
         async_dispatcher_connect(hass, signal, async_list_entities)
     )
 
-    @callback
-    def async_entity_state(state: EntityState):
-        """Notify the appropriate entity of an updated state."""
-        if not isinstance(state, state_type):
-            return
-        entry_data.state[component_key][state.key] = state
-        entry_data.async_update_entity(hass, component_key, state.key)
-
-    signal = f"esphome_{entry.entry_id}_on_state"
-    entry_data.cleanup_callbacks.append(
-        async_dispatcher_connect(hass, signal, async_entity_state)
-    )
+    entry_data.state_type_to_component_key[state_type] = component_key
 
 
 def esphome_state_property(func):
@@ -515,22 +507,16 @@ class EsphomeBaseEntity(Entity):
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
         self.async_on_remove(
-            async_dispatcher_connect(
+            async_dispatcher_connect_keyed(
                 self.hass,
-                (
-                    f"esphome_{self._entry_id}_remove_"
-                    f"{self._component_key}_{self._key}"
-                ),
+                f"esphome_{self._entry_id}_remove",
+                (self._component_key, self._key),
                 functools.partial(self.async_remove, force_remove=True),
             )
         )
 
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"esphome_{self._entry_id}_on_device_update",
-                self._on_device_update,
-            )
+            self._entry_data.async_subscribe_device_updated(self._on_device_update)
         )
 
     @callback
@@ -618,12 +604,7 @@ class EsphomeEntity(EsphomeBaseEntity):
         await super().async_added_to_hass()
 
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                (
-                    f"esphome_{self._entry_id}"
-                    f"_update_{self._component_key}_{self._key}"
-                ),
-                self.async_write_ha_state,
+            self._entry_data.async_subscribe_state_update(
+                self._component_key, self._key, self.async_write_ha_state
             )
         )
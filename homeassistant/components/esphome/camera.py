@@ -7,7 +7,6 @@ from aioesphomeapi import CameraInfo, CameraState
 from homeassistant.components import camera
 from homeassistant.components.camera import Camera
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.typing import HomeAssistantType
 
 from . import EsphomeBaseEntity, platform_async_setup_entry
@@ -51,13 +50,8 @@ class EsphomeCamera(Camera, EsphomeBaseEntity):
         await super().async_added_to_hass()
 
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                (
-                    f"esphome_{self._entry_id}"
-                    f"_update_{self._component_key}_{self._key}"
-                ),
-                self._on_state_update,
+            self._entry_data.async_subscribe_state_update(
+                self._component_key, self._key, self._on_state_update
             )
         )
 
@@ -1,5 +1,6 @@
 """Runtime entry data for ESPHome stored in hass.data."""
 import asyncio
+import logging
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 
 from aioesphomeapi import (
@@ -21,14 +22,19 @@ from aioesphomeapi import (
 import attr
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import callback
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.core import HassJob, callback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_send,
+    async_dispatcher_send_keyed,
+)
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import HomeAssistantType
 
 if TYPE_CHECKING:
     from . import APIClient
 
+_LOGGER = logging.getLogger(__name__)
+
 SAVE_DELAY = 120
 
 # Mapping from ESPHome info type to HA platform
@@ -70,21 +76,65 @@ class RuntimeEntryData:
     loaded_platforms: Set[str] = attr.ib(factory=set)
     platform_load_lock: asyncio.Lock = attr.ib(factory=asyncio.Lock)
 
+    # Mapping from ESPHome state type to the component key of the loaded platform
+    state_type_to_component_key: Dict[type, str] = attr.ib(factory=dict)
+    # State update listeners, keyed by (component_key, key) of the entity
+    state_subscriptions: Dict[Tuple[str, int], HassJob] = attr.ib(factory=dict)
+    device_update_subscriptions: Set[HassJob] = attr.ib(factory=set)
+
+    # Number of state packets received from the device and the number of
+    # entity callbacks that were run for them
+    state_packets_received: int = attr.ib(default=0)
+    entity_updates_dispatched: int = attr.ib(default=0)
+
+    @callback
+    def async_subscribe_state_update(
+        self, component_key: str, key: int, target: Callable[[], Any]
+    ) -> Callable[[], None]:
+        """Subscribe to state updates of a single entity."""
+        subscription_key = (component_key, key)
+        job = HassJob(target)
+        self.state_subscriptions[subscription_key] = job
+
+        @callback
+        def _unsubscribe() -> None:
+            if self.state_subscriptions.get(subscription_key) is job:
+                del self.state_subscriptions[subscription_key]
+
+        return _unsubscribe
+
+    @callback
+    def async_subscribe_device_updated(
+        self, target: Callable[[], Any]
+    ) -> Callable[[], None]:
+        """Subscribe to updates of the core device state like availability."""
+        job = HassJob(target)
+        self.device_update_subscriptions.add(job)
+
+        @callback
+        def _unsubscribe() -> None:
+            self.device_update_subscriptions.discard(job)
+
+        return _unsubscribe
+
     @callback
     def async_update_entity(
         self, hass: HomeAssistantType, component_key: str, key: int
     ) -> None:
-        """Schedule the update of an entity."""
-        signal = f"esphome_{self.entry_id}_update_{component_key}_{key}"
-        async_dispatcher_send(hass, signal)
+        """Run the update of an entity."""
+        job = self.state_subscriptions.get((component_key, key))
+        if job is None:
+            return
+        self.entity_updates_dispatched += 1
+        _async_run_subscription(hass, job)
 
     @callback
     def async_remove_entity(
         self, hass: HomeAssistantType, component_key: str, key: int
     ) -> None:
         """Schedule the removal of an entity."""
-        signal = f"esphome_{self.entry_id}_remove_{component_key}_{key}"
-        async_dispatcher_send(hass, signal)
+        signal = f"esphome_{self.entry_id}_remove"
+        async_dispatcher_send_keyed(hass, signal, (component_key, key))
 
     async def _ensure_platforms_loaded(
         self, hass: HomeAssistantType, entry: ConfigEntry, platforms: Set[str]
@@ -119,15 +169,21 @@ class RuntimeEntryData:
 
     @callback
     def async_update_state(self, hass: HomeAssistantType, state: EntityState) -> None:
-        """Distribute an update of state information to all platforms."""
-        signal = f"esphome_{self.entry_id}_on_state"
-        async_dispatcher_send(hass, signal, state)
+        """Distribute an update of state information to the owning entity."""
+        self.state_packets_received += 1
+        component_key = self.state_type_to_component_key.get(type(state))
+        if component_key is None:
+            # Platform for this state is not loaded (yet)
+            return
+        self.state[component_key][state.key] = state
+        self.async_update_entity(hass, component_key, state.key)
 
     @callback
     def async_update_device_state(self, hass: HomeAssistantType) -> None:
         """Distribute an update of a core device state like availability."""
-        signal = f"esphome_{self.entry_id}_on_device_update"
-        async_dispatcher_send(hass, signal)
+        for job in list(self.device_update_subscriptions):
+            self.entity_updates_dispatched += 1
+            _async_run_subscription(hass, job)
 
     async def async_load_from_store(self) -> Tuple[List[EntityInfo], List[UserService]]:
         """Load the retained data from store and return de-serialized data."""
@@ -162,5 +218,14 @@ class RuntimeEntryData:
         self.store.async_delay_save(lambda: store_data, SAVE_DELAY)
 
 
+@callback
+def _async_run_subscription(hass: HomeAssistantType, job: HassJob) -> None:
+    """Run a subscribed job, logging any exception it raises."""
+    try:
+        hass.async_run_hass_job(job)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Error updating ESPHome entity %s", job.target)
+
+
 def _attr_obj_from_dict(cls, **kwargs):
     return cls(**{key: kwargs[key] for key in attr.fields_dict(cls) if key in kwargs})
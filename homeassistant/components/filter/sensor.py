@@ -1,4 +1,5 @@
 """Allows the creation of a sensor that filters state property."""
+from bisect import bisect_left, insort
 from collections import Counter, deque
 from copy import copy
 from datetime import timedelta
@@ -237,7 +238,29 @@ class SensorFilter(Entity):
             return
 
         self._state = temp_state.state
+        self._update_filter_sensor_attributes(new_state)
 
+        if update_ha:
+            self.async_write_ha_state()
+
+    @callback
+    def _replay_filter_sensor_states(self, states):
+        """Run a batch of states through the filter chain."""
+        for filt in self._filters:
+            if not states:
+                return
+            states = filt.filter_states([copy(state) for state in states])
+
+        if not states:
+            return
+
+        self._state = states[-1].state
+        for state in states:
+            self._update_filter_sensor_attributes(state)
+
+    @callback
+    def _update_filter_sensor_attributes(self, new_state):
+        """Set icon, device class and unit from the source state."""
         if self._icon is None:
             self._icon = new_state.attributes.get(ATTR_ICON, ICON)
 
@@ -252,9 +275,6 @@ class SensorFilter(Entity):
                 ATTR_UNIT_OF_MEASUREMENT
             )
 
-        if update_ha:
-            self.async_write_ha_state()
-
     async def async_added_to_hass(self):
         """Register callbacks."""
 
@@ -299,25 +319,28 @@ class SensorFilter(Entity):
                     )
                 )
                 if self._entity in filter_history:
-                    history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
-                    )
+                    history_list.extend(filter_history[self._entity])
 
-            # Sort the window states
-            history_list = sorted(history_list, key=lambda s: s.last_updated)
+            # Sort the window states, dropping the states returned by both queries
+            history_list = list(
+                {
+                    (state.last_updated, state.state): state for state in history_list
+                }.values()
+            )
+            history_list.sort(key=lambda s: s.last_updated)
             _LOGGER.debug(
                 "Loading from history: %s",
                 [(s.state, s.last_updated) for s in history_list],
             )
 
             # Replay history through the filter chain
-            for state in history_list:
-                if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]:
-                    self._update_filter_sensor_state(state, False)
+            self._replay_filter_sensor_states(
+                [
+                    state
+                    for state in history_list
+                    if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]
+                ]
+            )
 
         self.async_on_remove(
             async_track_state_change_event(
@@ -451,6 +474,38 @@ class Filter:
         new_state.state = filtered.state
         return new_state
 
+    def _numeric_states(self, new_states):
+        """Return (state, FilterState) pairs, dropping states that can't be used."""
+        pairs = []
+        for new_state in new_states:
+            fstate = FilterState(new_state)
+            if self._only_numbers and not isinstance(fstate.state, Number):
+                _LOGGER.error(
+                    "Could not convert state: %s (%s) to number",
+                    new_state.state,
+                    type(new_state.state),
+                )
+                continue
+            pairs.append((new_state, fstate))
+        return pairs
+
+    def filter_states(self, new_states):
+        """Filter a batch of states in order.
+
+        Returns the states that are not skipped, with their filtered value.
+        Filters can override this to process the whole batch at once.
+        """
+        filtered_states = []
+        for new_state, fstate in self._numeric_states(new_states):
+            raw = copy(fstate) if self._store_raw else None
+            filtered = self._filter_state(fstate)
+            filtered.set_precision(self.precision)
+            self.states.append(raw or copy(filtered))
+            if not self._skip_processing:
+                new_state.state = filtered.state
+                filtered_states.append(new_state)
+        return filtered_states
+
 
 @FILTERS.register(FILTER_NAME_RANGE)
 class RangeFilter(Filter):
@@ -506,6 +561,26 @@ class RangeFilter(Filter):
 
         return new_state
 
+    def filter_states(self, new_states):
+        """Clamp a batch of states to the range."""
+        lower_bound = self._lower_bound
+        upper_bound = self._upper_bound
+        filtered_states = []
+        for new_state, fstate in self._numeric_states(new_states):
+            if upper_bound is not None and fstate.state > upper_bound:
+                self._stats_internal["erasures_up"] += 1
+                fstate.state = upper_bound
+            elif lower_bound is not None and fstate.state < lower_bound:
+                self._stats_internal["erasures_low"] += 1
+                fstate.state = lower_bound
+            fstate.set_precision(self.precision)
+            new_state.state = fstate.state
+            filtered_states.append(new_state)
+
+        if filtered_states:
+            self.states.append(fstate)
+        return filtered_states
+
 
 @FILTERS.register(FILTER_NAME_OUTLIER)
 class OutlierFilter(Filter):
@@ -544,6 +619,38 @@ class OutlierFilter(Filter):
             new_state.state = median
         return new_state
 
+    def filter_states(self, new_states):
+        """Filter a batch of states, keeping the window sorted for the median."""
+        window = self.states
+        size = window.maxlen
+        ordered = sorted(state.state for state in window)
+        filtered_states = []
+        for new_state, fstate in self._numeric_states(new_states):
+            raw = copy(fstate)
+            count = len(ordered)
+            if count:
+                half = count // 2
+                median = (
+                    ordered[half]
+                    if count % 2
+                    else (ordered[half - 1] + ordered[half]) / 2
+                )
+            else:
+                median = 0
+            if count == size and abs(fstate.state - median) > self._radius:
+                self._stats_internal["erasures"] += 1
+                fstate.state = median
+
+            if count == size:
+                del ordered[bisect_left(ordered, window[0].state)]
+            window.append(raw)
+            insort(ordered, raw.state)
+
+            fstate.set_precision(self.precision)
+            new_state.state = fstate.state
+            filtered_states.append(new_state)
+        return filtered_states
+
 
 @FILTERS.register(FILTER_NAME_LOWPASS)
 class LowPassFilter(Filter):
@@ -568,6 +675,22 @@ class LowPassFilter(Filter):
 
         return new_state
 
+    def filter_states(self, new_states):
+        """Filter a batch of states, carrying the previous value along."""
+        new_weight = 1.0 / self._time_constant
+        prev_weight = 1.0 - new_weight
+        previous = self.states[-1].state if self.states else None
+        filtered_states = []
+        for new_state, fstate in self._numeric_states(new_states):
+            if previous is not None:
+                fstate.state = prev_weight * previous + new_weight * fstate.state
+            fstate.set_precision(self.precision)
+            previous = fstate.state
+            self.states.append(fstate)
+            new_state.state = fstate.state
+            filtered_states.append(new_state)
+        return filtered_states
+
 
 @FILTERS.register(FILTER_NAME_TIME_SMA)
 class TimeSMAFilter(Filter):
@@ -587,12 +710,20 @@ class TimeSMAFilter(Filter):
         self._time_window = window_size
         self.last_leak = None
         self.queue = deque()
+        # Sum of the areas between consecutive states of the queue
+        self._queue_sum = 0
 
     def _leak(self, left_boundary):
         """Remove timeouted elements."""
         while self.queue:
             if self.queue[0].timestamp + self._time_window <= left_boundary:
                 self.last_leak = self.queue.popleft()
+                if self.queue:
+                    self._queue_sum -= (
+                        self.queue[0].timestamp - self.last_leak.timestamp
+                    ).total_seconds() * self.last_leak.state
+                else:
+                    self._queue_sum = 0
             else:
                 return
 
@@ -600,15 +731,18 @@ class TimeSMAFilter(Filter):
         """Implement the Simple Moving Average filter."""
 
         self._leak(new_state.timestamp)
+        if self.queue:
+            last = self.queue[-1]
+            self._queue_sum += (
+                new_state.timestamp - last.timestamp
+            ).total_seconds() * last.state
         self.queue.append(copy(new_state))
 
-        moving_sum = 0
         start = new_state.timestamp - self._time_window
         prev_state = self.last_leak or self.queue[0]
-        for state in self.queue:
-            moving_sum += (state.timestamp - start).total_seconds() * prev_state.state
-            start = state.timestamp
-            prev_state = state
+        moving_sum = (
+            self.queue[0].timestamp - start
+        ).total_seconds() * prev_state.state + self._queue_sum
 
         new_state.state = moving_sum / self._time_window.total_seconds()
 
@@ -637,6 +771,22 @@ class ThrottleFilter(Filter):
 
         return new_state
 
+    def filter_states(self, new_states):
+        """Keep one state out of every window_size states of the batch."""
+        size = self.states.maxlen
+        # Number of states already seen in the current window
+        seen = len(self.states) % size if self.states else 0
+        filtered_states = []
+        for new_state, fstate in self._numeric_states(new_states):
+            if seen == 0:
+                fstate.set_precision(self.precision)
+                new_state.state = fstate.state
+                filtered_states.append(new_state)
+                self.states.clear()
+            self.states.append(fstate)
+            seen = (seen + 1) % size
+        return filtered_states
+
 
 @FILTERS.register(FILTER_NAME_TIME_THROTTLE)
 class TimeThrottleFilter(Filter):
@@ -1,6 +1,7 @@
 """Helper classes for Google Assistant integration."""
 from abc import ABC, abstractmethod
 from asyncio import gather
+from collections import Counter
 from collections.abc import Mapping
 import logging
 import pprint
@@ -97,6 +98,9 @@ class AbstractConfig(ABC):
         self._store = None
         self._google_sync_unsub = {}
         self._local_sdk_active = False
+        # Number of entity states queued, state reports sent and entity states
+        # merged into an already queued one
+        self.report_state_counters = Counter(queued=0, sent=0, coalesced=0)
 
     async def async_initialize(self):
         """Perform async initialization of config."""
@@ -14,6 +14,9 @@ from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Time to collect state changes before reporting them together
+REPORT_STATE_WINDOW = 1
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,6 +25,31 @@ _LOGGER = logging.getLogger(__name__)
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
     """Enable state reporting."""
     checker = None
+    unsub_pending = None
+    pending = {}
+    counters = google_config.report_state_counters
+
+    async def report_states(_now):
+        """Report the states collected during the window."""
+        nonlocal unsub_pending, pending
+        unsub_pending = None
+        entities, pending = pending, {}
+        counters["sent"] += 1
+        _LOGGER.debug("Reporting state for %s", list(entities))
+        await google_config.async_report_state_all({"devices": {"states": entities}})
+
+    @callback
+    def async_queue_report(entity_id, entity_data):
+        """Queue the state of an entity for the next report."""
+        nonlocal unsub_pending
+        if entity_id in pending:
+            counters["coalesced"] += 1
+        else:
+            counters["queued"] += 1
+        pending[entity_id] = entity_data
+
+        if unsub_pending is None:
+            unsub_pending = async_call_later(hass, REPORT_STATE_WINDOW, report_states)
 
     async def async_entity_state_listener(changed_entity, old_state, new_state):
         if not hass.is_running:
@@ -33,6 +61,9 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
         if not google_config.should_expose(new_state):
             return
 
+        if not checker.async_prefilter(new_state):
+            return
+
         entity = GoogleEntity(hass, google_config, new_state)
 
         if not entity.is_supported():
@@ -47,11 +78,8 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
         if not checker.async_is_significant_change(new_state, extra_arg=entity_data):
             return
 
-        _LOGGER.debug("Reporting state for %s: %s", changed_entity, entity_data)
-
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        _LOGGER.debug("Queueing state for %s: %s", changed_entity, entity_data)
+        async_queue_report(changed_entity, entity_data)
 
     @callback
     def extra_significant_check(
@@ -94,6 +122,7 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
         if not entities:
             return
 
+        counters["sent"] += 1
         await google_config.async_report_state_all({"devices": {"states": entities}})
 
         unsub = hass.helpers.event.async_track_state_change(
@@ -102,5 +131,11 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
 
     unsub = async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
 
-    # pylint: disable=unnecessary-lambda
-    return lambda: unsub()
+    @callback
+    def async_disable():
+        """Stop reporting states."""
+        unsub()
+        if unsub_pending is not None:
+            unsub_pending()
+
+    return async_disable
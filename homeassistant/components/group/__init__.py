@@ -676,6 +676,9 @@ class Group(Entity):
         self._on_off = {}
         self._assumed = {}
         self._on_states = set()
+        # Number of members that are on and that have an assumed state
+        self._on_count = 0
+        self._assumed_count = 0
 
         for entity_id in self.trackable:
             state = self.hass.states.get(entity_id)
@@ -689,7 +692,11 @@ class Group(Entity):
         domain = new_state.domain
         state = new_state.state
         registry = self.hass.data[REG_KEY]
-        self._assumed[entity_id] = new_state.attributes.get(ATTR_ASSUMED_STATE)
+        self._on_count -= bool(self._on_off.pop(entity_id, False))
+        self._assumed_count -= bool(self._assumed.pop(entity_id, None))
+        assumed = new_state.attributes.get(ATTR_ASSUMED_STATE)
+        self._assumed[entity_id] = assumed
+        self._assumed_count += bool(assumed)
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
@@ -697,12 +704,20 @@ class Group(Entity):
                 self._on_states.add(state)
             elif state in registry.off_on_mapping:
                 self._on_states.add(registry.off_on_mapping[state])
-            self._on_off[entity_id] = state in registry.on_off_mapping
+            is_on = state in registry.on_off_mapping
         else:
             entity_on_state = registry.on_states_by_domain[domain]
             if domain in self.hass.data[REG_KEY].on_states_by_domain:
                 self._on_states.update(entity_on_state)
-            self._on_off[entity_id] = state in entity_on_state
+            is_on = state in entity_on_state
+        self._on_off[entity_id] = is_on
+        self._on_count += is_on
+
+    def _mode_matches(self, count):
+        """Return if count members out of all members satisfy the group mode."""
+        if self.mode is all:
+            return count == len(self._on_off)
+        return count > 0
 
     @callback
     def _async_update_group_state(self, tr_state=None):
@@ -725,7 +740,7 @@ class Group(Entity):
             or self._assumed_state
             and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
         ):
-            self._assumed_state = self.mode(self._assumed.values())
+            self._assumed_state = self._mode_matches(self._assumed_count)
 
         elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
             self._assumed_state = True
@@ -745,7 +760,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = self._mode_matches(self._on_count)
         if group_is_on:
             self._state = on_state
         else:
@@ -1,5 +1,7 @@
 """This platform allows several cover to be grouped into one cover."""
-from typing import Dict, Optional, Set
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, List, Optional, Set
 
 import voluptuous as vol
 
@@ -38,7 +40,7 @@ from homeassistant.const import (
     STATE_OPEN,
     STATE_OPENING,
 )
-from homeassistant.core import CoreState, State
+from homeassistant.core import CoreState, State, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_state_change_event
 
@@ -51,6 +53,8 @@ KEY_OPEN_CLOSE = "open_close"
 KEY_STOP = "stop"
 KEY_POSITION = "position"
 
+MOVING_STATES = (STATE_OPEN, STATE_CLOSING, STATE_OPENING)
+
 DEFAULT_NAME = "Cover Group"
 
 
@@ -82,6 +86,9 @@ class CoverGroup(GroupEntity, CoverEntity):
         self._assumed_state = True
 
         self._entities = entities
+        self._indexes: Dict[str, int] = {}
+        for index, entity_id in enumerate(entities):
+            self._indexes.setdefault(entity_id, index)
         self._covers: Dict[str, Set[str]] = {
             KEY_OPEN_CLOSE: set(),
             KEY_STOP: set(),
@@ -92,6 +99,47 @@ class CoverGroup(GroupEntity, CoverEntity):
             KEY_STOP: set(),
             KEY_POSITION: set(),
         }
+        self._reset_member_states()
+
+    def _reset_member_states(self):
+        """Forget the member states seen so far."""
+        self._states: Dict[str, State] = {}
+        # Indexes in the entity list of the members that are open or moving
+        self._moving: List[int] = []
+        # Number of members having each position and tilt position
+        self._positions: Counter = Counter()
+        self._tilt_positions: Counter = Counter()
+        self._assumed_count = 0
+
+    @callback
+    def _update_member_state(self, entity_id: str, new_state: Optional[State]):
+        """Replace the state of a member in the aggregates."""
+        old_state = self._states.pop(entity_id, None)
+        if old_state is not None:
+            self._account_member_state(old_state, -1)
+        if new_state is not None and entity_id in self._indexes:
+            self._states[entity_id] = new_state
+            self._account_member_state(new_state, 1)
+
+    def _account_member_state(self, state: State, count: int):
+        """Add (count 1) or remove (count -1) the state of a member."""
+        attributes = state.attributes
+        if state.state in MOVING_STATES:
+            index = self._indexes[state.entity_id]
+            if count > 0:
+                insort(self._moving, index)
+            else:
+                del self._moving[bisect_left(self._moving, index)]
+
+        features = attributes.get(ATTR_SUPPORTED_FEATURES, 0)
+        if features & SUPPORT_SET_POSITION:
+            _count(self._positions, attributes.get(ATTR_CURRENT_POSITION), count)
+        if features & SUPPORT_SET_TILT_POSITION:
+            _count(
+                self._tilt_positions, attributes.get(ATTR_CURRENT_TILT_POSITION), count
+            )
+        if attributes.get(ATTR_ASSUMED_STATE):
+            self._assumed_count += count
 
     async def _update_supported_features_event(self, event):
         self.async_set_context(event.context)
@@ -106,13 +154,15 @@ class CoverGroup(GroupEntity, CoverEntity):
         update_state: bool = True,
     ) -> None:
         """Update dictionaries with supported features."""
+        self._update_member_state(entity_id, new_state)
+
         if not new_state:
             for values in self._covers.values():
                 values.discard(entity_id)
             for values in self._tilts.values():
                 values.discard(entity_id)
             if update_state:
-                await self.async_defer_or_update_ha_state()
+                self._async_defer_or_update_from_members()
             return
 
         features = new_state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
@@ -144,7 +194,16 @@ class CoverGroup(GroupEntity, CoverEntity):
             self._tilts[KEY_POSITION].discard(entity_id)
 
         if update_state:
-            await self.async_defer_or_update_ha_state()
+            self._async_defer_or_update_from_members()
+
+    @callback
+    def _async_defer_or_update_from_members(self):
+        """Update the state from the member aggregates once started."""
+        if self.hass.state != CoreState.running:
+            return
+
+        self._async_update_from_members()
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self):
         """Register listeners."""
@@ -284,60 +343,44 @@ class CoverGroup(GroupEntity, CoverEntity):
 
     async def async_update(self):
         """Update state and attributes."""
+        self._reset_member_states()
+        for entity_id in self._entities:
+            self._update_member_state(entity_id, self.hass.states.get(entity_id))
+        self._async_update_from_members()
+
+    @callback
+    def _async_update_from_members(self):
+        """Update state and attributes from the member aggregates."""
         self._assumed_state = False
 
         self._is_closed = True
         self._is_closing = False
         self._is_opening = False
-        for entity_id in self._entities:
-            state = self.hass.states.get(entity_id)
-            if not state:
-                continue
-            if state.state == STATE_OPEN:
+        if self._moving:
+            # The first member that is open or moving decides
+            state = self._states[self._entities[self._moving[0]]].state
+            if state == STATE_OPEN:
                 self._is_closed = False
-                break
-            if state.state == STATE_CLOSING:
+            elif state == STATE_CLOSING:
                 self._is_closing = True
-                break
-            if state.state == STATE_OPENING:
+            elif state == STATE_OPENING:
                 self._is_opening = True
-                break
 
         self._cover_position = None
         if self._covers[KEY_POSITION]:
-            position = -1
             self._cover_position = 0 if self.is_closed else 100
-            for entity_id in self._covers[KEY_POSITION]:
-                state = self.hass.states.get(entity_id)
-                if state is None:
-                    continue
-                pos = state.attributes.get(ATTR_CURRENT_POSITION)
-                if position == -1:
-                    position = pos
-                elif position != pos:
-                    self._assumed_state = True
-                    break
-            else:
-                if position != -1:
-                    self._cover_position = position
+            if len(self._positions) > 1:
+                self._assumed_state = True
+            elif self._positions:
+                self._cover_position = next(iter(self._positions))
 
         self._tilt_position = None
         if self._tilts[KEY_POSITION]:
-            position = -1
             self._tilt_position = 100
-            for entity_id in self._tilts[KEY_POSITION]:
-                state = self.hass.states.get(entity_id)
-                if state is None:
-                    continue
-                pos = state.attributes.get(ATTR_CURRENT_TILT_POSITION)
-                if position == -1:
-                    position = pos
-                elif position != pos:
-                    self._assumed_state = True
-                    break
-            else:
-                if position != -1:
-                    self._tilt_position = position
+            if len(self._tilt_positions) > 1:
+                self._assumed_state = True
+            elif self._tilt_positions:
+                self._tilt_position = next(iter(self._tilt_positions))
 
         supported_features = 0
         supported_features |= (
@@ -354,11 +397,12 @@ class CoverGroup(GroupEntity, CoverEntity):
         )
         self._supported_features = supported_features
 
-        if not self._assumed_state:
-            for entity_id in self._entities:
-                state = self.hass.states.get(entity_id)
-                if state is None:
-                    continue
-                if state and state.attributes.get(ATTR_ASSUMED_STATE):
-                    self._assumed_state = True
-                    break
+        if self._assumed_count:
+            self._assumed_state = True
+
+
+def _count(counter: Counter, value, count: int) -> None:
+    """Add count to the number of members having value."""
+    counter[value] += count
+    if not counter[value]:
+        del counter[value]
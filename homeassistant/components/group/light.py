@@ -1,8 +1,8 @@
 """This platform allows several lights to be grouped into one light."""
 import asyncio
 from collections import Counter
-import itertools
-from typing import Any, Callable, Iterator, List, Optional, Tuple, cast
+from fractions import Fraction
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
 
 import voluptuous as vol
 
@@ -35,7 +35,7 @@ from homeassistant.const import (
     STATE_ON,
     STATE_UNAVAILABLE,
 )
-from homeassistant.core import CoreState, State
+from homeassistant.core import CoreState, State, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.typing import ConfigType, HomeAssistantType
@@ -55,6 +55,9 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     }
 )
 
+# Attributes of the lights that are on, averaged over the group
+MEAN_ATTRIBUTES = (ATTR_BRIGHTNESS, ATTR_HS_COLOR, ATTR_WHITE_VALUE, ATTR_COLOR_TEMP)
+
 SUPPORT_GROUP_LIGHT = (
     SUPPORT_BRIGHTNESS
     | SUPPORT_COLOR_TEMP
@@ -94,6 +97,7 @@ class LightGroup(GroupEntity, light.LightEntity):
         self._effect_list: Optional[List[str]] = None
         self._effect: Optional[str] = None
         self._supported_features: int = 0
+        self._aggregates = _LightAggregates()
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
@@ -101,7 +105,13 @@ class LightGroup(GroupEntity, light.LightEntity):
         async def async_state_changed_listener(event):
             """Handle child updates."""
             self.async_set_context(event.context)
-            await self.async_defer_or_update_ha_state()
+            self._aggregates.update(
+                event.data["entity_id"], event.data.get("new_state")
+            )
+            if self.hass.state != CoreState.running:
+                return
+            self._async_update_from_aggregates()
+            self.async_write_ha_state()
 
         assert self.hass
         self.async_on_remove(
@@ -288,42 +298,43 @@ class LightGroup(GroupEntity, light.LightEntity):
 
     async def async_update(self):
         """Query all members and determine the light group state."""
-        all_states = [self.hass.states.get(x) for x in self._entity_ids]
-        states: List[State] = list(filter(None, all_states))
-        on_states = [state for state in states if state.state == STATE_ON]
+        self._aggregates = _LightAggregates()
+        for entity_id in self._entity_ids:
+            state = self.hass.states.get(entity_id)
+            if state is not None:
+                self._aggregates.update(entity_id, state)
+        self._async_update_from_aggregates()
 
-        self._is_on = len(on_states) > 0
-        self._available = any(state.state != STATE_UNAVAILABLE for state in states)
+    @callback
+    def _async_update_from_aggregates(self):
+        """Determine the light group state from the member aggregates."""
+        aggregates = self._aggregates
 
-        self._brightness = _reduce_attribute(on_states, ATTR_BRIGHTNESS)
+        self._is_on = aggregates.on_count > 0
+        self._available = aggregates.available_count > 0
 
-        self._hs_color = _reduce_attribute(on_states, ATTR_HS_COLOR, reduce=_mean_tuple)
+        self._brightness = aggregates.means[ATTR_BRIGHTNESS].value
 
-        self._white_value = _reduce_attribute(on_states, ATTR_WHITE_VALUE)
+        self._hs_color = aggregates.means[ATTR_HS_COLOR].value
 
-        self._color_temp = _reduce_attribute(on_states, ATTR_COLOR_TEMP)
-        self._min_mireds = _reduce_attribute(
-            states, ATTR_MIN_MIREDS, default=154, reduce=min
-        )
-        self._max_mireds = _reduce_attribute(
-            states, ATTR_MAX_MIREDS, default=500, reduce=max
-        )
+        self._white_value = aggregates.means[ATTR_WHITE_VALUE].value
+
+        self._color_temp = aggregates.means[ATTR_COLOR_TEMP].value
+        self._min_mireds = min(aggregates.min_mireds, default=154)
+        self._max_mireds = max(aggregates.max_mireds, default=500)
 
         self._effect_list = None
-        all_effect_lists = list(_find_state_attributes(states, ATTR_EFFECT_LIST))
-        if all_effect_lists:
+        if aggregates.effect_lists:
             # Merge all effects from all effect_lists with a union merge.
-            self._effect_list = list(set().union(*all_effect_lists))
+            self._effect_list = list(aggregates.effects_listed)
 
         self._effect = None
-        all_effects = list(_find_state_attributes(on_states, ATTR_EFFECT))
-        if all_effects:
+        if aggregates.effects:
             # Report the most common effect.
-            effects_count = Counter(itertools.chain(all_effects))
-            self._effect = effects_count.most_common(1)[0][0]
+            self._effect = self._most_common_effect()
 
         self._supported_features = 0
-        for support in _find_state_attributes(states, ATTR_SUPPORTED_FEATURES):
+        for support in aggregates.supported_features:
             # Merge supported features by emulating support for every feature
             # we find.
             self._supported_features |= support
@@ -331,41 +342,135 @@ class LightGroup(GroupEntity, light.LightEntity):
         # so that we don't break in the future when a new feature is added.
         self._supported_features &= SUPPORT_GROUP_LIGHT
 
+    def _most_common_effect(self) -> str:
+        """Return the most common effect of the lights that are on."""
+        effects = self._aggregates.effects
+        (effect, count), *others = effects.most_common()
+        if not others or others[0][1] < count:
+            return effect
 
-def _find_state_attributes(states: List[State], key: str) -> Iterator[Any]:
-    """Find attributes with matching key from states."""
-    for state in states:
-        value = state.attributes.get(key)
-        if value is not None:
-            yield value
-
-
-def _mean_int(*args):
-    """Return the mean of the supplied values."""
-    return int(sum(args) / len(args))
-
-
-def _mean_tuple(*args):
-    """Return the mean values along the columns of the supplied values."""
-    return tuple(sum(x) / len(x) for x in zip(*args))
+        # Break the tie like a full recount would, with the effect of the
+        # first member that has one of the most common effects.
+        all_states = [self.hass.states.get(x) for x in self._entity_ids]
+        on_states = [state for state in all_states if state and state.state == STATE_ON]
+        effects_count = Counter(_find_state_attributes(on_states, ATTR_EFFECT))
+        return effects_count.most_common(1)[0][0]
 
 
-def _reduce_attribute(
-    states: List[State],
-    key: str,
-    default: Optional[Any] = None,
-    reduce: Callable[..., Any] = _mean_int,
-) -> Any:
-    """Find the first attribute matching key from states.
+class _Mean:
+    """Mean of a member attribute, updated one member at a time.
 
-    If none are found, return default.
+    Scalar values are averaged to an int, tuples are averaged per column.
     """
-    attrs = list(_find_state_attributes(states, key))
 
-    if not attrs:
-        return default
+    def __init__(self) -> None:
+        """Initialize an empty mean."""
+        self._count = 0
+        self._is_tuple = False
+        # Exact sums of the values, per column for tuples
+        self._sums: List[Fraction] = []
+        # Number of members having each value
+        self._values: Counter = Counter()
+
+    def add(self, value: Any, count: int) -> None:
+        """Add (count 1) or remove (count -1) the value of a member."""
+        if not self._count:
+            self._is_tuple = isinstance(value, (list, tuple))
+        columns = value if self._is_tuple else (value,)
+        if not self._sums:
+            self._sums = [Fraction(0)] * len(columns)
+        self._sums = [
+            total + count * Fraction(column)
+            for total, column in zip(self._sums, columns)
+        ]
+        self._count += count
+        _count(self._values, tuple(value) if self._is_tuple else value, count)
+        if not self._count:
+            self._sums = []
+
+    @property
+    def value(self) -> Any:
+        """Return the mean of the values, or the value if there is only one."""
+        if not self._count:
+            return None
+
+        if self._count == 1:
+            return next(iter(self._values))
+
+        # Sum like the builtin sum would for ints, to get the same result
+        totals = [
+            total.numerator if total.denominator == 1 else float(total)
+            for total in self._sums
+        ]
+        if self._is_tuple:
+            return tuple(total / self._count for total in totals)
+        return int(totals[0] / self._count)
+
+
+class _LightAggregates:
+    """Aggregates of the member lights, updated one member at a time."""
+
+    def __init__(self) -> None:
+        """Initialize empty aggregates."""
+        self.states: Dict[str, State] = {}
+        self.on_count = 0
+        self.available_count = 0
+        self.means: Dict[str, _Mean] = {key: _Mean() for key in MEAN_ATTRIBUTES}
+        self.min_mireds: Counter = Counter()
+        self.max_mireds: Counter = Counter()
+        self.effect_lists = 0
+        self.effects_listed: Counter = Counter()
+        self.effects: Counter = Counter()
+        self.supported_features: Counter = Counter()
+
+    def update(self, entity_id: str, new_state: Optional[State]) -> None:
+        """Replace the state of a member."""
+        old_state = self.states.pop(entity_id, None)
+        if old_state is not None:
+            self._account(old_state, -1)
+        if new_state is not None:
+            self.states[entity_id] = new_state
+            self._account(new_state, 1)
+
+    def _account(self, state: State, count: int) -> None:
+        """Add (count 1) or remove (count -1) the state of a member."""
+        attributes = state.attributes
+        is_on = state.state == STATE_ON
+
+        if is_on:
+            self.on_count += count
+            for key, mean in self.means.items():
+                value = attributes.get(key)
+                if value is not None:
+                    mean.add(value, count)
+            _count(self.effects, attributes.get(ATTR_EFFECT), count)
+
+        if state.state != STATE_UNAVAILABLE:
+            self.available_count += count
+
+        _count(self.min_mireds, attributes.get(ATTR_MIN_MIREDS), count)
+        _count(self.max_mireds, attributes.get(ATTR_MAX_MIREDS), count)
+        _count(self.supported_features, attributes.get(ATTR_SUPPORTED_FEATURES), count)
+
+        effect_list = attributes.get(ATTR_EFFECT_LIST)
+        if effect_list is not None:
+            self.effect_lists += count
+            for effect in set(effect_list):
+                _count(self.effects_listed, effect, count)
+
+
+def _count(counter: Counter, value: Any, count: int) -> None:
+    """Add count to the number of times value is seen, ignoring None."""
+    if value is None:
+        return
+    counter[value] += count
+    if not counter[value]:
+        del counter[value]
 
-    if len(attrs) == 1:
-        return attrs[0]
 
-    return reduce(*attrs)
+def _find_state_attributes(states: List[State], key: str) -> Iterator[Any]:
+    """Find attributes with matching key from states."""
+    for state in states:
+        value = state.attributes.get(key)
+        if value is not None:
+            yield value
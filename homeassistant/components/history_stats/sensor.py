@@ -1,4 +1,5 @@
 """Component to make instant statistics about your history."""
+from collections import deque
 import datetime
 import logging
 import math
@@ -22,6 +23,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.reload import setup_reload_service
+from homeassistant.util.async_ import run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
 from . import DOMAIN, PLATFORMS
@@ -109,6 +111,7 @@ class HistoryStatsSensor(Entity):
         self, hass, entity_id, entity_states, start, end, duration, sensor_type, name
     ):
         """Initialize the HistoryStats sensor."""
+        self.hass = hass
         self._entity_id = entity_id
         self._entity_states = entity_states
         self._duration = duration
@@ -122,6 +125,16 @@ class HistoryStatsSensor(Entity):
         self.value = None
         self.count = None
 
+        # In memory history of the tracked entity. Holds (timestamp, matches)
+        # for each state change since _history_start, matches being True if the
+        # entity was in one of the tracked states. None until loaded.
+        self._history = None
+        self._history_start = None
+        # If the state before _history_start matched the tracked states
+        self._history_initial_state = False
+        # State changes received while the history is loaded
+        self._pending_changes = None
+
     async def async_added_to_hass(self):
         """Create listeners when the entity is added."""
 
@@ -134,10 +147,16 @@ class HistoryStatsSensor(Entity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(event):
+                """Record the state change and refresh."""
+                self._async_record_state(event.data.get("new_state"))
+                force_refresh()
+
             force_refresh()
             self.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, [self._entity_id], force_refresh
+                    self.hass, [self._entity_id], state_changed
                 )
             )
 
@@ -189,11 +208,48 @@ class HistoryStatsSensor(Entity):
 
     def update(self):
         """Get the latest data and updates the states."""
-        # Get previous values of start and end
-        p_start, p_end = self._period
-
-        # Parse templates
+        previous_period = self._period
         self.update_period()
+        period = self._period_timestamps(previous_period)
+        if period is None:
+            return
+
+        if not self._history_covers(*period):
+            self._set_history(*self._load_history(*period))
+
+        self._compute(*period)
+
+    async def async_update(self):
+        """Get the latest data and updates the states.
+
+        The history of the period is only queried from the database when it is
+        not covered by the history kept in memory, for example on the first
+        update or when the start of the period moves back in time.
+        """
+        previous_period = self._period
+        self.async_update_period()
+        period = self._period_timestamps(previous_period)
+        if period is None:
+            return
+
+        if not self._history_covers(*period):
+            self._pending_changes = []
+            history = await self.hass.async_add_executor_job(
+                self._load_history, *period
+            )
+            pending, self._pending_changes = self._pending_changes, None
+            self._set_history(*history)
+            for change in pending:
+                self._async_add_change(*change)
+
+        self._compute(*period)
+
+    def _period_timestamps(self, previous_period):
+        """Return the timestamps of the period.
+
+        Returns None if the value cannot have changed.
+        """
+        p_start, p_end = previous_period
         start, end = self._period
 
         # Convert times to UTC
@@ -217,7 +273,20 @@ class HistoryStatsSensor(Entity):
             and end_timestamp <= now_timestamp
         ):
             # Don't compute anything as the value cannot have changed
-            return
+            return None
+
+        return start_timestamp, end_timestamp, now_timestamp
+
+    def _history_covers(self, start_timestamp, end_timestamp, now_timestamp):
+        """Return if the history in memory covers the period."""
+        return self._history is not None and self._history_start <= start_timestamp
+
+    def _load_history(self, start_timestamp, end_timestamp, now_timestamp):
+        """Load the history of the period from the database."""
+        start = dt_util.utc_from_timestamp(start_timestamp)
+        # Load up to now so later periods are covered by the state changes
+        # tracked in memory
+        end = dt_util.utc_from_timestamp(max(end_timestamp, now_timestamp))
 
         # Get history between start and end
         history_list = history.state_changes_during_period(
@@ -225,19 +294,70 @@ class HistoryStatsSensor(Entity):
         )
 
         if self._entity_id not in history_list:
-            return
+            return None, None, False
 
         # Get the first state
         last_state = history.get_state(self.hass, start, self._entity_id)
         last_state = last_state is not None and last_state in self._entity_states
+
+        return (
+            start_timestamp,
+            [
+                (item.last_changed.timestamp(), item.state in self._entity_states)
+                for item in history_list.get(self._entity_id)
+            ],
+            last_state,
+        )
+
+    def _set_history(self, history_start, changes, initial_state):
+        """Replace the history in memory."""
+        self._history_start = history_start
+        self._history = deque(changes) if changes is not None else None
+        self._history_initial_state = initial_state
+
+    @callback
+    def _async_record_state(self, new_state):
+        """Add a state change of the tracked entity to the history in memory."""
+        if new_state is None:
+            return
+        change = (
+            new_state.last_changed.timestamp(),
+            new_state.state in self._entity_states,
+        )
+        if self._pending_changes is not None:
+            self._pending_changes.append(change)
+        elif self._history is not None:
+            self._async_add_change(*change)
+
+    @callback
+    def _async_add_change(self, timestamp, matches):
+        """Append a state change if it is newer than the last known one."""
+        if self._history is None:
+            return
+        if self._history and self._history[-1][0] >= timestamp:
+            # Already known, or an attribute only change
+            return
+        self._history.append((timestamp, matches))
+
+    def _compute(self, start_timestamp, end_timestamp, now_timestamp):
+        """Compute the value from the history in memory."""
+        if self._history is None:
+            return
+
+        # Drop the state changes that moved out of the period
+        while self._history and self._history[0][0] <= start_timestamp:
+            self._history_initial_state = self._history.popleft()[1]
+        self._history_start = start_timestamp
+
+        last_state = self._history_initial_state
         last_time = start_timestamp
         elapsed = 0
         count = 0
 
         # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state in self._entity_states
-            current_time = item.last_changed.timestamp()
+        for current_time, current_state in self._history:
+            if current_time > end_timestamp:
+                break
 
             if last_state:
                 elapsed += current_time - last_time
@@ -259,6 +379,11 @@ class HistoryStatsSensor(Entity):
         self.count = count
 
     def update_period(self):
+        """Parse the templates and store a datetime tuple in _period."""
+        run_callback_threadsafe(self.hass.loop, self.async_update_period).result()
+
+    @callback
+    def async_update_period(self):
         """Parse the templates and store a datetime tuple in _period."""
         start = None
         end = None
@@ -266,7 +391,7 @@ class HistoryStatsSensor(Entity):
         # Parse start
         if self._start is not None:
             try:
-                start_rendered = self._start.render()
+                start_rendered = self._start.async_render()
             except (TemplateError, TypeError) as ex:
                 HistoryStatsHelper.handle_template_exception(ex, "start")
                 return
@@ -286,7 +411,7 @@ class HistoryStatsSensor(Entity):
         # Parse end
         if self._end is not None:
             try:
-                end_rendered = self._end.render()
+                end_rendered = self._end.async_render()
             except (TemplateError, TypeError) as ex:
                 HistoryStatsHelper.handle_template_exception(ex, "end")
                 return
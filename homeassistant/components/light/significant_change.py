@@ -3,6 +3,7 @@ from typing import Any, Optional
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.significant_change import (
+    check_attributes_changed,
     check_numeric_changed,
     either_one_none,
 )
@@ -15,6 +16,17 @@ from . import (
     ATTR_WHITE_VALUE,
 )
 
+# Change of an attribute that is significant, None if any change is
+ATTRIBUTE_THRESHOLDS = {
+    ATTR_EFFECT: None,
+    # Range 0..255
+    ATTR_BRIGHTNESS: 3,
+    # Default range 153..500
+    ATTR_COLOR_TEMP: 5,
+    # Range 0..255
+    ATTR_WHITE_VALUE: 5,
+}
+
 
 @callback
 def async_check_significant_change(
@@ -29,9 +41,6 @@ def async_check_significant_change(
     if old_state != new_state:
         return True
 
-    if old_attrs.get(ATTR_EFFECT) != new_attrs.get(ATTR_EFFECT):
-        return True
-
     old_color = old_attrs.get(ATTR_HS_COLOR)
     new_color = new_attrs.get(ATTR_HS_COLOR)
 
@@ -47,25 +56,4 @@ def async_check_significant_change(
         if check_numeric_changed(old_color[1], new_color[1], 3):
             return True
 
-    if check_numeric_changed(
-        old_attrs.get(ATTR_BRIGHTNESS), new_attrs.get(ATTR_BRIGHTNESS), 3
-    ):
-        return True
-
-    if check_numeric_changed(
-        # Default range 153..500
-        old_attrs.get(ATTR_COLOR_TEMP),
-        new_attrs.get(ATTR_COLOR_TEMP),
-        5,
-    ):
-        return True
-
-    if check_numeric_changed(
-        # Range 0..255
-        old_attrs.get(ATTR_WHITE_VALUE),
-        new_attrs.get(ATTR_WHITE_VALUE),
-        5,
-    ):
-        return True
-
-    return False
+    return check_attributes_changed(old_attrs, new_attrs, ATTRIBUTE_THRESHOLDS)
@@ -10,6 +10,12 @@ from homeassistant.core import HomeAssistant, callback
 
 from . import DEVICE_CLASS_BATTERY, DEVICE_CLASS_HUMIDITY, DEVICE_CLASS_TEMPERATURE
 
+# Change of the state that is significant per device class
+DEVICE_CLASS_THRESHOLDS = {
+    DEVICE_CLASS_BATTERY: 1,
+    DEVICE_CLASS_HUMIDITY: 1,
+}
+
 
 @callback
 def async_check_significant_change(
@@ -36,10 +42,10 @@ def async_check_significant_change(
         new_value = float(new_state)
         return abs(old_value - new_value) >= change
 
-    if device_class in (DEVICE_CLASS_BATTERY, DEVICE_CLASS_HUMIDITY):
+    if device_class in DEVICE_CLASS_THRESHOLDS:
         old_value = float(old_state)
         new_value = float(new_state)
 
-        return abs(old_value - new_value) >= 1
+        return abs(old_value - new_value) >= DEVICE_CLASS_THRESHOLDS[device_class]
 
     return None
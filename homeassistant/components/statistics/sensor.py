@@ -1,7 +1,9 @@
 """Support for statistics for sensor values."""
 from collections import deque
+from fractions import Fraction
+import heapq
 import logging
-import statistics
+import math
 
 import voluptuous as vol
 
@@ -67,6 +69,161 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 )
 
 
+class RollingStatistics:
+    """Aggregates over a first in, first out window of numbers.
+
+    Values are added at the end of the window and removed from its start.
+    Adding and removing values costs O(1) for the mean, variance, total, min
+    and max, and O(log n) for the median, so the cost of an update does not
+    depend on the size of the window.
+    """
+
+    def __init__(self):
+        """Initialize an empty window."""
+        self._count = 0
+        # Sequence numbers of the next value added and removed
+        self._next_in = 0
+        self._next_out = 0
+        # Exact sums of the values and of their squares, so the results match
+        # the ones of the statistics module
+        self._sum = Fraction(0)
+        self._sum_sq = Fraction(0)
+        # Monotonic deques of (sequence, value) for the min and max
+        self._min = deque()
+        self._max = deque()
+        # Two heaps of (value, sequence) for the median. The values in the
+        # lower half are negated. Removed values are only dropped from the
+        # heaps once they reach the top.
+        self._lower = []
+        self._upper = []
+        self._lower_size = 0
+        self._upper_size = 0
+        self._in_lower = {}
+        self._removed = set()
+
+    def __len__(self):
+        """Return the number of values in the window."""
+        return self._count
+
+    def add(self, value):
+        """Add a value at the end of the window."""
+        seq = self._next_in
+        self._next_in += 1
+        self._count += 1
+
+        exact = Fraction(value)
+        self._sum += exact
+        self._sum_sq += exact * exact
+
+        while self._min and self._min[-1][1] > value:
+            self._min.pop()
+        self._min.append((seq, value))
+        while self._max and self._max[-1][1] < value:
+            self._max.pop()
+        self._max.append((seq, value))
+
+        if not self._lower_size or value <= -self._lower[0][0]:
+            heapq.heappush(self._lower, (-value, seq))
+            self._in_lower[seq] = True
+            self._lower_size += 1
+        else:
+            heapq.heappush(self._upper, (value, seq))
+            self._in_lower[seq] = False
+            self._upper_size += 1
+        self._rebalance()
+
+    def remove(self, value):
+        """Remove the value at the start of the window."""
+        seq = self._next_out
+        self._next_out += 1
+        self._count -= 1
+
+        exact = Fraction(value)
+        self._sum -= exact
+        self._sum_sq -= exact * exact
+
+        if self._min[0][0] == seq:
+            self._min.popleft()
+        if self._max[0][0] == seq:
+            self._max.popleft()
+
+        self._removed.add(seq)
+        if self._in_lower.pop(seq):
+            self._lower_size -= 1
+        else:
+            self._upper_size -= 1
+        self._rebalance()
+
+        if len(self._removed) > self._count:
+            self._compact()
+
+    @property
+    def total(self):
+        """Return the sum of the window."""
+        return float(self._sum)
+
+    @property
+    def mean(self):
+        """Return the mean of the window."""
+        return float(self._sum / self._count)
+
+    @property
+    def variance(self):
+        """Return the sample variance of the window."""
+        return float(
+            (self._sum_sq - self._sum * self._sum / self._count) / (self._count - 1)
+        )
+
+    @property
+    def min(self):
+        """Return the smallest value of the window."""
+        return self._min[0][1]
+
+    @property
+    def max(self):
+        """Return the largest value of the window."""
+        return self._max[0][1]
+
+    @property
+    def median(self):
+        """Return the median of the window."""
+        if self._lower_size > self._upper_size:
+            return -self._lower[0][0]
+        return (self._upper[0][0] - self._lower[0][0]) / 2
+
+    def _prune(self, heap):
+        """Drop removed values from the top of a heap."""
+        while heap and heap[0][1] in self._removed:
+            self._removed.discard(heapq.heappop(heap)[1])
+
+    def _rebalance(self):
+        """Keep the lower half as large or one larger than the upper half."""
+        self._prune(self._lower)
+        self._prune(self._upper)
+        if self._lower_size > self._upper_size + 1:
+            value, seq = heapq.heappop(self._lower)
+            heapq.heappush(self._upper, (-value, seq))
+            self._in_lower[seq] = False
+            self._lower_size -= 1
+            self._upper_size += 1
+            self._prune(self._lower)
+        elif self._upper_size > self._lower_size:
+            value, seq = heapq.heappop(self._upper)
+            heapq.heappush(self._lower, (-value, seq))
+            self._in_lower[seq] = True
+            self._upper_size -= 1
+            self._lower_size += 1
+            self._prune(self._upper)
+
+    def _compact(self):
+        """Rebuild the heaps without the removed values."""
+        self._lower = [item for item in self._lower if item[1] not in self._removed]
+        self._upper = [item for item in self._upper if item[1] not in self._removed]
+        heapq.heapify(self._lower)
+        heapq.heapify(self._upper)
+        self._removed.clear()
+
+
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the Statistics sensor."""
 
@@ -97,8 +254,9 @@ class StatisticsSensor(Entity):
         self._max_age = max_age
         self._precision = precision
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
-        self.ages = deque(maxlen=self._sampling_size)
+        self.states = deque()
+        self.ages = deque()
+        self._rolling = RollingStatistics()
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -149,19 +307,33 @@ class StatisticsSensor(Entity):
         if new_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
             return
 
-        try:
-            if self.is_binary:
-                self.states.append(new_state.state)
-            else:
-                self.states.append(float(new_state.state))
+        if self.is_binary:
+            value = new_state.state
+        else:
+            try:
+                value = float(new_state.state)
+            except ValueError:
+                _LOGGER.error(
+                    "%s: parsing error, expected number and received %s",
+                    self.entity_id,
+                    new_state.state,
+                )
+                return
 
-            self.ages.append(new_state.last_updated)
-        except ValueError:
-            _LOGGER.error(
-                "%s: parsing error, expected number and received %s",
-                self.entity_id,
-                new_state.state,
-            )
+        if len(self.states) == self._sampling_size:
+            self._remove_oldest()
+
+        self.states.append(value)
+        self.ages.append(new_state.last_updated)
+        if not self.is_binary:
+            self._rolling.add(value)
+
+    def _remove_oldest(self):
+        """Remove the oldest state from the queue."""
+        self.ages.popleft()
+        value = self.states.popleft()
+        if not self.is_binary:
+            self._rolling.remove(value)
 
     @property
     def name(self):
@@ -227,8 +399,7 @@ class StatisticsSensor(Entity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._remove_oldest()
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
@@ -248,24 +419,26 @@ class StatisticsSensor(Entity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            rolling = self._rolling
+            if self.count:  # require only one data point
+                self.mean = round(rolling.mean, self._precision)
+                self.median = round(rolling.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count > 1:  # require at least two data points
+                variance = rolling.variance
+                self.stdev = round(math.sqrt(variance), self._precision)
+                self.variance = round(variance, self._precision)
+            else:
+                _LOGGER.debug("%s: less than two data points", self.entity_id)
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(rolling.total, self._precision)
+                self.min = round(rolling.min, self._precision)
+                self.max = round(rolling.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -16,7 +16,9 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import config_validation as cv, entity, template
 from homeassistant.helpers.event import TrackTemplate, async_track_template_result
 from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.timeline import DATA_TIMELINE
 from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.util.executor import get_partitioned_executor
 
 from . import const, decorators, messages
 
@@ -39,6 +41,8 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
+    async_reg(hass, handle_startup_timeline)
+    async_reg(hass, handle_executor_stats)
 
 
 def pong_message(iden):
@@ -420,3 +424,43 @@ async def handle_test_condition(hass, connection, msg):
     connection.send_result(
         msg["id"], {"result": check_condition(hass, msg.get("variables"))}
     )
+
+
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "startup_timeline",
+        vol.Optional("format", default="spans"): vol.In(["spans", "chrome"]),
+    }
+)
+@decorators.require_admin
+def handle_startup_timeline(hass, connection, msg):
+    """Handle startup timeline command."""
+    timeline = hass.data.get(DATA_TIMELINE)
+
+    if timeline is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_FOUND, "Startup timeline not recorded"
+        )
+        return
+
+    if msg["format"] == "chrome":
+        connection.send_result(msg["id"], timeline.as_chrome_trace())
+    else:
+        connection.send_result(msg["id"], timeline.as_dict())
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "executor_stats"})
+@decorators.require_admin
+def handle_executor_stats(hass, connection, msg):
+    """Handle executor stats command."""
+    executor = get_partitioned_executor(hass.loop)
+
+    if executor is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_FOUND, "Executor is not partitioned"
+        )
+        return
+
+    connection.send_result(msg["id"], executor.as_dict())
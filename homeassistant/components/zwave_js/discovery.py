@@ -1,7 +1,8 @@
 """Map Z-Wave nodes and values to Home Assistant entities."""
 
 from dataclasses import dataclass
-from typing import Generator, List, Optional, Set, Union
+from functools import lru_cache
+from typing import Dict, FrozenSet, Generator, List, Optional, Set, Tuple, Union
 
 from zwave_js_server.const import CommandClass
 from zwave_js_server.model.device_class import DeviceClassItem
@@ -391,64 +392,67 @@ DISCOVERY_SCHEMAS = [
 ]
 
 
+def _build_command_class_index(
+    schemas: List[ZWaveDiscoverySchema],
+) -> Tuple[Dict[int, Tuple[int, ...]], Tuple[int, ...]]:
+    """Index the discovery schemas by the command class of their primary value.
+
+    Returns a mapping of command class to the (ordered) indexes of the schemas that
+    can match a value of that command class, and the indexes of the schemas that
+    match values of any command class.
+    """
+    by_command_class: Dict[int, List[int]] = {}
+    any_command_class: List[int] = []
+    for idx, schema in enumerate(schemas):
+        if schema.primary_value.command_class is None:
+            any_command_class.append(idx)
+            continue
+        for command_class in schema.primary_value.command_class:
+            by_command_class.setdefault(command_class, []).append(idx)
+
+    # schemas without a command class constraint are candidates for every command
+    # class, merge them in while keeping the order of DISCOVERY_SCHEMAS
+    return (
+        {
+            command_class: tuple(sorted(indexes + any_command_class))
+            for command_class, indexes in by_command_class.items()
+        },
+        tuple(any_command_class),
+    )
+
+
+SCHEMAS_BY_COMMAND_CLASS, SCHEMAS_ANY_COMMAND_CLASS = _build_command_class_index(
+    DISCOVERY_SCHEMAS
+)
+
+
 @callback
 def async_discover_values(node: ZwaveNode) -> Generator[ZwaveDiscoveryInfo, None, None]:
     """Run discovery on ZWave node and return matching (primary) values."""
+    node_schemas = async_get_node_schemas(node)
+    node_values = NodeValueIndex(node)
     for value in node.values.values():
-        for schema in DISCOVERY_SCHEMAS:
-            # check manufacturer_id
-            if (
-                schema.manufacturer_id is not None
-                and value.node.manufacturer_id not in schema.manufacturer_id
-            ):
-                continue
-            # check product_id
-            if (
-                schema.product_id is not None
-                and value.node.product_id not in schema.product_id
-            ):
-                continue
-            # check product_type
-            if (
-                schema.product_type is not None
-                and value.node.product_type not in schema.product_type
-            ):
-                continue
-            # check firmware_version
-            if (
-                schema.firmware_version is not None
-                and value.node.firmware_version not in schema.firmware_version
-            ):
-                continue
-            # check device_class_basic
-            if not check_device_class(
-                value.node.device_class.basic, schema.device_class_basic
-            ):
-                continue
-            # check device_class_generic
-            if not check_device_class(
-                value.node.device_class.generic, schema.device_class_generic
-            ):
-                continue
-            # check device_class_specific
-            if not check_device_class(
-                value.node.device_class.specific, schema.device_class_specific
-            ):
+        for idx in SCHEMAS_BY_COMMAND_CLASS.get(
+            value.command_class, SCHEMAS_ANY_COMMAND_CLASS
+        ):
+            # check the node (manufacturer, product, firmware and device class)
+            if idx not in node_schemas:
                 continue
+            schema = DISCOVERY_SCHEMAS[idx]
             # check primary value
             if not check_value(value, schema.primary_value):
                 continue
             # check additional required values
             if schema.required_values is not None:
                 if not all(
-                    any(check_value(val, val_scheme) for val in node.values.values())
+                    node_values.has_match(val_scheme)
                     for val_scheme in schema.required_values
                 ):
                     continue
             # check for values that may not be present
             if schema.absent_values is not None:
                 if any(
-                    any(check_value(val, val_scheme) for val in node.values.values())
+                    node_values.has_match(val_scheme)
                     for val_scheme in schema.absent_values
                 ):
                     continue
@@ -464,6 +468,114 @@ def async_discover_values(node: ZwaveNode) -> Generator[ZwaveDiscoveryInfo, None
                 break
 
 
+class NodeValueIndex:
+    """Lookup of the values of a node by command class.
+
+    Built once per node, so that checking required and absent values of a schema
+    only has to look at the values of the relevant command class(es).
+    """
+
+    def __init__(self, node: ZwaveNode) -> None:
+        """Index the values of a node."""
+        self._values = list(node.values.values())
+        self._by_command_class: Dict[int, List[ZwaveValue]] = {}
+        for value in self._values:
+            self._by_command_class.setdefault(value.command_class, []).append(value)
+
+    @callback
+    def has_match(self, schema: ZWaveValueDiscoverySchema) -> bool:
+        """Return if any value of the node matches the value schema."""
+        if schema.command_class is None:
+            return any(check_value(value, schema) for value in self._values)
+        return any(
+            check_value(value, schema)
+            for command_class in schema.command_class
+            for value in self._by_command_class.get(command_class, ())
+        )
+
+
+@callback
+def async_get_node_schemas(node: ZwaveNode) -> FrozenSet[int]:
+    """Return the indexes of the discovery schemas that match the node itself."""
+    device_class = node.device_class
+    return _get_node_schemas(
+        node.manufacturer_id,
+        node.product_id,
+        node.product_type,
+        node.firmware_version,
+        (device_class.basic.key, device_class.basic.label),
+        (device_class.generic.key, device_class.generic.label),
+        (device_class.specific.key, device_class.specific.label),
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_node_schemas(
+    manufacturer_id: Optional[int],
+    product_id: Optional[int],
+    product_type: Optional[int],
+    firmware_version: Optional[str],
+    device_class_basic: Tuple[int, str],
+    device_class_generic: Tuple[int, str],
+    device_class_specific: Tuple[int, str],
+) -> FrozenSet[int]:
+    """Match the discovery schemas against a node description.
+
+    Cached by device identity and device class, as a network usually contains many
+    nodes of the same kind.
+    """
+    matches = set()
+    for idx, schema in enumerate(DISCOVERY_SCHEMAS):
+        # check manufacturer_id
+        if (
+            schema.manufacturer_id is not None
+            and manufacturer_id not in schema.manufacturer_id
+        ):
+            continue
+        # check product_id
+        if schema.product_id is not None and product_id not in schema.product_id:
+            continue
+        # check product_type
+        if schema.product_type is not None and product_type not in schema.product_type:
+            continue
+        # check firmware_version
+        if (
+            schema.firmware_version is not None
+            and firmware_version not in schema.firmware_version
+        ):
+            continue
+        # check device_class_basic
+        if not _check_device_class_key(device_class_basic, schema.device_class_basic):
+            continue
+        # check device_class_generic
+        if not _check_device_class_key(
+            device_class_generic, schema.device_class_generic
+        ):
+            continue
+        # check device_class_specific
+        if not _check_device_class_key(
+            device_class_specific, schema.device_class_specific
+        ):
+            continue
+        matches.add(idx)
+    return frozenset(matches)
+
+
+def _check_device_class_key(
+    device_class: Tuple[int, str], required_value: Optional[Set[Union[str, int]]]
+) -> bool:
+    """Check if a (key, label) device class matches."""
+    if required_value is None:
+        return True
+    key, label = device_class
+    for val in required_value:
+        if isinstance(val, str) and label == val:
+            return True
+        if isinstance(val, int) and key == val:
+            return True
+    return False
+
+
 @callback
 def check_value(value: ZwaveValue, schema: ZWaveValueDiscoverySchema) -> bool:
     """Check if value matches scheme."""
@@ -490,11 +602,6 @@ def check_device_class(
     device_class: DeviceClassItem, required_value: Optional[Set[Union[str, int]]]
 ) -> bool:
     """Check if device class id or label matches."""
-    if required_value is None:
-        return True
-    for val in required_value:
-        if isinstance(val, str) and device_class.label == val:
-            return True
-        if isinstance(val, int) and device_class.key == val:
-            return True
-    return False
+    return _check_device_class_key(
+        (device_class.key, device_class.label), required_value
+    )
@@ -60,7 +60,7 @@ from homeassistant.requirements import (
 )
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
-from homeassistant.util.yaml import SECRET_YAML, Secrets, load_yaml
+from homeassistant.util.yaml import SECRET_YAML, Secrets, YamlCache, load_yaml
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -69,6 +69,8 @@ RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
+YAML_CACHE_FILE = ".yaml_cache"
+DATA_YAML_CACHE = "yaml_cache"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
 
@@ -324,12 +326,17 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> Dict:
     else:
         secrets = Secrets(Path(hass.config.config_dir))
 
+    cache = hass.data.get(DATA_YAML_CACHE)
+    if cache is None:
+        cache = hass.data[DATA_YAML_CACHE] = YamlCache()
+
     # Not using async_add_executor_job because this is an internal method.
     config = await hass.loop.run_in_executor(
         None,
         load_yaml_config_file,
         hass.config.path(YAML_CONFIG_FILE),
         secrets,
+        cache,
     )
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
@@ -337,7 +344,9 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> Dict:
 
 
 def load_yaml_config_file(
-    config_path: str, secrets: Optional[Secrets] = None
+    config_path: str,
+    secrets: Optional[Secrets] = None,
+    cache: Optional[YamlCache] = None,
 ) -> Dict[Any, Any]:
     """Parse a YAML configuration file.
 
@@ -345,7 +354,10 @@ def load_yaml_config_file(
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path, secrets)
+    conf_dict = load_yaml(config_path, secrets, cache)
+
+    if cache is not None:
+        cache.save()
 
     if not isinstance(conf_dict, dict):
         msg = (
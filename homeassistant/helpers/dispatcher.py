@@ -1,6 +1,6 @@
 """Helpers for Home Assistant dispatcher & internal component/platform."""
 import logging
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Hashable, Tuple, Union
 
 from homeassistant.core import HassJob, callback
 from homeassistant.loader import bind_hass
@@ -12,6 +12,8 @@ from .typing import HomeAssistantType
 _LOGGER = logging.getLogger(__name__)
 DATA_DISPATCHER = "dispatcher"
 
+_DispatchKey = Union[str, Tuple[str, Hashable]]
+
 
 @bind_hass
 def dispatcher_connect(
@@ -38,6 +40,32 @@ def async_dispatcher_connect(
 
     This method must be run in the event loop.
     """
+    return _async_connect(hass, signal, signal, target)
+
+
+@callback
+@bind_hass
+def async_dispatcher_connect_keyed(
+    hass: HomeAssistantType, signal: str, key: Hashable, target: Callable[..., Any]
+) -> Callable[[], None]:
+    """Connect a callable function to a signal for a single key.
+
+    Use this instead of formatting the key into the signal name when a
+    signal is sent for many different objects (e.g. one per entity).
+
+    This method must be run in the event loop.
+    """
+    return _async_connect(hass, (signal, key), signal, target)
+
+
+@callback
+def _async_connect(
+    hass: HomeAssistantType,
+    dispatch_key: _DispatchKey,
+    signal: str,
+    target: Callable[..., Any],
+) -> Callable[[], None]:
+    """Connect a callable function to a (keyed) signal."""
     if DATA_DISPATCHER not in hass.data:
         hass.data[DATA_DISPATCHER] = {}
 
@@ -53,17 +81,23 @@ def async_dispatcher_connect(
         )
     )
 
-    hass.data[DATA_DISPATCHER].setdefault(signal, []).append(job)
+    # A dict is used as an ordered set so listeners are removed in O(1)
+    hass.data[DATA_DISPATCHER].setdefault(dispatch_key, {})[job] = None
 
     @callback
     def async_remove_dispatcher() -> None:
         """Remove signal listener."""
         try:
-            hass.data[DATA_DISPATCHER][signal].remove(job)
-        except (KeyError, ValueError):
-            # KeyError is key target listener did not exist
-            # ValueError if listener did not exist within signal
+            targets = hass.data[DATA_DISPATCHER][dispatch_key]
+            del targets[job]
+        except KeyError:
+            # KeyError if signal or listener did not exist
             _LOGGER.warning("Unable to remove unknown dispatcher %s", target)
+            return
+
+        if not targets:
+            # Clean up signals without listeners
+            del hass.data[DATA_DISPATCHER][dispatch_key]
 
     return async_remove_dispatcher
 
@@ -81,7 +115,55 @@ def async_dispatcher_send(hass: HomeAssistantType, signal: str, *args: Any) -> N
 
     This method must be run in the event loop.
     """
-    target_list = hass.data.get(DATA_DISPATCHER, {}).get(signal, [])
+    _async_send(hass, signal, args)
+
+
+@bind_hass
+def dispatcher_send_keyed(
+    hass: HomeAssistantType, signal: str, key: Hashable, *args: Any
+) -> None:
+    """Send signal and data to the listeners of a single key."""
+    hass.loop.call_soon_threadsafe(
+        async_dispatcher_send_keyed, hass, signal, key, *args
+    )
+
+
+@callback
+@bind_hass
+def async_dispatcher_send_keyed(
+    hass: HomeAssistantType, signal: str, key: Hashable, *args: Any
+) -> None:
+    """Send signal and data to the listeners of a single key.
+
+    This method must be run in the event loop.
+    """
+    _async_send(hass, (signal, key), args)
+
 
-    for job in target_list:
+@callback
+def _async_send(
+    hass: HomeAssistantType, dispatch_key: _DispatchKey, args: Tuple[Any, ...]
+) -> None:
+    """Send data to the listeners of a (keyed) signal."""
+    targets = hass.data.get(DATA_DISPATCHER, {}).get(dispatch_key)
+
+    if not targets:
+        return
+
+    # Copy, listeners may disconnect while we are dispatching
+    for job in list(targets):
         hass.async_add_hass_job(job, *args)
+
+
+@callback
+@bind_hass
+def async_dispatcher_subscriber_counts(hass: HomeAssistantType) -> Dict[str, int]:
+    """Return the number of connected listeners per signal.
+
+    Listeners of keyed signals are counted towards their signal.
+    """
+    counts: Dict[str, int] = {}
+    for dispatch_key, targets in hass.data.get(DATA_DISPATCHER, {}).items():
+        signal = dispatch_key[0] if isinstance(dispatch_key, tuple) else dispatch_key
+        counts[signal] = counts.get(signal, 0) + len(targets)
+    return counts
@@ -4,9 +4,21 @@ from __future__ import annotations
 import asyncio
 from contextvars import ContextVar
 from datetime import datetime, timedelta
+import functools
 from logging import Logger
+import random
 from types import ModuleType
-from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Iterable, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
 
 from homeassistant import config_entries
 from homeassistant.const import ATTR_RESTORED, DEVICE_DEFAULT_NAME
@@ -19,6 +31,7 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import config_validation as cv, service
+from homeassistant.helpers.timeline import async_trace
 from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.util.async_ import run_callback_threadsafe
 
@@ -36,8 +49,85 @@ SLOW_ADD_MIN_TIMEOUT = 500
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_ENTITY_POLLER = "entity_poller"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# Maximum number of entity polls running at the same time over all platforms
+MAX_PARALLEL_POLLS = 32
+# Entities of a platform are spread over poll slots that each run on their own
+# offset within the scan interval. A new slot is only opened once all existing
+# slots hold this many entities.
+POLL_SLOT_SIZE = 20
+MAX_POLL_SLOTS = 10
+
+
+class EntityPoller:
+    """Run the polls of entities of all entity platforms.
+
+    Enforces a global budget of concurrent polls on top of the parallel updates
+    of each platform and keeps track of the poll latency of each entity.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the entity poller."""
+        self._semaphore = asyncio.Semaphore(MAX_PARALLEL_POLLS)
+        self.poll_statistics: Dict[str, Dict[str, Any]] = {}
+
+    async def async_poll(self, entity: Entity) -> None:
+        """Poll an entity and write its state."""
+        loop = asyncio.get_running_loop()
+        queued = loop.time()
+        async with self._semaphore:
+            started = loop.time()
+            try:
+                await entity.async_update_ha_state(True)
+            finally:
+                finished = loop.time()
+                stats = self.poll_statistics.setdefault(
+                    entity.entity_id, {"polls": 0, "overruns": 0}
+                )
+                stats["polls"] += 1
+                stats["last_wait"] = started - queued
+                stats["last_duration"] = finished - started
+
+    @callback
+    def async_record_overrun(self, entity: Entity) -> None:
+        """Record that a poll of an entity was skipped as the last one still runs."""
+        stats = self.poll_statistics.setdefault(
+            entity.entity_id, {"polls": 0, "overruns": 0}
+        )
+        stats["overruns"] += 1
+
+
+@callback
+def async_get_entity_poller(hass: HomeAssistantType) -> EntityPoller:
+    """Return the entity poller shared by all entity platforms."""
+    poller: Optional[EntityPoller] = hass.data.get(DATA_ENTITY_POLLER)
+    if poller is None:
+        poller = hass.data[DATA_ENTITY_POLLER] = EntityPoller()
+    return poller
+
+
+class _PollSlot:
+    """Group of entities of a platform that are polled together."""
+
+    def __init__(self, offset: Optional[timedelta]) -> None:
+        """Initialize the poll slot.
+
+        The offset is the delay of the first poll, None for the first slot which
+        polls at the scan interval.
+        """
+        self.offset = offset
+        self.entity_ids: Dict[str, None] = {}
+        self.unsub: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop polling the entities of the slot."""
+        if self.unsub is not None:
+            self.unsub()
+            self.unsub = None
+
 
 class EntityPlatform:
     """Manage the entities for a single platform."""
@@ -66,13 +156,16 @@ class EntityPlatform:
         self._tasks: List[asyncio.Future] = []
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
-        # Method to cancel the state change listener
-        self._async_unsub_polling: Optional[CALLBACK_TYPE] = None
+        # Poll slots of the entities of this platform
+        self._poll_slots: List[_PollSlot] = []
+        self._entity_poll_slot: Dict[str, _PollSlot] = {}
+        # Entities with a poll in progress
+        self._polls_in_progress: Set[str] = set()
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: Optional[CALLBACK_TYPE] = None
-        self._process_updates: Optional[asyncio.Lock] = None
 
         self.parallel_updates: Optional[asyncio.Semaphore] = None
+        self.parallel_updates_limit: Optional[int] = None
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -114,6 +207,7 @@ class EntityPlatform:
 
         if parallel_updates is not None:
             self.parallel_updates = asyncio.Semaphore(parallel_updates)
+            self.parallel_updates_limit = parallel_updates
 
         return self.parallel_updates
 
@@ -197,7 +291,7 @@ class EntityPlatform:
             task = async_create_setup_task()
 
             async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, self.domain):
-                await asyncio.shield(task)
+                await asyncio.shield(async_trace(hass, full_name, "platform", task))
 
             # Block till all entities are done
             while self._tasks:
@@ -314,7 +408,13 @@ class EntityPlatform:
         timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(tasks), SLOW_ADD_MIN_TIMEOUT)
         try:
             async with self.hass.timeout.async_timeout(timeout, self.domain):
-                await asyncio.gather(*tasks)
+                await async_trace(
+                    hass,
+                    f"{self.domain}.{self.platform_name}",
+                    "entities",
+                    asyncio.gather(*tasks),
+                    count=len(tasks),
+                )
         except asyncio.TimeoutError:
             self.logger.warning(
                 "Timed out adding entities for domain %s with platform %s after %ds",
@@ -330,16 +430,7 @@ class EntityPlatform:
             )
             raise
 
-        if self._async_unsub_polling is not None or not any(
-            entity.should_poll for entity in self.entities.values()
-        ):
-            return
-
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
-        )
+        self._async_start_polling()
 
     async def _async_add_entity(  # type: ignore[no-untyped-def]
         self, entity, update_before_add, entity_registry, device_registry
@@ -495,6 +586,7 @@ class EntityPlatform:
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
+        self._async_add_to_poll_slot(entity_id)
 
         if not restored:
             # Reserve the state in the state machine
@@ -504,7 +596,12 @@ class EntityPlatform:
             # has a chance to finish.
             self.hass.states.async_reserve(entity.entity_id)
 
-        entity.async_on_remove(lambda: self.entities.pop(entity_id))
+        @callback
+        def _async_remove_from_platform() -> None:
+            self.entities.pop(entity_id)
+            self._async_remove_from_poll_slot(entity_id)
+
+        entity.async_on_remove(_async_remove_from_platform)
 
         await entity.add_to_platform_finish()
 
@@ -524,9 +621,10 @@ class EntityPlatform:
 
         await asyncio.gather(*tasks)
 
-        if self._async_unsub_polling is not None:
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+        for slot in self._poll_slots:
+            slot.async_cancel()
+        self._poll_slots.clear()
+        self._entity_poll_slot.clear()
         self._setup_complete = False
 
     async def async_destroy(self) -> None:
@@ -541,12 +639,10 @@ class EntityPlatform:
         """Remove entity id from platform."""
         await self.entities[entity_id].async_remove()
 
-        # Clean up polling job if no longer needed
-        if self._async_unsub_polling is not None and not any(
-            entity.should_poll for entity in self.entities.values()
-        ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+        # Clean up polling jobs if no longer needed
+        for slot in self._poll_slots:
+            if slot.unsub is not None and not self._async_slot_polls(slot):
+                slot.async_cancel()
 
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
@@ -591,34 +687,130 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
-        """Update the states of all the polling entities.
+    @callback
+    def _async_add_to_poll_slot(self, entity_id: str) -> None:
+        """Assign an entity to a poll slot.
+
+        Entities fill up the first slot, which polls at the scan interval, before
+        new slots with a random offset within the scan interval are opened. This
+        spreads the polls of platforms with many entities over the interval.
+        """
+        slot = min(
+            self._poll_slots, key=lambda slot: len(slot.entity_ids), default=None
+        )
+
+        if slot is None or (
+            len(slot.entity_ids) >= POLL_SLOT_SIZE
+            and len(self._poll_slots) < MAX_POLL_SLOTS
+        ):
+            offset = None
+            if self._poll_slots:
+                offset = self.scan_interval * (
+                    (len(self._poll_slots) + random.random()) / MAX_POLL_SLOTS
+                )
+            slot = _PollSlot(offset)
+            self._poll_slots.append(slot)
+
+        slot.entity_ids[entity_id] = None
+        self._entity_poll_slot[entity_id] = slot
+
+    @callback
+    def _async_remove_from_poll_slot(self, entity_id: str) -> None:
+        """Remove an entity from its poll slot."""
+        slot = self._entity_poll_slot.pop(entity_id, None)
+        if slot is not None:
+            slot.entity_ids.pop(entity_id, None)
+
+    @callback
+    def _async_slot_polls(self, slot: _PollSlot) -> bool:
+        """Return if any entity of the slot should be polled."""
+        for entity_id in slot.entity_ids:
+            entity = self.entities.get(entity_id)
+            if entity is not None and entity.should_poll:
+                return True
+        return False
+
+    @callback
+    def _async_start_polling(self) -> None:
+        """Start the poll timers of the slots that have polling entities."""
+        for slot in self._poll_slots:
+            if slot.unsub is not None or not self._async_slot_polls(slot):
+                continue
+
+            if slot.offset is None:
+                slot.unsub = async_track_time_interval(
+                    self.hass,
+                    functools.partial(self._async_poll_slot, slot),
+                    self.scan_interval,
+                )
+                continue
+
+            slot.unsub = async_call_later(
+                self.hass,
+                slot.offset.total_seconds(),
+                functools.partial(self._async_start_offset_slot, slot),
+            )
+
+    @callback
+    def _async_start_offset_slot(self, slot: _PollSlot, now: datetime) -> None:
+        """Poll a slot for the first time and start polling it every interval."""
+        slot.unsub = async_track_time_interval(
+            self.hass,
+            functools.partial(self._async_poll_slot, slot),
+            self.scan_interval,
+        )
+        self.hass.async_create_task(self._async_poll_slot(slot, now))
+
+    async def _async_poll_slot(self, slot: _PollSlot, now: datetime) -> None:
+        """Update the states of the polling entities of a poll slot.
 
         To protect from flooding the executor, we will update async entities
         in parallel and other entities sequential.
 
+        An entity that is still updating from the previous interval is skipped
+        until the next interval, the other entities are updated as usual.
+
         This method must be run in the event loop.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
+        poller = async_get_entity_poller(self.hass)
+        entities = []
+        for entity_id in list(slot.entity_ids):
+            entity = self.entities.get(entity_id)
+            if entity is None or not entity.should_poll:
+                continue
+            if entity_id in self._polls_in_progress:
+                self.logger.warning(
+                    "Updating %s %s took longer than the scheduled update interval %s",
+                    self.platform_name,
+                    entity_id,
+                    self.scan_interval,
+                )
+                poller.async_record_overrun(entity)
+                continue
+            entities.append(entity)
+
+        if not entities:
             return
 
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
+        # Only start as many polls as the platform allows to run in parallel,
+        # so waiting polls of this platform don't hold on to the global budget
+        pending = iter(entities)
+
+        async def _async_poll_pending() -> None:
+            for entity in pending:
+                await self._async_poll_entity(poller, entity)
 
-            if tasks:
-                await asyncio.gather(*tasks)
+        workers = min(self.parallel_updates_limit or len(entities), len(entities))
+        await asyncio.gather(*(_async_poll_pending() for _ in range(workers)))
+
+    async def _async_poll_entity(self, poller: EntityPoller, entity: Entity) -> None:
+        """Poll a single entity."""
+        entity_id = entity.entity_id
+        self._polls_in_progress.add(entity_id)
+        try:
+            await poller.async_poll(entity)
+        finally:
+            self._polls_in_progress.discard(entity_id)
 
 
 current_platform: ContextVar[Optional[EntityPlatform]] = ContextVar(
@@ -62,6 +62,12 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TIMER_WHEEL = "timer_wheel"
+# Timers due within the same second share a bucket in the timer wheel
+TIMER_WHEEL_RESOLUTION = 1
+# Timers further in the future are kept in coarse buckets of this many seconds
+TIMER_WHEEL_HORIZON = 3600
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -275,7 +281,7 @@ def async_track_state_change_event(
             if entity_id not in entity_callbacks:
                 return
 
-            for job in entity_callbacks[entity_id][:]:
+            for job in list(entity_callbacks[entity_id]):
                 try:
                     hass.async_run_hass_job(job, event)
                 except Exception:  # pylint: disable=broad-except
@@ -292,7 +298,7 @@ def async_track_state_change_event(
     job = HassJob(action)
 
     for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(job)
+        _async_add_indexed_listener(entity_callbacks, entity_id, job)
 
     @callback
     def remove_listener() -> None:
@@ -308,11 +314,37 @@ def async_track_state_change_event(
     return remove_listener
 
 
+@callback
+def async_state_change_listener_counts(hass: HomeAssistant) -> Dict[str, int]:
+    """Return the number of state change event listeners per entity_id."""
+    return {
+        entity_id: len(jobs)
+        for entity_id, jobs in hass.data.get(TRACK_STATE_CHANGE_CALLBACKS, {}).items()
+    }
+
+
 @callback
 def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
 
 
+@callback
+def _async_add_indexed_listener(
+    callbacks: Dict[str, Dict[HassJob, None]], storage_key: str, job: HassJob
+) -> None:
+    """Add a listener to an index.
+
+    The jobs of a key are kept as the keys of a dict, which keeps them in the
+    order they were added and allows removing them in constant time.
+    """
+    jobs = callbacks.get(storage_key)
+
+    if jobs is None:
+        jobs = callbacks[storage_key] = {}
+
+    jobs[job] = None
+
+
 @callback
 def _async_remove_indexed_listeners(
     hass: HomeAssistant,
@@ -325,8 +357,11 @@ def _async_remove_indexed_listeners(
     callbacks = hass.data[data_key]
 
     for storage_key in storage_keys:
-        callbacks[storage_key].remove(job)
-        if len(callbacks[storage_key]) == 0:
+        jobs = callbacks.get(storage_key)
+        if jobs is None:
+            continue
+        jobs.pop(job, None)
+        if not jobs:
             del callbacks[storage_key]
 
     if not callbacks:
@@ -366,7 +401,7 @@ def async_track_entity_registry_updated_event(
             if entity_id not in entity_callbacks:
                 return
 
-            for job in entity_callbacks[entity_id][:]:
+            for job in list(entity_callbacks[entity_id]):
                 try:
                     hass.async_run_hass_job(job, event)
                 except Exception:  # pylint: disable=broad-except
@@ -384,7 +419,7 @@ def async_track_entity_registry_updated_event(
     job = HassJob(action)
 
     for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(job)
+        _async_add_indexed_listener(entity_callbacks, entity_id, job)
 
     @callback
     def remove_listener() -> None:
@@ -402,14 +437,14 @@ def async_track_entity_registry_updated_event(
 
 @callback
 def _async_dispatch_domain_event(
-    hass: HomeAssistant, event: Event, callbacks: Dict[str, List]
+    hass: HomeAssistant, event: Event, callbacks: Dict[str, Dict[HassJob, None]]
 ) -> None:
     domain = split_entity_id(event.data["entity_id"])[0]
 
     if domain not in callbacks and MATCH_ALL not in callbacks:
         return
 
-    listeners = callbacks.get(domain, []) + callbacks.get(MATCH_ALL, [])
+    listeners = [*callbacks.get(domain, ()), *callbacks.get(MATCH_ALL, ())]
 
     for job in listeners:
         try:
@@ -457,7 +492,7 @@ def async_track_state_added_domain(
     job = HassJob(action)
 
     for domain in domains:
-        domain_callbacks.setdefault(domain, []).append(job)
+        _async_add_indexed_listener(domain_callbacks, domain, job)
 
     @callback
     def remove_listener() -> None:
@@ -510,7 +545,7 @@ def async_track_state_removed_domain(
     job = HassJob(action)
 
     for domain in domains:
-        domain_callbacks.setdefault(domain, []).append(job)
+        _async_add_indexed_listener(domain_callbacks, domain, job)
 
     @callback
     def remove_listener() -> None:
@@ -1161,6 +1196,158 @@ def async_track_point_in_time(
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
 
 
+class _Timer:
+    """A job scheduled on the timer wheel."""
+
+    __slots__ = ("job", "point_in_time", "timestamp", "owner", "bucket", "cancelled")
+
+    def __init__(self, job: HassJob, point_in_time: datetime) -> None:
+        """Initialize the timer."""
+        self.job = job
+        self.point_in_time = point_in_time
+        self.timestamp = point_in_time.timestamp()
+        self.owner = _job_owner(job)
+        self.bucket: Optional[Tuple[int, int]] = None
+        self.cancelled = False
+
+
+def _job_owner(job: HassJob) -> str:
+    """Return the module that scheduled a job, used to group timers."""
+    target = job.target
+    while isinstance(target, ft.partial):
+        target = target.func
+    return getattr(target, "__module__", None) or "unknown"
+
+
+class TimerWheel:
+    """Hierarchical timer wheel for the time tracking helpers.
+
+    Timers are grouped into buckets by the second they are due. Each bucket has
+    at most a single handle in the event loop, timers that are due at the same
+    time run in one batch and cancelling a timer is a dictionary removal.
+
+    Timers further in the future than TIMER_WHEEL_HORIZON are kept in coarse
+    buckets spanning TIMER_WHEEL_HORIZON and are moved to the fine buckets when
+    their coarse bucket starts.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self.hass = hass
+        self._buckets: Dict[Tuple[int, int], Dict[_Timer, None]] = {}
+        self._handles: Dict[Tuple[int, int], asyncio.TimerHandle] = {}
+        self._handle_timestamps: Dict[Tuple[int, int], float] = {}
+
+    @callback
+    def async_add(self, timer: _Timer) -> None:
+        """Add a timer to the wheel."""
+        self._async_add(timer, time.time())
+
+    @callback
+    def async_remove(self, timer: _Timer) -> None:
+        """Remove a timer from the wheel."""
+        timer.cancelled = True
+        key = timer.bucket
+        if key is None:
+            return
+        timer.bucket = None
+        bucket = self._buckets[key]
+        del bucket[timer]
+        if not bucket:
+            del self._buckets[key]
+            self._handles.pop(key).cancel()
+            del self._handle_timestamps[key]
+
+    @callback
+    def async_timers_by_owner(self) -> Dict[str, int]:
+        """Return the number of active timers per owner."""
+        counts: Dict[str, int] = {}
+        for bucket in self._buckets.values():
+            for timer in bucket:
+                counts[timer.owner] = counts.get(timer.owner, 0) + 1
+        return counts
+
+    @callback
+    def _async_add(self, timer: _Timer, now: float) -> None:
+        """Add a timer to the bucket for its point in time."""
+        if timer.timestamp - now > TIMER_WHEEL_HORIZON:
+            key = (1, int(timer.timestamp // TIMER_WHEEL_HORIZON))
+            fire_at = key[1] * TIMER_WHEEL_HORIZON
+        else:
+            key = (0, int(timer.timestamp // TIMER_WHEEL_RESOLUTION))
+            fire_at = timer.timestamp
+
+        timer.bucket = key
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = {}
+        bucket[timer] = None
+
+        # Each bucket fires at the first point in time of its timers
+        if key in self._handles:
+            if self._handle_timestamps[key] <= fire_at:
+                return
+            self._handles[key].cancel()
+
+        self._handles[key] = self.hass.loop.call_later(
+            fire_at - now, self._async_fire, key
+        )
+        self._handle_timestamps[key] = fire_at
+
+    @callback
+    def _async_fire(self, key: Tuple[int, int]) -> None:
+        """Run the timers of a bucket that are due."""
+        del self._handles[key]
+        del self._handle_timestamps[key]
+        bucket = self._buckets.pop(key)
+
+        # Depending on the available clock support (including timer hardware
+        # and the OS kernel) it can happen that we fire a little bit too early
+        # as measured by utcnow(). That is bad when callbacks have assumptions
+        # about the current time. Thus, timers that are not due yet are added
+        # back for the remaining time.
+        now = time_tracker_utcnow().timestamp()
+        due = []
+        for timer in bucket:
+            timer.bucket = None
+            if timer.timestamp <= now:
+                due.append(timer)
+            else:
+                self._async_add(timer, now)
+
+        for timer in due:
+            if timer.cancelled:
+                # Cancelled by a timer that ran before it in this batch
+                continue
+            try:
+                self.hass.async_run_hass_job(timer.job, timer.point_in_time)
+            except Exception as exc:  # pylint: disable=broad-except
+                self.hass.loop.call_exception_handler(
+                    {
+                        "message": f"Exception in timer {timer.job}",
+                        "exception": exc,
+                    }
+                )
+
+
+@callback
+def _async_get_timer_wheel(hass: HomeAssistant) -> TimerWheel:
+    """Return the timer wheel of the time tracking helpers."""
+    wheel: Optional[TimerWheel] = hass.data.get(TIMER_WHEEL)
+    if wheel is None:
+        wheel = hass.data[TIMER_WHEEL] = TimerWheel(hass)
+    return wheel
+
+
+@callback
+@bind_hass
+def async_get_active_timers(hass: HomeAssistant) -> Dict[str, int]:
+    """Return the number of active time tracking timers per owner module."""
+    if TIMER_WHEEL not in hass.data:
+        return {}
+    return _async_get_timer_wheel(hass).async_timers_by_owner()
+
+
 @callback
 @bind_hass
 def async_track_point_in_utc_time(
@@ -1176,37 +1363,14 @@ def async_track_point_in_utc_time(
     # having to figure out how to call the action every time its called.
     job = action if isinstance(action, HassJob) else HassJob(action)
 
-    cancel_callback: Optional[asyncio.TimerHandle] = None
-
-    @callback
-    def run_action() -> None:
-        """Call the action."""
-        nonlocal cancel_callback
-
-        now = time_tracker_utcnow()
-
-        # Depending on the available clock support (including timer hardware
-        # and the OS kernel) it can happen that we fire a little bit too early
-        # as measured by utcnow(). That is bad when callbacks have assumptions
-        # about the current time. Thus, we rearm the timer for the remaining
-        # time.
-        delta = (utc_point_in_time - now).total_seconds()
-        if delta > 0:
-            _LOGGER.debug("Called %f seconds too early, rearming", delta)
-
-            cancel_callback = hass.loop.call_later(delta, run_action)
-            return
-
-        hass.async_run_hass_job(job, utc_point_in_time)
-
-    delta = utc_point_in_time.timestamp() - time.time()
-    cancel_callback = hass.loop.call_later(delta, run_action)
+    wheel = _async_get_timer_wheel(hass)
+    timer = _Timer(job, utc_point_in_time)
+    wheel.async_add(timer)
 
     @callback
     def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        assert cancel_callback is not None
-        cancel_callback.cancel()
+        """Cancel the timer."""
+        wheel.async_remove(timer)
 
     return unsub_point_in_time_listener
 
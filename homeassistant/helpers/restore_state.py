@@ -38,26 +38,53 @@ STATE_EXPIRATION = timedelta(days=7)
 
 
 class StoredState:
-    """Object to represent a stored state."""
+    """Object to represent a stored state.
+
+    States loaded from storage are only decoded when they are accessed.
+    """
 
     def __init__(self, state: State, last_seen: datetime) -> None:
         """Initialize a new stored state."""
-        self.state = state
-        self.last_seen = last_seen
+        self._state: Optional[State] = state
+        self._last_seen: Optional[datetime] = last_seen
+        self._json_dict: Optional[Dict] = None
+
+    @property
+    def state(self) -> State:
+        """Return the stored state."""
+        if self._state is None:
+            assert self._json_dict is not None
+            self._state = State.from_dict(self._json_dict["state"])
+        return self._state
+
+    @property
+    def last_seen(self) -> datetime:
+        """Return when the state was last seen."""
+        if self._last_seen is None:
+            assert self._json_dict is not None
+            last_seen = self._json_dict["last_seen"]
+
+            if isinstance(last_seen, str):
+                last_seen = dt_util.parse_datetime(last_seen)
+
+            self._last_seen = last_seen
+        return cast(datetime, self._last_seen)
 
     def as_dict(self) -> Dict[str, Any]:
         """Return a dict representation of the stored state."""
+        if self._state is None and self._json_dict is not None:
+            # Never decoded, store it as it was loaded
+            return {"state": self._json_dict["state"], "last_seen": self.last_seen}
         return {"state": self.state.as_dict(), "last_seen": self.last_seen}
 
     @classmethod
     def from_dict(cls, json_dict: Dict) -> StoredState:
         """Initialize a stored state from a dict."""
-        last_seen = json_dict["last_seen"]
-
-        if isinstance(last_seen, str):
-            last_seen = dt_util.parse_datetime(last_seen)
-
-        return cls(State.from_dict(json_dict["state"]), last_seen)
+        stored_state = cls.__new__(cls)
+        stored_state._state = None
+        stored_state._last_seen = None
+        stored_state._json_dict = json_dict
+        return stored_state
 
 
 class RestoreStateData:
@@ -104,7 +131,7 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store: Store = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, compact=True
         )
         self.last_states: Dict[str, StoredState] = {}
         self.entity_ids: Set[str] = set()
@@ -155,12 +182,9 @@ class RestoreStateData:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            # The stored states are converted to dicts by the encoder of the
+            # store, which runs in the executor.
+            await self.store.async_save(self.async_get_stored_states())
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
@@ -25,6 +25,13 @@ level of significance.
 The following cases will never be passed to your function:
 - if either state is unknown/unavailable
 - state adding/removing
+- if neither the state nor the attributes changed
+
+Thresholds for numeric attributes can be declared as a dictionary and checked
+with `check_attributes_changed`.
+
+The result of the integration function is cached per entity and shared by all
+checkers, so several consumers checking the same change only run it once.
 """
 from __future__ import annotations
 
@@ -38,6 +45,7 @@ from .integration_platform import async_process_integration_platforms
 
 PLATFORM = "significant_change"
 DATA_FUNCTIONS = "significant_change"
+DATA_CACHE = "significant_change_cache"
 CheckTypeFunc = Callable[
     [
         HomeAssistant,
@@ -80,6 +88,7 @@ async def _initialize(hass: HomeAssistant) -> None:
         return
 
     functions = hass.data[DATA_FUNCTIONS] = {}
+    hass.data[DATA_CACHE] = {}
 
     async def process_platform(
         hass: HomeAssistant, component_name: str, platform: Any
@@ -116,6 +125,28 @@ def check_numeric_changed(
     return False
 
 
+def check_attributes_changed(
+    old_attrs: Union[dict, MappingProxyType],
+    new_attrs: Union[dict, MappingProxyType],
+    thresholds: Dict[str, Optional[Union[int, float]]],
+) -> bool:
+    """Check if any attribute changed by at least its threshold.
+
+    A threshold of None means any change of the attribute is significant.
+    """
+    for attr, change in thresholds.items():
+        old_value = old_attrs.get(attr)
+        new_value = new_attrs.get(attr)
+
+        if change is None:
+            if old_value != new_value:
+                return True
+        elif check_numeric_changed(old_value, new_value, change):
+            return True
+
+    return False
+
+
 class SignificantlyChangedChecker:
     """Class to keep track of entities to see if they have significantly changed.
 
@@ -132,6 +163,16 @@ class SignificantlyChangedChecker:
         self.last_approved_entities: Dict[str, Tuple[State, Any]] = {}
         self.extra_significant_check = extra_significant_check
 
+    @callback
+    def async_prefilter(self, new_state: State) -> bool:
+        """Return if this could be a significant change.
+
+        Cheap check that callers can use before serializing the extra arg.
+        """
+        old_data = self.last_approved_entities.get(new_state.entity_id)
+        old_state = None if old_data is None else old_data[0]
+        return self._async_check_states(old_state, new_state) is not False
+
     @callback
     def async_is_significant_change(
         self, new_state: State, *, extra_arg: Optional[Any] = None
@@ -144,26 +185,59 @@ class SignificantlyChangedChecker:
             new_state.entity_id
         )
 
-        # First state change is always ok to report
         if old_data is None:
-            self.last_approved_entities[new_state.entity_id] = (new_state, extra_arg)
-            return True
+            old_state, old_extra_arg = None, None
+        else:
+            old_state, old_extra_arg = old_data
 
-        old_state, old_extra_arg = old_data
+        result = self._async_check_states(old_state, new_state)
 
-        # Handle state unknown or unavailable
-        if new_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            if new_state.state == old_state.state:
-                return False
+        if result is None and self.extra_significant_check is not None:
+            assert old_state is not None
+            result = self.extra_significant_check(
+                self.hass,
+                old_state.state,
+                old_state.attributes,
+                old_extra_arg,
+                new_state.state,
+                new_state.attributes,
+                extra_arg,
+            )
+
+        if result is False:
+            return False
+
+        # Result is either True or None.
+        # None means the function doesn't know. For now assume it's True
+        self.last_approved_entities[new_state.entity_id] = (
+            new_state,
+            extra_arg,
+        )
+        return True
 
-            self.last_approved_entities[new_state.entity_id] = (new_state, extra_arg)
+    @callback
+    def _async_check_states(
+        self, old_state: Optional[State], new_state: State
+    ) -> Optional[bool]:
+        """Compare the states, return None if the extra check should decide."""
+        # First state change is always ok to report
+        if old_state is None:
             return True
 
+        # Handle state unknown or unavailable
+        if new_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            return new_state.state != old_state.state
+
         # If last state was unknown/unavailable, also significant.
         if old_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            self.last_approved_entities[new_state.entity_id] = (new_state, extra_arg)
             return True
 
+        if new_state.state == old_state.state and (
+            new_state.attributes is old_state.attributes
+            or new_state.attributes == old_state.attributes
+        ):
+            return False
+
         functions: Optional[Dict[str, CheckTypeFunc]] = self.hass.data.get(
             DATA_FUNCTIONS
         )
@@ -173,36 +247,27 @@ class SignificantlyChangedChecker:
 
         check_significantly_changed = functions.get(new_state.domain)
 
-        if check_significantly_changed is not None:
-            result = check_significantly_changed(
-                self.hass,
-                old_state.state,
-                old_state.attributes,
-                new_state.state,
-                new_state.attributes,
-            )
+        if check_significantly_changed is None:
+            return None
 
-            if result is False:
-                return False
+        cache: Dict[str, Tuple[State, State, Optional[bool]]] = self.hass.data[
+            DATA_CACHE
+        ]
+        cached = cache.get(new_state.entity_id)
 
-        if self.extra_significant_check is not None:
-            result = self.extra_significant_check(
+        if cached is not None and cached[0] is old_state and cached[1] is new_state:
+            result = cached[2]
+        else:
+            result = check_significantly_changed(
                 self.hass,
                 old_state.state,
                 old_state.attributes,
-                old_extra_arg,
                 new_state.state,
                 new_state.attributes,
-                extra_arg,
             )
+            cache[new_state.entity_id] = (old_state, new_state, result)
 
-            if result is False:
-                return False
+        if result is False:
+            return False
 
-        # Result is either True or None.
-        # None means the function doesn't know. For now assume it's True
-        self.last_approved_entities[new_state.entity_id] = (
-            new_state,
-            extra_arg,
-        )
-        return True
+        return None
@@ -1,9 +1,11 @@
 """Helper to help store data."""
 import asyncio
+import json
 from json import JSONEncoder
 import logging
 import os
 from typing import Any, Callable, Dict, List, Optional, Type, Union
+import uuid
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
@@ -17,6 +19,14 @@ from homeassistant.util import json as json_util
 STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
+# Number of journal entries after which a journaled store is rewritten in full
+JOURNAL_MAX_ENTRIES = 100
+
+# How deep into the data changes are tracked by a journaled store
+JOURNAL_DEPTH = 2
+
+_MISSING = object()
+
 
 @bind_hass
 async def async_migrator(
@@ -72,8 +82,15 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        compact: bool = False,
+        journal: bool = False,
     ):
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Compact stores are written without indentation. Journaled stores are
+        compact and append the changes since the last write to a journal file,
+        which is merged into the store file every JOURNAL_MAX_ENTRIES writes.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -84,12 +101,22 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: Optional[asyncio.Future] = None
         self._encoder = encoder
+        self._compact = compact or journal
+        self._journal = journal
+        self._journal_id: Optional[str] = None
+        self._journal_entries = 0
+        self._journal_snapshot: Any = None
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self):
+        """Return the path of the journal."""
+        return f"{self.path}.journal"
+
     async def async_load(self) -> Union[Dict, List, None]:
         """Load data.
 
@@ -121,9 +148,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data)
 
             if data == {}:
                 return None
@@ -224,13 +249,111 @@ class Store:
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    def _load_data(self) -> Dict:
+        """Load the data and apply the journal."""
+        data = json_util.load_json(self.path)
+
+        journal_id = data.pop("journal", None)
+
+        if journal_id is None or not self._journal:
+            return data
+
+        try:
+            with open(self.journal_path, encoding="utf-8") as fdesc:
+                lines = fdesc.readlines()
+        except FileNotFoundError:
+            return data
+
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Write was interrupted
+                break
+
+            # Left over from before the store was last rewritten
+            if entry["journal"] != journal_id:
+                continue
+
+            data["data"] = _apply_journal_ops(data["data"], entry["ops"])
+
+        return data
+
     def _write_data(self, path: str, data: Dict) -> None:
         """Write the data."""
         if not os.path.isdir(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
+        if self._journal:
+            self._write_journaled_data(path, data)
+            return
+
+        _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        json_util.save_json(
+            path, data, self._private, encoder=self._encoder, compact=self._compact
+        )
+
+    def _write_journaled_data(self, path: str, data: Dict) -> None:
+        """Write the changes to the journal, or the full data if due."""
+        dump = (self._encoder or JSONEncoder)(separators=(",", ":")).encode
+
+        try:
+            snapshot = _snapshot(data["data"], JOURNAL_DEPTH, dump)
+        except TypeError:
+            # save_json raises a SerializationError pointing at the bad data
+            json_util.save_json(path, data, encoder=self._encoder)
+            raise
+
+        if (
+            self._journal_snapshot is not None
+            and self._journal_entries < JOURNAL_MAX_ENTRIES
+        ):
+            ops: List[str] = []
+            _diff(self._journal_snapshot, snapshot, data["data"], [], ops, dump)
+            self._journal_snapshot = snapshot
+
+            if not ops:
+                return
+
+            _LOGGER.debug("Writing journal for %s to %s", self.key, path)
+            self._append_journal(
+                f'{{"journal":{json.dumps(self._journal_id)},"ops":[{",".join(ops)}]}}\n'
+            )
+            self._journal_entries += 1
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        self._journal_id = uuid.uuid4().hex
+        json_util.save_json(
+            path,
+            {**data, "journal": self._journal_id},
+            self._private,
+            encoder=self._encoder,
+            compact=True,
+        )
+        self._journal_snapshot = snapshot
+        self._journal_entries = 0
+
+        try:
+            os.unlink(self.journal_path)
+        except FileNotFoundError:
+            pass
+
+    def _append_journal(self, line: str) -> None:
+        """Append a line to the journal."""
+        try:
+            fd = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            with open(fd, "w", encoding="utf-8") as fdesc:
+                fdesc.write(line)
+        except OSError as error:
+            _LOGGER.exception("Saving journal failed: %s", self.journal_path)
+            # Start over with a full write
+            self._journal_snapshot = None
+            raise json_util.WriteError(error) from error
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -245,3 +368,97 @@ class Store:
             await self.hass.async_add_executor_job(os.unlink, self.path)
         except FileNotFoundError:
             pass
+
+        if self._journal:
+            self._journal_snapshot = None
+
+            try:
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+            except FileNotFoundError:
+                pass
+
+
+def _snapshot(value: Any, depth: int, dump: Callable[[Any], str]) -> Any:
+    """Serialize the leaves of the data down to the given depth."""
+    if depth and isinstance(value, dict):
+        return {key: _snapshot(val, depth - 1, dump) for key, val in value.items()}
+    if depth and isinstance(value, list):
+        return [_snapshot(val, depth - 1, dump) for val in value]
+    return dump(value)
+
+
+def _diff(
+    old: Any,
+    new: Any,
+    value: Any,
+    path: List[Union[str, int]],
+    ops: List[str],
+    dump: Callable[[Any], str],
+) -> None:
+    """Add the journal operations that turn the old into the new snapshot."""
+    if isinstance(new, str):
+        if old != new:
+            ops.append(f'{{"p":{json.dumps(path)},"v":{new}}}')
+        return
+
+    if type(old) is not type(new):
+        ops.append(f'{{"p":{json.dumps(path)},"v":{dump(value)}}}')
+        return
+
+    if isinstance(new, dict):
+        for key in old.keys() - new.keys():
+            ops.append(f'{{"p":{json.dumps([*path, key])}}}')
+
+        for key, new_item in new.items():
+            _diff(
+                old.get(key, _MISSING),
+                new_item,
+                value[key],
+                [*path, key],
+                ops,
+                dump,
+            )
+        return
+
+    if len(new) < len(old):
+        ops.append(f'{{"p":{json.dumps(path)},"n":{len(new)}}}')
+
+    for idx, new_item in enumerate(new):
+        _diff(
+            old[idx] if idx < len(old) else _MISSING,
+            new_item,
+            value[idx],
+            [*path, idx],
+            ops,
+            dump,
+        )
+
+
+def _apply_journal_ops(data: Any, ops: List[Dict[str, Any]]) -> Any:
+    """Apply the operations of a journal entry to the data."""
+    for op in ops:
+        path = op["p"]
+
+        if "n" in op:
+            items = data
+            for key in path:
+                items = items[key]
+            del items[op["n"] :]
+            continue
+
+        if not path:
+            data = op["v"]
+            continue
+
+        parent = data
+        for key in path[:-1]:
+            parent = parent[key]
+
+        if "v" not in op:
+            del parent[path[-1]]
+        elif isinstance(parent, list) and path[-1] == len(parent):
+            parent.append(op["v"])
+        else:
+            parent[path[-1]] = op["v"]
+
+    return data
@@ -0,0 +1,291 @@
+"""Record a timeline of the startup of Home Assistant.
+
+The timeline consists of nested spans. Awaitables are traced with
+async_trace, which drives them step by step so that it knows how much time
+they spent on the event loop. Synchronous code is traced with trace_block.
+Nesting follows the context, so spans started in a task created while
+another span is active are children of that span.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import threading
+from time import perf_counter, thread_time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DATA_TIMELINE = "timeline"
+
+# Spans that ran this long without yielding blocked the event loop
+BLOCKING_THRESHOLD = 0.1
+
+# Categories of spans for which the integration is responsible
+BLOCKING_CATEGORIES = {"import", "setup", "platform", "entities"}
+
+_CURRENT_SPAN: ContextVar[Optional[Span]] = ContextVar("timeline_span", default=None)
+
+
+class Span:
+    """A timed part of the startup."""
+
+    __slots__ = (
+        "span_id",
+        "name",
+        "category",
+        "args",
+        "parent",
+        "start",
+        "end",
+        "cpu",
+        "blocked",
+    )
+
+    def __init__(
+        self,
+        span_id: int,
+        name: str,
+        category: str,
+        args: Dict[str, Any],
+        parent: Optional[Span],
+    ) -> None:
+        """Initialize the span."""
+        self.span_id = span_id
+        self.name = name
+        self.category = category
+        self.args = args
+        self.parent = parent
+        self.start = perf_counter()
+        self.end: Optional[float] = None
+        # CPU time spent on the event loop
+        self.cpu = 0.0
+        # Longest time the event loop was blocked by a single step
+        self.blocked = 0.0
+
+    @property
+    def duration(self) -> float:
+        """Return the wall time of the span so far."""
+        return (perf_counter() if self.end is None else self.end) - self.start
+
+    def add_step(self, duration: float, cpu: float) -> None:
+        """Record a step that ran on the event loop."""
+        self.cpu += cpu
+        if duration > self.blocked:
+            self.blocked = duration
+
+
+class Timeline:
+    """Collect the spans of a startup."""
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self.start = perf_counter()
+        self.end: Optional[float] = None
+        self.spans: List[Span] = []
+        self.loop_thread = threading.get_ident()
+
+    @property
+    def finished(self) -> bool:
+        """Return if the timeline no longer records spans."""
+        return self.end is not None
+
+    def async_finish(self) -> None:
+        """Stop recording spans."""
+        if self.end is None:
+            self.end = perf_counter()
+
+    def async_start_span(self, name: str, category: str, args: Dict[str, Any]) -> Span:
+        """Start a span as child of the current span."""
+        span = Span(len(self.spans), name, category, args, _CURRENT_SPAN.get())
+        self.spans.append(span)
+        return span
+
+    def async_end_span(self, span: Span) -> None:
+        """End a span and warn if it blocked the event loop."""
+        span.end = perf_counter()
+        if span.category in BLOCKING_CATEGORIES and span.blocked >= BLOCKING_THRESHOLD:
+            _LOGGER.warning(
+                "%s of %s blocked the event loop for %.2f seconds",
+                span.category.capitalize(),
+                span.name,
+                span.blocked,
+            )
+
+    def blocking(self) -> List[Span]:
+        """Return the spans that blocked the event loop, longest first."""
+        return sorted(
+            (
+                span
+                for span in self.spans
+                if span.category in BLOCKING_CATEGORIES
+                and span.blocked >= BLOCKING_THRESHOLD
+            ),
+            key=lambda span: span.blocked,
+            reverse=True,
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the timeline as a dictionary."""
+        end = perf_counter() if self.end is None else self.end
+        return {
+            "duration": end - self.start,
+            "finished": self.finished,
+            "spans": [
+                {
+                    "id": span.span_id,
+                    "parent": span.parent and span.parent.span_id,
+                    "name": span.name,
+                    "category": span.category,
+                    "args": span.args,
+                    "start": span.start - self.start,
+                    "duration": span.duration,
+                    "cpu": span.cpu,
+                    "blocked": span.blocked,
+                }
+                for span in self.spans
+            ],
+        }
+
+    def as_chrome_trace(self) -> Dict[str, Any]:
+        """Return the timeline in the Chrome trace event format.
+
+        The trace viewer only nests events of the same thread, so concurrent
+        spans are spread over as many lanes as needed.
+        """
+        lanes: List[List[float]] = []
+        events = []
+
+        for span in sorted(self.spans, key=lambda span: (span.start, -span.duration)):
+            end = span.start + span.duration
+            for lane, ends in enumerate(lanes):
+                while ends and ends[-1] <= span.start:
+                    ends.pop()
+                if not ends or ends[-1] >= end:
+                    break
+            else:
+                lane = len(lanes)
+                ends = []
+                lanes.append(ends)
+            ends.append(end)
+
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": lane,
+                    "ts": round((span.start - self.start) * 1e6),
+                    "dur": round(span.duration * 1e6),
+                    "args": {
+                        **span.args,
+                        "cpu_ms": round(span.cpu * 1e3, 3),
+                        "blocked_ms": round(span.blocked * 1e3, 3),
+                    },
+                }
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+class _TracedAwaitable:
+    """Await an awaitable inside a span, timing each step it runs."""
+
+    __slots__ = ("_timeline", "_span_args", "_target")
+
+    def __init__(
+        self,
+        timeline: Timeline,
+        span_args: tuple,
+        target: Awaitable,
+    ) -> None:
+        """Initialize the traced awaitable."""
+        self._timeline = timeline
+        self._span_args = span_args
+        self._target = target
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        """Drive the target and record the steps in the span."""
+        timeline = self._timeline
+        span = timeline.async_start_span(*self._span_args)
+        previous = _CURRENT_SPAN.get()
+        _CURRENT_SPAN.set(span)
+        iterator = self._target.__await__()
+        value: Any = None
+        error: Optional[BaseException] = None
+
+        try:
+            while True:
+                start = perf_counter()
+                cpu = thread_time()
+                try:
+                    if error is None:
+                        future = iterator.send(value)
+                    else:
+                        future = iterator.throw(error)  # type: ignore
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    span.add_step(perf_counter() - start, thread_time() - cpu)
+
+                value = error = None
+                try:
+                    value = yield future
+                except GeneratorExit:
+                    iterator.close()  # type: ignore
+                    raise
+                except BaseException as err:  # pylint: disable=broad-except
+                    error = err
+        finally:
+            timeline.async_end_span(span)
+            _CURRENT_SPAN.set(previous)
+
+
+async def async_trace(
+    hass: HomeAssistant, name: str, category: str, target: Awaitable[T], **args: Any
+) -> T:
+    """Await target inside a span if the startup is being recorded."""
+    timeline: Optional[Timeline] = hass.data.get(DATA_TIMELINE)
+    if timeline is None or timeline.finished:
+        return await target
+    return await _TracedAwaitable(timeline, (name, category, args), target)
+
+
+@contextmanager
+def trace_block(
+    hass: HomeAssistant, name: str, category: str, **args: Any
+) -> Iterator[Optional[Span]]:
+    """Trace a block of synchronous code if the startup is being recorded."""
+    timeline: Optional[Timeline] = hass.data.get(DATA_TIMELINE)
+    if timeline is None or timeline.finished:
+        yield None
+        return
+
+    span = timeline.async_start_span(name, category, args)
+    previous = _CURRENT_SPAN.get()
+    _CURRENT_SPAN.set(span)
+    cpu = thread_time()
+    try:
+        yield span
+    finally:
+        _CURRENT_SPAN.set(previous)
+        if threading.get_ident() == timeline.loop_thread:
+            span.add_step(perf_counter() - span.start, thread_time() - cpu)
+        timeline.async_end_span(span)
@@ -31,9 +31,16 @@ from typing import (
 from awesomeversion import AwesomeVersion, AwesomeVersionStrategy
 
 from homeassistant.generated.dhcp import DHCP
+from homeassistant.generated.manifests import MANIFESTS
 from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
 from homeassistant.generated.zeroconf import HOMEKIT, ZEROCONF
+from homeassistant.helpers.timeline import async_trace, trace_block
+from homeassistant.util.executor import (
+    CORE_DOMAIN,
+    PARTITION_DEFAULT,
+    PARTITION_NETWORK,
+)
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -74,6 +81,9 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+STORAGE_KEY = "core.custom_components"
+STORAGE_VERSION = 1
+
 
 class Manifest(TypedDict, total=False):
     """
@@ -93,6 +103,7 @@ class Manifest(TypedDict, total=False):
     documentation: str
     issue_tracker: str
     quality_scale: str
+    executor: str
     mqtt: List[str]
     ssdp: List[Dict[str, str]]
     zeroconf: List[Union[str, Dict[str, str]]]
@@ -114,6 +125,77 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+def get_executor_partition(domain: str) -> str:
+    """Return the executor partition for the jobs of an integration.
+
+    Integrations can pick a partition in their manifest. Integrations with
+    requirements and custom integrations talk to devices and services, so
+    they default to the partition for blocking network I/O.
+    """
+    if domain == CORE_DOMAIN:
+        return PARTITION_DEFAULT
+
+    manifest = MANIFESTS.get(domain)
+    if manifest is None:
+        return PARTITION_NETWORK
+
+    if "executor" in manifest:
+        return cast(str, manifest["executor"])
+
+    return PARTITION_NETWORK if manifest.get("requirements") else PARTITION_DEFAULT
+
+
+def _scan_custom_components(paths: List[str], cached: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the manifest index of the custom components in paths.
+
+    Directory listings and manifests are only read again when their mtime
+    differs from the one recorded in the cached index.
+    """
+    cached_dirs = cached.get("dirs", {})
+    cached_manifests = cached.get("manifests", {})
+    dirs: Dict[str, Any] = {}
+    manifests: Dict[str, Any] = {}
+
+    for path in paths:
+        base = pathlib.Path(path)
+        mtime = base.stat().st_mtime_ns
+        cached_dir = cached_dirs.get(path)
+
+        if cached_dir is not None and cached_dir[0] == mtime:
+            names = cached_dir[1]
+        else:
+            names = sorted(entry.name for entry in base.iterdir() if entry.is_dir())
+
+        dirs[path] = [mtime, names]
+
+        for name in names:
+            manifest_path = base / name / "manifest.json"
+            key = str(manifest_path)
+
+            try:
+                mtime = manifest_path.stat().st_mtime_ns
+            except OSError:
+                continue
+
+            cached_manifest = cached_manifests.get(key)
+
+            if cached_manifest is not None and cached_manifest[0] == mtime:
+                manifests[key] = cached_manifest
+                continue
+
+            try:
+                manifest = json.loads(manifest_path.read_text())
+            except ValueError as err:
+                _LOGGER.error(
+                    "Error parsing manifest.json file at %s: %s", manifest_path, err
+                )
+                continue
+
+            manifests[key] = [mtime, manifest]
+
+    return {"dirs": dirs, "manifests": manifests}
+
+
 async def _async_get_custom_components(
     hass: "HomeAssistant",
 ) -> Dict[str, Integration]:
@@ -126,33 +208,39 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: List[str]) -> List[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.storage import Store
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+    store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    cached = await store.async_load() or {}
+    index = await hass.async_add_executor_job(
+        _scan_custom_components, list(custom_components.__path__), cached
     )
 
-    integrations = await asyncio.gather(
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
+    if index != cached:
+        store.async_delay_save(lambda: index)
+
+    integrations: Dict[str, Integration] = {}
+    seen: Set[str] = set()
+
+    for path, (_, names) in index["dirs"].items():
+        for name in names:
+            manifest_path = pathlib.Path(path) / name / "manifest.json"
+            entry = index["manifests"].get(str(manifest_path))
+
+            if name in seen or entry is None:
+                continue
+
+            seen.add(name)
+            integration = Integration(
+                hass,
+                f"{PACKAGE_CUSTOM_COMPONENTS}.{name}",
+                manifest_path.parent,
+                dict(entry[1]),
             )
-            for comp in dirs
-        )
-    )
+            integrations[integration.domain] = integration
 
-    return {
-        integration.domain: integration
-        for integration in integrations
-        if integration is not None
-    }
+    return integrations
 
 
 async def async_get_custom_components(
@@ -164,7 +252,9 @@ async def async_get_custom_components(
     if reg_or_evt is None:
         evt = hass.data[DATA_CUSTOM_COMPONENTS] = asyncio.Event()
 
-        reg = await _async_get_custom_components(hass)
+        reg = await async_trace(
+            hass, "custom_components", "loader", _async_get_custom_components(hass)
+        )
 
         hass.data[DATA_CUSTOM_COMPONENTS] = reg
         evt.set()
@@ -311,6 +401,25 @@ class Integration:
 
         return None
 
+    @classmethod
+    def resolve_from_index(
+        cls, hass: "HomeAssistant", domain: str
+    ) -> Optional[Integration]:
+        """Resolve a built-in integration from the generated manifest index."""
+        manifest = MANIFESTS.get(domain)
+
+        if manifest is None:
+            return None
+
+        from homeassistant import components  # pylint: disable=import-outside-toplevel
+
+        return cls(
+            hass,
+            f"{PACKAGE_BUILTIN}.{domain}",
+            pathlib.Path(components.__file__).parent / domain,
+            cast(Manifest, dict(manifest)),
+        )
+
     @classmethod
     def resolve_legacy(
         cls, hass: "HomeAssistant", domain: str
@@ -488,7 +597,8 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            with trace_block(self.hass, self.domain, "import"):
+                cache[self.domain] = importlib.import_module(self.pkg_path)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -496,7 +606,8 @@ class Integration:
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name not in cache:
-            cache[full_name] = self._import_platform(platform_name)
+            with trace_block(self.hass, full_name, "import"):
+                cache[full_name] = self._import_platform(platform_name)
         return cache[full_name]  # type: ignore
 
     def _import_platform(self, platform_name: str) -> ModuleType:
@@ -542,11 +653,20 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
         event.set()
         return integration
 
-    from homeassistant import components  # pylint: disable=import-outside-toplevel
+    integration = Integration.resolve_from_index(hass, domain)
 
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    if integration is None:
+        # pylint: disable=import-outside-toplevel
+        from homeassistant import components
+
+        integration = await async_trace(
+            hass,
+            domain,
+            "resolve",
+            hass.async_add_executor_job(
+                Integration.resolve_from_root, hass, components, domain
+            ),
+        )
 
     if integration is not None:
         cache[domain] = integration
@@ -1,10 +1,13 @@
 """Module to handle installing requirements."""
 import asyncio
 import os
+import sys
+from time import monotonic
 from typing import Any, Dict, Iterable, List, Optional, Set, Union, cast
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.loader import Integration, IntegrationNotFound, async_get_integration
 import homeassistant.util.package as pkg_util
@@ -14,6 +17,9 @@ import homeassistant.util.package as pkg_util
 DATA_PIP_LOCK = "pip_lock"
 DATA_PKG_CACHE = "pkg_cache"
 DATA_INTEGRATIONS_WITH_REQS = "integrations_with_reqs"
+DATA_REQUIREMENTS_TIME = "requirements_time"
+STORAGE_KEY = "core.installed_packages"
+STORAGE_VERSION = 1
 CONSTRAINT_FILE = "package_constraints.txt"
 DISCOVERY_INTEGRATIONS: Dict[str, Iterable[str]] = {
     "dhcp": ("dhcp",),
@@ -107,6 +113,51 @@ async def async_get_integration_with_requirements(
     return integration
 
 
+def _path_mtimes() -> Dict[str, int]:
+    """Return the mtimes of the directories on the Python path."""
+    mtimes = {}
+    for path in sys.path:
+        try:
+            mtimes[path] = os.stat(path or ".").st_mtime_ns
+        except OSError:
+            continue
+    return mtimes
+
+
+def _installed_packages(stored: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the installed packages, reusing the stored snapshot if valid."""
+    mtimes = _path_mtimes()
+    if stored is not None and stored["mtimes"] == mtimes:
+        return stored
+    return {"mtimes": mtimes, "packages": pkg_util.installed_packages()}
+
+
+async def _async_load_installed_packages(hass: HomeAssistant) -> Dict[str, str]:
+    """Load the snapshot of installed packages.
+
+    The snapshot is stored and only rebuilt when a directory on the Python
+    path changed, like site-packages after installing a package.
+    """
+    store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    stored = await store.async_load()
+    snapshot = await hass.async_add_executor_job(_installed_packages, stored)
+
+    if snapshot is not stored:
+        store.async_delay_save(lambda: snapshot)
+
+    return cast(Dict[str, str], snapshot["packages"])
+
+
+async def async_get_installed_packages(hass: HomeAssistant) -> Dict[str, str]:
+    """Return the versions of the installed packages by normalized name."""
+    task = hass.data.get(DATA_PKG_CACHE)
+    if task is None:
+        task = hass.data[DATA_PKG_CACHE] = hass.async_create_task(
+            _async_load_installed_packages(hass)
+        )
+    return cast(Dict[str, str], await task)
+
+
 async def async_process_requirements(
     hass: HomeAssistant, name: str, requirements: List[str]
 ) -> None:
@@ -122,18 +173,38 @@ async def async_process_requirements(
     kwargs = pip_kwargs(hass.config.config_dir)
 
     async with pip_lock:
-        for req in requirements:
-            if pkg_util.is_installed(req):
-                continue
+        start = monotonic()
+        try:
+            await _async_process_requirements(hass, name, requirements, kwargs)
+        finally:
+            hass.data[DATA_REQUIREMENTS_TIME] = (
+                hass.data.get(DATA_REQUIREMENTS_TIME, 0) + monotonic() - start
+            )
+
+
+async def _async_process_requirements(
+    hass: HomeAssistant, name: str, requirements: List[str], kwargs: Dict[str, Any]
+) -> None:
+    """Install the requirements that are not installed yet."""
+    installed = await async_get_installed_packages(hass)
+
+    for req in requirements:
+        if pkg_util.is_installed(req, installed):
+            continue
+
+        def _install(req: str, kwargs: Dict[str, Any]) -> bool:
+            """Install requirement."""
+            return pkg_util.install_package(req, **kwargs)
+
+        ret = await hass.async_add_executor_job(_install, req, kwargs)
 
-            def _install(req: str, kwargs: Dict[str, Any]) -> bool:
-                """Install requirement."""
-                return pkg_util.install_package(req, **kwargs)
+        # Take a new snapshot when the next requirement is checked
+        hass.data.pop(DATA_PKG_CACHE, None)
 
-            ret = await hass.async_add_executor_job(_install, req, kwargs)
+        if not ret:
+            raise RequirementsNotFound(name, [req])
 
-            if not ret:
-                raise RequirementsNotFound(name, [req])
+        installed = await async_get_installed_packages(hass)
 
 
 def pip_kwargs(config_dir: Optional[str]) -> Dict[str, Any]:
@@ -1,13 +1,13 @@
 """Run Home Assistant."""
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import dataclasses
 import logging
 from typing import Any, Dict, Optional
 
-from homeassistant import bootstrap
+from homeassistant import bootstrap, loader
 from homeassistant.core import callback
 from homeassistant.helpers.frame import warn_use
+from homeassistant.util.executor import PartitionedExecutor
 
 # mypy: disallow-any-generics
 
@@ -21,6 +21,10 @@ from homeassistant.helpers.frame import warn_use
 # updating so this number should be higher than the default
 # use case.
 #
+# Jobs of integrations that do blocking network, database or filesystem I/O
+# or heavy computations run in separate, smaller pools, so a few hanging
+# integrations cannot starve all others. See homeassistant.util.executor.
+#
 MAX_EXECUTOR_WORKERS = 64
 
 
@@ -31,6 +35,8 @@ class RuntimeConfig:
     config_dir: str
     skip_pip: bool = False
     safe_mode: bool = False
+    yaml_cache: bool = False
+    trace_startup: bool = False
 
     verbose: bool = False
 
@@ -62,8 +68,8 @@ class HassEventLoopPolicy(asyncio.DefaultEventLoopPolicy):  # type: ignore[valid
         if self.debug:
             loop.set_debug(True)
 
-        executor = ThreadPoolExecutor(
-            thread_name_prefix="SyncWorker", max_workers=MAX_EXECUTOR_WORKERS
+        executor = PartitionedExecutor(
+            MAX_EXECUTOR_WORKERS, loader.get_executor_partition
         )
         loop.set_default_executor(executor)
         loop.set_default_executor = warn_use(  # type: ignore
@@ -6,14 +6,22 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+import pathlib
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import Callable, Dict, TypeVar
 
-from homeassistant import core
+from homeassistant import bootstrap, core
 from homeassistant.components.websocket_api.const import JSON_DUMP
-from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.const import (
+    ATTR_NOW,
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -388,6 +396,204 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def zwave_js_discovery(hass):
+    """Run Z-Wave JS discovery over a network of 150 nodes with 120 values each."""
+    # pylint: disable=import-outside-toplevel
+    from zwave_js_server.const import CommandClass
+    from zwave_js_server.model.node import Node
+
+    from homeassistant.components.zwave_js.discovery import async_discover_values
+
+    value_templates = [
+        (CommandClass.SWITCH_MULTILEVEL, "currentValue", "number"),
+        (CommandClass.SWITCH_MULTILEVEL, "targetValue", "number"),
+        (CommandClass.SENSOR_MULTILEVEL, "Air temperature", "number"),
+        (CommandClass.SENSOR_BINARY, "Any", "boolean"),
+        (CommandClass.NOTIFICATION, "Home Security", "number"),
+        (CommandClass.METER, "value", "number"),
+        (CommandClass.BATTERY, "level", "number"),
+        (CommandClass.CONFIGURATION, "parameter", "number"),
+        (CommandClass.THERMOSTAT_SETPOINT, "setpoint", "number"),
+        (CommandClass.BARRIER_OPERATOR, "currentState", "number"),
+        (CommandClass.VERSION, "firmwareVersions", "string[]"),
+        (CommandClass.MANUFACTURER_SPECIFIC, "manufacturerId", "number"),
+    ]
+    device_classes = [
+        ("Multilevel Switch", "Multilevel Power Switch"),
+        ("Multilevel Sensor", "Routing Multilevel Sensor"),
+        ("Thermostat", "Thermostat General V2"),
+        ("Binary Switch", "Binary Power Switch"),
+    ]
+
+    nodes = []
+    for node_id in range(2, 152):
+        generic, specific = device_classes[node_id % len(device_classes)]
+        values = []
+        for idx in range(120):
+            command_class, prop, value_type = value_templates[
+                idx % len(value_templates)
+            ]
+            values.append(
+                {
+                    "commandClass": command_class,
+                    "endpoint": idx // len(value_templates),
+                    "property": prop,
+                    "propertyKey": idx,
+                    "metadata": {"type": value_type},
+                    "value": 0,
+                }
+            )
+        nodes.append(
+            Node(
+                None,
+                {
+                    "nodeId": node_id,
+                    "manufacturerId": 0x0086,
+                    "productId": 0x0064,
+                    "productType": 0x0102,
+                    "firmwareVersion": "1.12",
+                    "deviceClass": {
+                        "basic": {"key": 4, "label": "Routing Slave"},
+                        "generic": {"key": node_id % 32, "label": generic},
+                        "specific": {"key": 1, "label": specific},
+                    },
+                    "values": values,
+                },
+            )
+        )
+
+    start = timer()
+
+    for node in nodes:
+        for _ in async_discover_values(node):
+            pass
+
+    return timer() - start
+
+
+@benchmark
+async def statistics_sensor_update(hass):
+    """Update a statistics sensor with a window of 10000 values 10000 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.statistics.sensor import StatisticsSensor
+
+    sampling_size = 10 ** 4
+    sensor = StatisticsSensor("sensor.test", "test", sampling_size, None, 2)
+    states = [
+        core.State("sensor.test", str(value % 997 / 10))
+        for value in range(2 * sampling_size)
+    ]
+    for state in states[:sampling_size]:
+        sensor._add_state_to_queue(state)  # pylint: disable=protected-access
+
+    start = timer()
+
+    for state in states[sampling_size:]:
+        sensor._add_state_to_queue(state)  # pylint: disable=protected-access
+        await sensor.async_update()
+
+    return timer() - start
+
+
+@benchmark
+async def storage_save(hass):
+    """Save stores of increasing size after changing a single record."""
+    saves = 20
+    total = 0
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+
+        for size in (10 ** 2, 10 ** 3, 10 ** 4):
+            results = []
+
+            for kwargs in ({}, {"compact": True}, {"journal": True}):
+                store = Store(hass, 1, f"benchmark_{size}", **kwargs)
+                data = {
+                    "entities": [
+                        {
+                            "entity_id": f"sensor.test_{idx}",
+                            "name": None,
+                            "disabled_by": None,
+                            "unique_id": f"unique_{idx}",
+                            "platform": "benchmark",
+                        }
+                        for idx in range(size)
+                    ]
+                }
+                await store.async_save(data)
+
+                start = timer()
+
+                for idx in range(saves):
+                    data["entities"][idx]["name"] = f"Name {idx}"
+                    await store.async_save(data)
+
+                results.append((timer() - start) / saves)
+                await store.async_remove()
+
+            total += sum(results)
+            print(
+                "{} records: {:.6f}s indented, {:.6f}s compact, {:.6f}s journal".format(
+                    size, *results
+                )
+            )
+
+    return total
+
+
+@benchmark
+async def bootstrap_integrations(hass):
+    """Start Home Assistant with 150 integrations configured."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import components
+
+    manifests = {}
+    for path in pathlib.Path(components.__path__[0]).glob("*/manifest.json"):
+        manifest = json.loads(path.read_text())
+        manifests[manifest["domain"]] = manifest
+
+    def can_set_up(domain):
+        """Return if the integration can be set up without installing anything."""
+        manifest = manifests.get(domain)
+        if manifest is None or manifest.get("requirements"):
+            return False
+        if manifest.get("config_flow"):
+            return False
+        return all(can_set_up(dep) for dep in manifest.get("dependencies", []))
+
+    config = {domain: {} for domain in sorted(filter(can_set_up, manifests))[:150]}
+    started = asyncio.Event()
+    max_stall = 0
+
+    async def monitor_loop():
+        """Track the longest time the event loop was blocked."""
+        nonlocal max_stall
+        while True:
+            before = hass.loop.time()
+            await asyncio.sleep(0.01)
+            max_stall = max(max_stall, hass.loop.time() - before - 0.01)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, lambda event: started.set())
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        monitor = asyncio.ensure_future(monitor_loop())
+        start = timer()
+
+        await bootstrap.async_from_config_dict(config, hass)
+        await hass.async_start()
+        await started.wait()
+
+        runtime = timer() - start
+        monitor.cancel()
+        await hass.async_stop()
+
+    print(f"Longest event loop stall: {max_stall:.3f}s")
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -158,10 +158,10 @@ def check(config_dir, secrets=False):
     }
 
     # pylint: disable=possibly-unused-variable
-    def mock_load(filename, secrets=None):
+    def mock_load(filename, secrets=None, cache=None):
         """Mock hass.util.load_yaml to save config file names."""
         res["yaml_files"][filename] = True
-        return MOCKS["load"][1](filename, secrets)
+        return MOCKS["load"][1](filename, secrets, cache)
 
     # pylint: disable=possibly-unused-variable
     def mock_secrets(ldr, node):
@@ -188,7 +188,8 @@ def check(config_dir, secrets=False):
 
     if secrets:
         # Ensure !secrets point to the patched function
-        yaml_loader.SafeLineLoader.add_constructor("!secret", yaml_loader.secret_yaml)
+        for loader in (yaml_loader.SafeLoader, yaml_loader.SafeLineLoader):
+            loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     def secrets_proxy(*args):
         secrets = Secrets(*args)
@@ -216,9 +217,8 @@ def check(config_dir, secrets=False):
             pat.stop()
         if secrets:
             # Ensure !secrets point to the original function
-            yaml_loader.SafeLineLoader.add_constructor(
-                "!secret", yaml_loader.secret_yaml
-            )
+            for loader in (yaml_loader.SafeLoader, yaml_loader.SafeLineLoader):
+                loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     return res
 
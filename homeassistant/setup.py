@@ -9,6 +9,7 @@ from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
 from homeassistant.const import EVENT_COMPONENT_LOADED, PLATFORM_FORMAT
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.timeline import async_trace
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
@@ -57,7 +58,9 @@ async def async_setup_component(
         return await setup_tasks[domain]  # type: ignore
 
     task = setup_tasks[domain] = hass.async_create_task(
-        _async_setup_component(hass, domain, config)
+        async_trace(
+            hass, domain, "integration", _async_setup_component(hass, domain, config)
+        )
     )
 
     try:
@@ -171,8 +174,11 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
+    processed_config = await async_trace(
+        hass,
+        domain,
+        "config",
+        conf_util.async_process_component_config(hass, config, integration),
     )
 
     if processed_config is None:
@@ -210,7 +216,7 @@ async def _async_setup_component(
             return False
 
         async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-            result = await task
+            result = await async_trace(hass, domain, "setup", task)
     except asyncio.TimeoutError:
         _LOGGER.error(
             "Setup of %s is taking longer than %s seconds."
@@ -247,11 +253,16 @@ async def _async_setup_component(
     await asyncio.sleep(0)
     await hass.config_entries.flow.async_wait_init_flow_finish(domain)
 
-    await asyncio.gather(
-        *[
-            entry.async_setup(hass, integration=integration)
-            for entry in hass.config_entries.async_entries(domain)
-        ]
+    await async_trace(
+        hass,
+        domain,
+        "config_entries",
+        asyncio.gather(
+            *[
+                entry.async_setup(hass, integration=integration)
+                for entry in hass.config_entries.async_entries(domain)
+            ]
+        ),
     )
 
     hass.config.components.add(domain)
@@ -335,13 +346,23 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if not await _async_process_dependencies(hass, config, integration):
+    if not await async_trace(
+        hass,
+        integration.domain,
+        "dependencies",
+        _async_process_dependencies(hass, config, integration),
+    ):
         raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
         async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
+            await async_trace(
+                hass,
+                integration.domain,
+                "requirements",
+                requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                ),
             )
 
     processed.add(integration.domain)
@@ -0,0 +1,200 @@
+"""Executor that runs jobs in separate thread pools per kind of work."""
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
+import os
+import threading
+from time import monotonic
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+CALLABLE_T = TypeVar("CALLABLE_T", bound=Callable)  # pylint: disable=invalid-name
+
+PARTITION_DEFAULT = "default"
+PARTITION_DATABASE = "database"
+PARTITION_NETWORK = "network"
+PARTITION_FILESYSTEM = "filesystem"
+PARTITION_CPU = "cpu"
+
+# Maximum number of threads of each partition besides the default one
+PARTITION_WORKERS = {
+    PARTITION_DATABASE: 4,
+    PARTITION_NETWORK: 32,
+    PARTITION_FILESYSTEM: 8,
+    PARTITION_CPU: os.cpu_count() or 1,
+}
+
+PARTITIONS = {PARTITION_DEFAULT, *PARTITION_WORKERS}
+
+# Jobs of code outside of integrations are accounted to this domain
+CORE_DOMAIN = "homeassistant"
+
+
+def executor_partition(partition: str) -> Callable[[CALLABLE_T], CALLABLE_T]:
+    """Annotate a function to run in a specific executor partition."""
+    if partition not in PARTITIONS:
+        raise ValueError(f"Unknown executor partition {partition}")
+
+    def decorator(func: CALLABLE_T) -> CALLABLE_T:
+        """Set the partition of the function."""
+        setattr(func, "_executor_partition", partition)
+        return func
+
+    return decorator
+
+
+def domain_from_module(module: str) -> str:
+    """Return the integration a module belongs to."""
+    parts = module.split(".", 3)
+    if parts[:2] == ["homeassistant", "components"] and len(parts) > 2:
+        return parts[2]
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    return CORE_DOMAIN
+
+
+class ExecutorStats:
+    """Counters of the executor jobs of an integration."""
+
+    __slots__ = (
+        "partition",
+        "jobs",
+        "running",
+        "queue_wait",
+        "max_queue_wait",
+        "run_time",
+        "max_run_time",
+    )
+
+    def __init__(self, partition: str) -> None:
+        """Initialize the counters."""
+        self.partition = partition
+        self.jobs = 0
+        self.running = 0
+        self.queue_wait = 0.0
+        self.max_queue_wait = 0.0
+        self.run_time = 0.0
+        self.max_run_time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a dictionary."""
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+
+class PartitionedExecutor(ThreadPoolExecutor):
+    """Thread pool that hands jobs to the pool of their partition.
+
+    A job runs in the partition its function was annotated with using
+    executor_partition, otherwise in the partition of the integration the
+    function belongs to. This executor itself is the default partition.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        resolve_partition: Callable[[str], str],
+        partition_workers: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """Initialize the executor."""
+        super().__init__(max_workers=max_workers, thread_name_prefix="SyncWorker")
+        self._resolve_partition = resolve_partition
+        self._partition_workers = partition_workers or PARTITION_WORKERS
+        self._partitions: Dict[str, ThreadPoolExecutor] = {}
+        self._domains: Dict[str, str] = {}
+        self._stats: Dict[str, ExecutorStats] = {}
+        self._lock = threading.Lock()
+
+    def _get_pool(self, partition: str) -> ThreadPoolExecutor:
+        """Return the pool of a partition, creating it on first use."""
+        if partition not in self._partition_workers:
+            return self
+
+        pool = self._partitions.get(partition)
+        if pool is None:
+            with self._lock:
+                pool = self._partitions.get(partition)
+                if pool is None:
+                    pool = self._partitions[partition] = ThreadPoolExecutor(
+                        max_workers=self._partition_workers[partition],
+                        thread_name_prefix=f"SyncWorker-{partition}",
+                    )
+        return pool
+
+    def _get_stats(self, func: Callable) -> ExecutorStats:
+        """Return the counters of the integration a function belongs to."""
+        while isinstance(func, functools.partial):
+            func = func.func
+
+        module = getattr(func, "__module__", None) or CORE_DOMAIN
+        domain = self._domains.get(module)
+        if domain is None:
+            domain = self._domains[module] = domain_from_module(module)
+
+        partition = getattr(func, "_executor_partition", None)
+        key = domain if partition is None else f"{domain}:{partition}"
+        stats = self._stats.get(key)
+        if stats is None:
+            if partition is None:
+                partition = self._resolve_partition(domain)
+            with self._lock:
+                stats = self._stats.setdefault(key, ExecutorStats(partition))
+        return stats
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Future:
+        """Submit a job to the pool of its partition."""
+        stats = self._get_stats(fn)
+        pool = self._get_pool(stats.partition)
+        job = functools.partial(self._run, stats, monotonic(), fn, args, kwargs)
+        if pool is self:
+            return super().submit(job)
+        return pool.submit(job)
+
+    def _run(
+        self,
+        stats: ExecutorStats,
+        queued: float,
+        func: Callable[..., Any],
+        args: Any,
+        kwargs: Any,
+    ) -> Any:
+        """Run a job and account its queue wait and run time."""
+        started = monotonic()
+        with self._lock:
+            stats.jobs += 1
+            stats.running += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            run_time = monotonic() - started
+            queue_wait = started - queued
+            with self._lock:
+                stats.running -= 1
+                stats.queue_wait += queue_wait
+                stats.max_queue_wait = max(stats.max_queue_wait, queue_wait)
+                stats.run_time += run_time
+                stats.max_run_time = max(stats.max_run_time, run_time)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the partitions and the counters per integration."""
+        with self._lock:
+            return {
+                "partitions": {
+                    PARTITION_DEFAULT: self._max_workers,
+                    **self._partition_workers,
+                },
+                "integrations": {
+                    key: stats.as_dict() for key, stats in self._stats.items()
+                },
+            }
+
+    def shutdown(self, wait: bool = True, **kwargs: Any) -> None:
+        """Shut down the pools of all partitions."""
+        for pool in list(self._partitions.values()):
+            pool.shutdown(wait, **kwargs)
+        super().shutdown(wait, **kwargs)
+
+
+def get_partitioned_executor(loop: Any) -> Optional[PartitionedExecutor]:
+    """Return the partitioned executor of an event loop if it uses one."""
+    executor = getattr(loop, "_default_executor", None)
+    return executor if isinstance(executor, PartitionedExecutor) else None
@@ -1,18 +1,22 @@
 """Helpers to install PyPi packages."""
 import asyncio
-from importlib.metadata import PackageNotFoundError, version
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, distributions, version
 import logging
 import os
 from pathlib import Path
+import re
 from subprocess import PIPE, Popen
 import sys
-from typing import Optional
+from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
 import pkg_resources
 
 _LOGGER = logging.getLogger(__name__)
 
+RE_NAME_SEPARATORS = re.compile(r"[-_.]+")
+
 
 def is_virtual_env() -> bool:
     """Return if we run in a virtual environment."""
@@ -27,18 +31,49 @@ def is_docker_env() -> bool:
     return Path("/.dockerenv").exists()
 
 
-def is_installed(package: str) -> bool:
-    """Check if a package is installed and will be loaded when we import it.
+def normalize_name(name: str) -> str:
+    """Return the normalized form of a distribution name."""
+    return RE_NAME_SEPARATORS.sub("-", name).lower()
 
-    Returns True when the requirement is met.
-    Returns False when the package is not installed or doesn't meet req.
+
+def installed_packages(paths: Optional[List[str]] = None) -> Dict[str, str]:
+    """Return the versions of the installed distributions by normalized name.
+
+    Like importing, the first distribution found on the path wins.
     """
+    packages: Dict[str, str] = {}
+    for dist in distributions(path=sys.path if paths is None else paths):
+        name = dist.metadata["Name"]
+        if name:
+            packages.setdefault(normalize_name(name), dist.version)
+    return packages
+
+
+@lru_cache(maxsize=None)
+def _parse_requirement(package: str) -> pkg_resources.Requirement:
+    """Parse a requirement."""
     try:
-        req = pkg_resources.Requirement.parse(package)
+        return pkg_resources.Requirement.parse(package)
     except ValueError:
         # This is a zip file. We no longer use this in Home Assistant,
         # leaving it in for custom components.
-        req = pkg_resources.Requirement.parse(urlparse(package).fragment)
+        return pkg_resources.Requirement.parse(urlparse(package).fragment)
+
+
+def is_installed(package: str, installed: Optional[Dict[str, str]] = None) -> bool:
+    """Check if a package is installed and will be loaded when we import it.
+
+    Pass a snapshot from installed_packages to look up the installed version
+    instead of querying the distribution metadata.
+
+    Returns True when the requirement is met.
+    Returns False when the package is not installed or doesn't meet req.
+    """
+    req = _parse_requirement(package)
+
+    if installed is not None:
+        installed_version = installed.get(normalize_name(req.project_name))
+        return installed_version is not None and installed_version in req
 
     try:
         return version(req.project_name) in req
@@ -4,10 +4,32 @@ import fnmatch
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, TextIO, TypeVar, Union, overload
+import pickle
+import threading
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore
+
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import SECRET_YAML
@@ -29,11 +51,9 @@ class Secrets:
         self.config_dir = config_dir
         self._cache: Dict[Path, Dict[str, str]] = {}
 
-    def get(self, requester_path: str, secret: str) -> str:
-        """Return the value of a secret."""
-        current_path = Path(requester_path)
-
-        secret_dir = current_path
+    def secret_dirs(self, requester_path: str) -> Iterator[Path]:
+        """Return the directories searched for secrets, closest first."""
+        secret_dir = Path(requester_path)
         while True:
             secret_dir = secret_dir.parent
 
@@ -43,6 +63,11 @@ class Secrets:
                 # We went above the config dir
                 break
 
+            yield secret_dir
+
+    def get(self, requester_path: str, secret: str) -> str:
+        """Return the value of a secret."""
+        for secret_dir in self.secret_dirs(requester_path):
             secrets = self._load_secret_yaml(secret_dir)
 
             if secret in secrets:
@@ -87,13 +112,188 @@ class Secrets:
         return secrets
 
 
+class YamlCache:
+    """Cache of parsed YAML files.
+
+    A file is parsed again only when the mtime or size of the file or of
+    anything it pulled in (includes, included directories, secrets files,
+    environment variables) changed. When a path is given, the cache is
+    persisted there between runs.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self._entries: Dict[str, Tuple[Dict[tuple, Any], bytes]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._dirty = False
+
+        if path is not None:
+            self._load()
+
+    def _load(self) -> None:
+        """Load the cache from disk."""
+        try:
+            with open(cast(str, self.path), "rb") as cache_file:
+                data = pickle.load(cache_file)
+        except FileNotFoundError:
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Unable to load YAML cache %s: %s", self.path, err)
+            return
+
+        if data.get("version") == self.VERSION:
+            self._entries = data["entries"]
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed."""
+        if self.path is None or not self._dirty:
+            return
+
+        with self._lock:
+            data = pickle.dumps({"version": self.VERSION, "entries": self._entries})
+            self._dirty = False
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "wb") as cache_file:
+                cache_file.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as err:
+            _LOGGER.warning("Unable to write YAML cache %s: %s", self.path, err)
+
+    def load(self, fname: str, secrets: Optional[Secrets] = None) -> JSON_TYPE:
+        """Load a YAML file, using the cached result if it is still valid."""
+        stack = self._stack()
+        entry = self._entries.get(fname)
+
+        if entry is not None and _dependencies_unchanged(entry[0]):
+            if stack:
+                stack[-1].update(entry[0])
+            return cast(JSON_TYPE, pickle.loads(entry[1]))
+
+        dependencies: Dict[tuple, Any] = {}
+        stack.append(dependencies)
+        try:
+            self.record_file(fname)
+            result = _load_yaml(fname, secrets, self)
+        finally:
+            stack.pop()
+
+        if stack:
+            stack[-1].update(dependencies)
+
+        # Only cache results of files that could all be found on disk
+        if all(
+            value is not None
+            for (kind, _), value in dependencies.items()
+            if kind == "file"
+        ):
+            with self._lock:
+                self._entries[fname] = (dependencies, pickle.dumps(result))
+                self._dirty = True
+
+        return result
+
+    def _stack(self) -> List[Dict[tuple, Any]]:
+        """Return the dependencies of the files being loaded by this thread."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return cast(List[Dict[tuple, Any]], stack)
+
+    def _record(self, key: tuple, value: Any) -> None:
+        """Record a dependency of the file being loaded."""
+        stack = self._stack()
+        if stack:
+            stack[-1][key] = value
+
+    def record_file(self, fname: str) -> None:
+        """Record that the file being loaded depends on a file."""
+        self._record(("file", fname), _file_signature(fname))
+
+    def record_optional_file(self, fname: str) -> None:
+        """Record that the file being loaded depends on a file that may not exist."""
+        self._record(("optional", fname), _file_signature(fname))
+
+    def record_directory(self, directory: str, files: List[str]) -> None:
+        """Record that the file being loaded depends on a directory listing."""
+        self._record(("dir", directory), files)
+
+    def record_env_var(self, name: str) -> None:
+        """Record that the file being loaded depends on an environment variable."""
+        self._record(("env", name), os.getenv(name))
+
+
+def _file_signature(fname: str) -> Optional[Tuple[int, int]]:
+    """Return the mtime and size of a file or None if it does not exist."""
+    try:
+        stat = os.stat(fname)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _dependencies_unchanged(dependencies: Dict[tuple, Any]) -> bool:
+    """Test if the recorded dependencies of a cached file are unchanged."""
+    for (kind, name), value in dependencies.items():
+        if kind in ("file", "optional"):
+            current = _file_signature(name)
+        elif kind == "dir":
+            current = list(_find_files(name, "*.yaml"))
+        else:
+            current = os.getenv(name)
+
+        if current != value:
+            return False
+
+    return True
+
+
+class SafeLoader(FastestAvailableSafeLoader):
+    """The fastest available safe loader.
+
+    Uses the libyaml parser when available. File and line annotations come
+    from the node marks, which libyaml provides as well.
+    """
+
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Optional[Secrets] = None,
+        cache: Optional[YamlCache] = None,
+    ) -> None:
+        """Initialize a safe loader."""
+        super().__init__(stream)
+        if HAS_C_LOADER:
+            # The libyaml parser does not expose the stream and its name
+            if isinstance(stream, str):
+                self.name = "<unicode string>"
+            elif isinstance(stream, bytes):
+                self.name = "<byte string>"
+            else:
+                self.name = getattr(stream, "name", "<file>")
+            self.stream = stream
+        self.secrets = secrets
+        self.cache = cache
+
+
 class SafeLineLoader(yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
 
-    def __init__(self, stream: Any, secrets: Optional[Secrets] = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Optional[Secrets] = None,
+        cache: Optional[YamlCache] = None,
+    ) -> None:
         """Initialize a safe line loader."""
         super().__init__(stream)
         self.secrets = secrets
+        self.cache = cache
 
     def compose_node(self, parent: yaml.nodes.Node, index: int) -> yaml.nodes.Node:
         """Annotate a node with the first line it was seen."""
@@ -103,25 +303,41 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
-def load_yaml(fname: str, secrets: Optional[Secrets] = None) -> JSON_TYPE:
+LoaderType = Union[SafeLoader, SafeLineLoader]
+
+
+def load_yaml(
+    fname: str, secrets: Optional[Secrets] = None, cache: Optional[YamlCache] = None
+) -> JSON_TYPE:
     """Load a YAML file."""
+    if cache is not None:
+        return cache.load(fname, secrets)
+    return _load_yaml(fname, secrets, None)
+
+
+def _load_yaml(
+    fname: str, secrets: Optional[Secrets], cache: Optional[YamlCache]
+) -> JSON_TYPE:
+    """Read and parse a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            return parse_yaml(conf_file, secrets, cache)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
 
 def parse_yaml(
-    content: Union[str, TextIO], secrets: Optional[Secrets] = None
+    content: Union[str, TextIO],
+    secrets: Optional[Secrets] = None,
+    cache: Optional[YamlCache] = None,
 ) -> JSON_TYPE:
     """Load a YAML file."""
     try:
         # If configuration file is empty YAML returns None
         # We convert that to an empty dict
         return (
-            yaml.load(content, Loader=lambda stream: SafeLineLoader(stream, secrets))
+            yaml.load(content, Loader=lambda stream: SafeLoader(stream, secrets, cache))
             or OrderedDict()
         )
     except yaml.YAMLError as exc:
@@ -131,26 +347,26 @@ def parse_yaml(
 
 @overload
 def _add_reference(
-    obj: Union[list, NodeListClass], loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: Union[list, NodeListClass], loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeListClass:
     ...
 
 
 @overload
 def _add_reference(
-    obj: Union[str, NodeStrClass], loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: Union[str, NodeStrClass], loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeStrClass:
     ...
 
 
 @overload
 def _add_reference(
-    obj: DICT_T, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: DICT_T, loader: LoaderType, node: yaml.nodes.Node
 ) -> DICT_T:
     ...
 
 
-def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type: ignore
+def _add_reference(obj, loader: LoaderType, node: yaml.nodes.Node):  # type: ignore
     """Add file reference information to an object."""
     if isinstance(obj, list):
         obj = NodeListClass(obj)
@@ -161,7 +377,7 @@ def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type:
     return obj
 
 
-def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embeds it using the !include tag.
 
     Example:
@@ -170,7 +386,9 @@ def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """
     fname = os.path.join(os.path.dirname(loader.name), node.value)
     try:
-        return _add_reference(load_yaml(fname, loader.secrets), loader, node)
+        return _add_reference(
+            load_yaml(fname, loader.secrets, loader.cache), loader, node
+        )
     except FileNotFoundError as exc:
         raise HomeAssistantError(
             f"{node.start_mark}: Unable to read file {fname}."
@@ -192,63 +410,59 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
-def _include_dir_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
-) -> OrderedDict:
+def _find_included_files(loader: LoaderType, node: yaml.nodes.Node) -> List[str]:
+    """Return the YAML files of an included directory, except secrets."""
+    loc = os.path.join(os.path.dirname(loader.name), node.value)
+    files = list(_find_files(loc, "*.yaml"))
+    if loader.cache is not None:
+        loader.cache.record_directory(loc, files)
+    return [fname for fname in files if os.path.basename(fname) != SECRET_YAML]
+
+
+def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
-    loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loader, node):
         filename = os.path.splitext(os.path.basename(fname))[0]
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
-        mapping[filename] = load_yaml(fname, loader.secrets)
+        mapping[filename] = load_yaml(fname, loader.secrets, loader.cache)
     return _add_reference(mapping, loader, node)
 
 
 def _include_dir_merge_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
-    loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+    for fname in _find_included_files(loader, node):
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference(mapping, loader, node)
 
 
 def _include_dir_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> List[JSON_TYPE]:
     """Load multiple files from directory as a list."""
-    loc = os.path.join(os.path.dirname(loader.name), node.value)
     return [
-        load_yaml(f, loader.secrets)
-        for f in _find_files(loc, "*.yaml")
-        if os.path.basename(f) != SECRET_YAML
+        load_yaml(fname, loader.secrets, loader.cache)
+        for fname in _find_included_files(loader, node)
     ]
 
 
 def _include_dir_merge_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
-    loc: str = os.path.join(os.path.dirname(loader.name), node.value)
     merged_list: List[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+    for fname in _find_included_files(loader, node):
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
 
 
-def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
+def _ordered_dict(loader: LoaderType, node: yaml.nodes.MappingNode) -> OrderedDict:
     """Load YAML mappings into an ordered dictionary to preserve key order."""
     loader.flatten_mapping(node)
     nodes = loader.construct_pairs(node)
@@ -280,16 +494,19 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
     return _add_reference(OrderedDict(nodes), loader, node)
 
 
-def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _construct_seq(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Add line number and file name to Load YAML sequence."""
     (obj,) = loader.construct_yaml_seq(node)
     return _add_reference(obj, loader, node)
 
 
-def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
+def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
 
+    if loader.cache is not None:
+        loader.cache.record_env_var(args[0])
+
     # Check for a default value
     if len(args) > 1:
         return os.getenv(args[0], " ".join(args[1:]))
@@ -299,27 +516,30 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     raise HomeAssistantError(node.value)
 
 
-def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
+    if loader.cache is not None:
+        for secret_dir in loader.secrets.secret_dirs(loader.name):
+            loader.cache.record_optional_file(str(secret_dir / SECRET_YAML))
+
     return loader.secrets.get(loader.name, node.value)
 
 
-SafeLineLoader.add_constructor("!include", _include_yaml)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-SafeLineLoader.add_constructor("!env_var", _env_var_yaml)
-SafeLineLoader.add_constructor("!secret", secret_yaml)
-SafeLineLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-SafeLineLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-SafeLineLoader.add_constructor("!input", Input.from_node)
+for _loader in (SafeLoader, SafeLineLoader):
+    _loader.add_constructor("!include", _include_yaml)
+    _loader.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
+    )
+    _loader.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
+    )
+    _loader.add_constructor("!env_var", _env_var_yaml)
+    _loader.add_constructor("!secret", secret_yaml)
+    _loader.add_constructor("!include_dir_list", _include_dir_list_yaml)
+    _loader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+    _loader.add_constructor("!include_dir_named", _include_dir_named_yaml)
+    _loader.add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
+    _loader.add_constructor("!input", Input.from_node)
@@ -12,6 +12,7 @@ from . import (
     dhcp,
     json,
     manifest,
+    manifest_index,
     mqtt,
     requirements,
     services,
@@ -33,6 +34,7 @@ INTEGRATION_PLUGINS = [
     translations,
     zeroconf,
     dhcp,
+    manifest_index,
 ]
 HASS_PLUGINS = [
     coverage,
@@ -6,6 +6,7 @@ import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
 from homeassistant.loader import validate_custom_integration_version
+from homeassistant.util.executor import PARTITIONS
 
 from .model import Integration
 
@@ -97,6 +98,7 @@ MANIFEST_SCHEMA = vol.Schema(
             "issue_tracker"
         ): vol.Url(),  # pylint: disable=no-value-for-parameter
         vol.Optional("quality_scale"): vol.In(SUPPORTED_QUALITY_SCALES),
+        vol.Optional("executor"): vol.In(sorted(PARTITIONS)),
         vol.Optional("requirements"): [str],
         vol.Optional("dependencies"): [str],
         vol.Optional("after_dependencies"): [str],
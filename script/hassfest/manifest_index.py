@@ -0,0 +1,58 @@
+"""Generate manifest index file."""
+from typing import Dict
+
+from .model import Config, Integration
+
+BASE = """
+\"\"\"Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+\"\"\"
+
+# fmt: off
+
+MANIFESTS = {{
+{}
+}}
+""".strip()
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate manifest index data."""
+    lines = []
+
+    for domain in sorted(integrations):
+        integration = integrations[domain]
+
+        if not integration.manifest:
+            continue
+
+        lines.append(f"    {domain!r}: {integration.manifest!r},")
+
+    return BASE.format("\n".join(lines))
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate manifest index file."""
+    index_path = config.root / "homeassistant/generated/manifests.py"
+    config.cache["manifest_index"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(index_path)) as fp:
+        current = fp.read().strip()
+        if current != content:
+            config.add_error(
+                "manifest_index",
+                "File manifests.py is not up to date. Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate manifest index file."""
+    index_path = config.root / "homeassistant/generated/manifests.py"
+    with open(str(index_path), "w") as fp:
+        fp.write(f"{config.cache['manifest_index']}\n")
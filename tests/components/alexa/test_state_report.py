@@ -6,6 +6,8 @@ from homeassistant.components.alexa import state_report
 
 from . import DEFAULT_CONFIG, TEST_URL
 
+from tests.test_util.aiohttp import AiohttpClientMockResponse
+
 
 async def test_report_state(hass, aioclient_mock):
     """Test proactive state reports."""
@@ -277,3 +279,62 @@ async def test_proactive_mode_filter_states(hass, aioclient_mock):
 
         await hass.async_block_till_done()
     assert len(aioclient_mock.mock_calls) == 1
+
+
+async def test_report_state_queue(hass, aioclient_mock):
+    """Test change reports are coalesced, retried when throttled and counted."""
+    responses = [
+        AiohttpClientMockResponse("post", TEST_URL, status=429),
+        AiohttpClientMockResponse("post", TEST_URL, text="", status=202),
+    ]
+
+    async def respond(method, url, data):
+        """Throttle the first request."""
+        return responses.pop(0)
+
+    aioclient_mock.post(TEST_URL, side_effect=respond)
+
+    hass.states.async_set(
+        "binary_sensor.test_contact",
+        "on",
+        {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+    )
+
+    unsub = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+    queue = DEFAULT_CONFIG.change_report_queue
+
+    with patch.object(state_report, "BACKOFF_INITIAL", 0.01):
+        for state in ("off", "on", "off"):
+            hass.states.async_set(
+                "binary_sensor.test_contact",
+                state,
+                {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+            )
+        await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 2
+    for call in aioclient_mock.mock_calls:
+        assert (
+            call[2]["event"]["payload"]["change"]["properties"][0]["value"]
+            == "NOT_DETECTED"
+        )
+    assert queue.metrics == {
+        "queued": 1,
+        "coalesced": 2,
+        "sent": 1,
+        "dropped": 0,
+        "throttled": 1,
+    }
+    assert queue.last_latency is not None
+    assert queue.average_latency == queue.last_latency
+
+    # Pending reports are dropped when proactive mode is disabled
+    hass.states.async_set(
+        "binary_sensor.test_contact",
+        "on",
+        {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+    )
+    unsub()
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 2
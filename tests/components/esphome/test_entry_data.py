@@ -0,0 +1,65 @@
+"""Test ESPHome runtime entry data."""
+from unittest.mock import MagicMock
+
+from aioesphomeapi import BinarySensorState, SensorState
+
+from homeassistant.components.esphome.entry_data import RuntimeEntryData
+from homeassistant.core import callback
+
+
+async def test_state_update_routed_to_entity(hass):
+    """Test state packets only run the callback of the owning entity."""
+    entry_data = RuntimeEntryData("mock-entry", MagicMock(), MagicMock())
+    entry_data.state["sensor"] = {}
+    entry_data.state["binary_sensor"] = {}
+    entry_data.state_type_to_component_key[SensorState] = "sensor"
+    entry_data.state_type_to_component_key[BinarySensorState] = "binary_sensor"
+
+    calls = []
+
+    def _make_listener(name):
+        @callback
+        def _listener():
+            calls.append(name)
+
+        return _listener
+
+    unsub_first = entry_data.async_subscribe_state_update(
+        "sensor", 1, _make_listener("sensor_1")
+    )
+    entry_data.async_subscribe_state_update("sensor", 2, _make_listener("sensor_2"))
+    entry_data.async_subscribe_state_update(
+        "binary_sensor", 1, _make_listener("binary_sensor_1")
+    )
+
+    state = SensorState(key=1, state=21.5)
+    entry_data.async_update_state(hass, state)
+    assert calls == ["sensor_1"]
+    assert entry_data.state["sensor"][1] is state
+
+    entry_data.async_update_state(hass, BinarySensorState(key=1, state=True))
+    assert calls == ["sensor_1", "binary_sensor_1"]
+
+    unsub_first()
+    entry_data.async_update_state(hass, SensorState(key=1, state=22.0))
+    assert calls == ["sensor_1", "binary_sensor_1"]
+    assert entry_data.state["sensor"][1].state == 22.0
+
+    assert entry_data.state_packets_received == 3
+    assert entry_data.entity_updates_dispatched == 2
+
+
+async def test_device_update_subscriptions(hass):
+    """Test device updates run the subscribed callbacks."""
+    entry_data = RuntimeEntryData("mock-entry", MagicMock(), MagicMock())
+    calls = []
+
+    unsub = entry_data.async_subscribe_device_updated(lambda: calls.append(1))
+    entry_data.async_update_device_state(hass)
+    await hass.async_block_till_done()
+    assert calls == [1]
+
+    unsub()
+    entry_data.async_update_device_state(hass)
+    await hass.async_block_till_done()
+    assert calls == [1]
@@ -441,6 +441,48 @@ def test_time_sma(values):
     assert 21.5 == filtered.state
 
 
+def test_filter_states_batch():
+    """Test filtering a batch gives the same result as one state at a time."""
+    raw_values = [20, 19, 18, 21, 22, 0, "unknown", 25, 25.5, 4000, 19, 18.5, 20]
+    timestamp = dt_util.utcnow()
+    states = []
+    for val in raw_values:
+        states.append(ha.State("sensor.test_monitored", val, last_updated=timestamp))
+        timestamp += timedelta(seconds=40)
+
+    def create_filters():
+        return [
+            RangeFilter(entity=None, precision=2, lower_bound=10, upper_bound=24),
+            OutlierFilter(window_size=4, precision=2, entity=None, radius=4.0),
+            LowPassFilter(window_size=10, precision=1, entity=None, time_constant=4),
+            TimeSMAFilter(
+                window_size=timedelta(minutes=2), precision=2, entity=None, type="last"
+            ),
+            ThrottleFilter(window_size=3, precision=2, entity=None),
+            TimeThrottleFilter(
+                window_size=timedelta(minutes=1), precision=2, entity=None
+            ),
+        ]
+
+    for single, batch in zip(create_filters(), create_filters()):
+        expected = []
+        for state in states:
+            try:
+                filtered = single.filter_state(ha.State.from_dict(state.as_dict()))
+            except ValueError:
+                continue
+            if not single.skip_processing:
+                expected.append(filtered.state)
+
+        # Split the batch in two to check the filters carry their state over
+        filtered = batch.filter_states(
+            [ha.State.from_dict(state.as_dict()) for state in states[:5]]
+        ) + batch.filter_states(
+            [ha.State.from_dict(state.as_dict()) for state in states[5:]]
+        )
+        assert [state.state for state in filtered] == expected, batch.name
+
+
 async def test_reload(hass):
     """Verify we can reload filter sensors."""
     await async_init_recorder_component(hass)
@@ -222,8 +222,8 @@ async def test_setup_race_condition(hass, legacy_patchable_time):
 
             all_states = hass.states.async_all()
             assert len(all_states) == 0
-            assert len(hass.data[DATA_DISPATCHER][delete_signal]) == 0
-            assert len(hass.data[DATA_DISPATCHER][update_signal]) == 0
+            assert delete_signal not in hass.data[DATA_DISPATCHER]
+            assert update_signal not in hass.data[DATA_DISPATCHER]
 
             # Simulate an update - 1 entry
             mock_feed.return_value.update.return_value = "OK", [mock_entry_1]
@@ -253,5 +253,5 @@ async def test_setup_race_condition(hass, legacy_patchable_time):
             all_states = hass.states.async_all()
             assert len(all_states) == 0
             # Ensure that delete and update signal targets are now empty.
-            assert len(hass.data[DATA_DISPATCHER][delete_signal]) == 0
-            assert len(hass.data[DATA_DISPATCHER][update_signal]) == 0
+            assert delete_signal not in hass.data[DATA_DISPATCHER]
+            assert update_signal not in hass.data[DATA_DISPATCHER]
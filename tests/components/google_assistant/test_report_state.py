@@ -1,4 +1,5 @@
 """Test Google report state."""
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 from homeassistant.components.google_assistant import error, report_state
@@ -10,6 +11,14 @@ from . import BASIC_CONFIG
 from tests.common import async_fire_time_changed
 
 
+async def _async_report_window_passed(hass):
+    """Fire time past the report state window."""
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW + 1)
+    )
+    await hass.async_block_till_done()
+
+
 async def test_report_state(hass, caplog, legacy_patchable_time):
     """Test report state works."""
     assert await async_setup_component(hass, "switch", {})
@@ -40,6 +49,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
 
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
@@ -54,10 +64,12 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         # New state, so reported
         hass.states.async_set("light.double_report", "on")
         await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
 
         # Changed, but serialize is same, so filtered out by extra check
         hass.states.async_set("light.double_report", "off")
         await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
 
         assert len(mock_report.mock_calls) == 1
         assert mock_report.mock_calls[0][1][0] == {
@@ -70,6 +82,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ) as mock_report:
         hass.states.async_set("switch.ac", "on", {"something": "else"})
         await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
 
     assert len(mock_report.mock_calls) == 0
 
@@ -82,6 +95,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ):
         hass.states.async_set("light.kitchen", "off")
         await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
@@ -93,5 +107,57 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
+
+    assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_batched(hass, legacy_patchable_time):
+    """Test state changes during the window are reported together."""
+    hass.states.async_set("light.ceiling", "off")
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ), patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+    counters = dict(BASIC_CONFIG.report_state_counters)
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report:
+        hass.states.async_set("light.ceiling", "on")
+        hass.states.async_set("light.kitchen", "on")
+        hass.states.async_set("light.ceiling", "off")
+        await hass.async_block_till_done()
+
+        assert len(mock_report.mock_calls) == 0
+
+        await _async_report_window_passed(hass)
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {
+            "states": {
+                "light.ceiling": {"on": False, "online": True},
+                "light.kitchen": {"on": True, "online": True},
+            }
+        }
+    }
+    assert BASIC_CONFIG.report_state_counters["queued"] == counters["queued"] + 2
+    assert BASIC_CONFIG.report_state_counters["coalesced"] == counters["coalesced"] + 1
+    assert BASIC_CONFIG.report_state_counters["sent"] == counters["sent"] + 1
+
+    # Pending reports are dropped when reporting is disabled
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report:
+        hass.states.async_set("light.kitchen", "off")
+        await hass.async_block_till_done()
+        unsub()
+        await _async_report_window_passed(hass)
 
     assert len(mock_report.mock_calls) == 0
@@ -220,4 +220,4 @@ async def test_load_unload_entry(hass, gpslogger_client, webhook_id):
 
     assert await gpslogger.async_unload_entry(hass, entry)
     await hass.async_block_till_done()
-    assert not hass.data[DATA_DISPATCHER][TRACKER_UPDATE]
+    assert TRACKER_UPDATE not in hass.data[DATA_DISPATCHER]
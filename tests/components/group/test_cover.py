@@ -562,3 +562,56 @@ async def test_is_opening_closing(hass, setup_comp):
 
     assert hass.states.get(DEMO_COVER_POS).state == STATE_CLOSING
     assert hass.states.get(COVER_GROUP).state == STATE_CLOSING
+
+
+@pytest.mark.parametrize("config_count", [(CONFIG_ATTRIBUTES, 1)])
+async def test_incremental_update_matches_full_update(hass, setup_comp):
+    """Test updating from one member change gives the same state as a full update."""
+    group_cover = hass.data[DOMAIN].get_entity(COVER_GROUP)
+    position_features = 4 | 128
+
+    changes = [
+        (DEMO_COVER_POS, STATE_CLOSED, {ATTR_SUPPORTED_FEATURES: 15}),
+        (DEMO_TILT, STATE_CLOSING, {ATTR_SUPPORTED_FEATURES: 255}),
+        (DEMO_COVER, STATE_OPEN, {ATTR_ASSUMED_STATE: True}),
+        (
+            DEMO_COVER_POS,
+            STATE_OPENING,
+            {ATTR_SUPPORTED_FEATURES: position_features, ATTR_CURRENT_POSITION: 50},
+        ),
+        (
+            DEMO_COVER_TILT,
+            STATE_OPEN,
+            {
+                ATTR_SUPPORTED_FEATURES: position_features,
+                ATTR_CURRENT_POSITION: 50,
+                ATTR_CURRENT_TILT_POSITION: 20,
+            },
+        ),
+        (DEMO_COVER, STATE_CLOSED, {}),
+        (DEMO_TILT, STATE_CLOSED, {ATTR_SUPPORTED_FEATURES: 255}),
+        (
+            DEMO_COVER_TILT,
+            STATE_CLOSED,
+            {ATTR_SUPPORTED_FEATURES: position_features, ATTR_CURRENT_POSITION: 0},
+        ),
+        (DEMO_COVER_POS, None, None),
+    ]
+
+    for entity_id, state, attributes in changes:
+        if state is None:
+            hass.states.async_remove(entity_id)
+        else:
+            hass.states.async_set(entity_id, state, attributes)
+        await hass.async_block_till_done()
+        incremental = hass.states.get(COVER_GROUP)
+
+        await group_cover.async_update()
+        group_cover.async_write_ha_state()
+        full = hass.states.get(COVER_GROUP)
+
+        assert incremental.state == full.state
+        assert incremental.attributes == full.attributes
+
+    assert full.state == STATE_CLOSED
+    assert full.attributes[ATTR_CURRENT_POSITION] == 0
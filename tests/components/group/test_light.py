@@ -801,3 +801,51 @@ async def test_nested_group(hass):
 
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
+
+
+async def test_incremental_update_matches_full_update(hass):
+    """Test updating from one member change gives the same state as a full update."""
+    entity_ids = [f"light.test{idx}" for idx in range(6)]
+    await async_setup_component(
+        hass,
+        LIGHT_DOMAIN,
+        {LIGHT_DOMAIN: {"platform": DOMAIN, "entities": entity_ids}},
+    )
+    await hass.async_block_till_done()
+    await hass.async_start()
+    await hass.async_block_till_done()
+    group_light = hass.data[LIGHT_DOMAIN].get_entity("light.light_group")
+
+    changes = [
+        ("light.test0", STATE_ON, {ATTR_BRIGHTNESS: 255, ATTR_HS_COLOR: (0, 100)}),
+        ("light.test1", STATE_ON, {ATTR_BRIGHTNESS: 100, ATTR_HS_COLOR: (180, 50)}),
+        ("light.test2", STATE_OFF, {ATTR_MIN_MIREDS: 200, ATTR_MAX_MIREDS: 400}),
+        ("light.test3", STATE_ON, {ATTR_EFFECT: "Random", ATTR_EFFECT_LIST: ["A"]}),
+        ("light.test4", STATE_ON, {ATTR_EFFECT: "None", ATTR_COLOR_TEMP: 300}),
+        ("light.test1", STATE_ON, {ATTR_BRIGHTNESS: 3, ATTR_WHITE_VALUE: 10}),
+        ("light.test5", STATE_UNAVAILABLE, {ATTR_SUPPORTED_FEATURES: 4}),
+        ("light.test0", STATE_OFF, {ATTR_BRIGHTNESS: 255, ATTR_HS_COLOR: (0, 100)}),
+        ("light.test4", STATE_ON, {ATTR_EFFECT: "Random", ATTR_COLOR_TEMP: 250}),
+        ("light.test3", STATE_OFF, {}),
+        ("light.test1", None, None),
+    ]
+
+    for entity_id, state, attributes in changes:
+        if state is None:
+            hass.states.async_remove(entity_id)
+        else:
+            hass.states.async_set(
+                entity_id, state, {ATTR_SUPPORTED_FEATURES: 63, **attributes}
+            )
+        await hass.async_block_till_done()
+        incremental = hass.states.get("light.light_group")
+
+        await group_light.async_update()
+        group_light.async_write_ha_state()
+        full = hass.states.get("light.light_group")
+
+        assert incremental.state == full.state
+        assert incremental.attributes == full.attributes
+
+    assert full.attributes[ATTR_COLOR_TEMP] == 250
+    assert full.attributes[ATTR_EFFECT] == "Random"
@@ -419,3 +419,85 @@ async def test_reload(hass):
 
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
+
+
+async def test_history_kept_in_memory(hass):
+    """Test the history is only loaded once and follows state changes."""
+    now = dt_util.utcnow()
+    t0 = now - timedelta(minutes=40)
+    t1 = t0 + timedelta(minutes=20)
+
+    # Start     t0        t1        End
+    # |--20min--|--20min--|--20min--|
+    # |---off---|---on----|---off---|
+
+    fake_states = {
+        "binary_sensor.test_id": [
+            ha.State("binary_sensor.test_id", "on", last_changed=t0),
+            ha.State("binary_sensor.test_id", "off", last_changed=t1),
+        ]
+    }
+
+    start = Template("{{ as_timestamp(now()) - 3600 }}", hass)
+    end = Template("{{ now() }}", hass)
+    sensor = HistoryStatsSensor(
+        hass, "binary_sensor.test_id", "on", start, end, None, "count", "Test"
+    )
+
+    with patch(
+        "homeassistant.components.history.state_changes_during_period",
+        return_value=fake_states,
+    ) as mock_changes, patch(
+        "homeassistant.components.history.get_state", return_value=None
+    ):
+        await sensor.async_update()
+        assert sensor.state == 1
+
+        sensor._async_record_state(
+            ha.State("binary_sensor.test_id", "on", last_changed=now)
+        )
+        # Attribute changes do not count as a new state
+        sensor._async_record_state(
+            ha.State("binary_sensor.test_id", "on", {"a": 1}, last_changed=now)
+        )
+        with patch(
+            "homeassistant.util.dt.now", return_value=now + timedelta(seconds=5)
+        ):
+            await sensor.async_update()
+        assert sensor.state == 2
+
+        assert len(mock_changes.mock_calls) == 1
+
+
+async def test_history_reloaded_when_period_moves_back(hass):
+    """Test the history is loaded again when the period starts earlier."""
+    fake_states = {
+        "binary_sensor.test_id": [
+            ha.State(
+                "binary_sensor.test_id",
+                "on",
+                last_changed=dt_util.utcnow() - timedelta(minutes=10),
+            ),
+        ]
+    }
+
+    start = Template("{{ as_timestamp(now()) - 3600 }}", hass)
+    end = Template("{{ now() }}", hass)
+    sensor = HistoryStatsSensor(
+        hass, "binary_sensor.test_id", "on", start, end, None, "count", "Test"
+    )
+
+    with patch(
+        "homeassistant.components.history.state_changes_during_period",
+        return_value=fake_states,
+    ) as mock_changes, patch(
+        "homeassistant.components.history.get_state", return_value=None
+    ):
+        await sensor.async_update()
+        assert sensor.state == 1
+        assert len(mock_changes.mock_calls) == 1
+
+        sensor._start = Template("{{ as_timestamp(now()) - 7200 }}", hass)
+        await sensor.async_update()
+        assert sensor.state == 1
+        assert len(mock_changes.mock_calls) == 2
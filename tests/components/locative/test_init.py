@@ -310,4 +310,4 @@ async def test_load_unload_entry(hass, locative_client, webhook_id):
 
     await locative.async_unload_entry(hass, entry)
     await hass.async_block_till_done()
-    assert not hass.data[DATA_DISPATCHER][TRACKER_UPDATE]
+    assert TRACKER_UPDATE not in hass.data[DATA_DISPATCHER]
@@ -9,7 +9,11 @@ import pytest
 
 from homeassistant import config as hass_config
 from homeassistant.components import recorder
-from homeassistant.components.statistics.sensor import DOMAIN, StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    DOMAIN,
+    RollingStatistics,
+    StatisticsSensor,
+)
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     SERVICE_RELOAD,
@@ -451,6 +455,39 @@ class TestStatisticsSensor(unittest.TestCase):
         )
 
 
+def test_rolling_statistics():
+    """Test the rolling aggregates match the statistics module."""
+    values = [17, 20, 15.2, 5, 3.8, 9.2, 6.7, 14, 6, 6, 20, -3.5, 0.1, 8]
+    rolling = RollingStatistics()
+    window = []
+
+    for value in values:
+        rolling.add(value)
+        window.append(value)
+        if len(window) > 5:
+            rolling.remove(window.pop(0))
+
+        assert len(rolling) == len(window)
+        assert rolling.mean == statistics.mean(window)
+        assert rolling.median == statistics.median(window)
+        assert rolling.min == min(window)
+        assert rolling.max == max(window)
+        assert round(rolling.total, 10) == round(sum(window), 10)
+        if len(window) > 1:
+            assert rolling.variance == statistics.variance(window)
+
+    while window:
+        rolling.remove(window.pop(0))
+        if window:
+            assert rolling.median == statistics.median(window)
+            assert rolling.min == min(window)
+            assert rolling.max == max(window)
+
+    assert len(rolling) == 0
+    rolling.add(4)
+    assert rolling.mean == rolling.median == rolling.min == rolling.max == 4
+
+
 async def test_reload(hass):
     """Verify we can reload filter sensors."""
     await hass.async_add_executor_job(
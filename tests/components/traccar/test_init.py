@@ -244,4 +244,4 @@ async def test_load_unload_entry(hass, client, webhook_id):
 
     assert await traccar.async_unload_entry(hass, entry)
     await hass.async_block_till_done()
-    assert not hass.data[DATA_DISPATCHER][TRACKER_UPDATE]
+    assert TRACKER_UPDATE not in hass.data[DATA_DISPATCHER]
@@ -11,7 +11,7 @@ from homeassistant.components.websocket_api.auth import (
 from homeassistant.components.websocket_api.const import URL
 from homeassistant.core import Context, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity
+from homeassistant.helpers import entity, timeline
 from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
@@ -985,3 +985,55 @@ async def test_test_condition(hass, websocket_client):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"]["result"] is True
+
+
+async def test_startup_timeline(hass, websocket_client):
+    """Test fetching the startup timeline."""
+    await websocket_client.send_json({"id": 5, "type": "startup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    recording = hass.data[timeline.DATA_TIMELINE] = timeline.Timeline()
+    with timeline.trace_block(hass, "hue", "import"):
+        pass
+
+    await websocket_client.send_json({"id": 6, "type": "startup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    assert msg["result"]["spans"][0]["name"] == "hue"
+    assert msg["result"]["spans"][0]["category"] == "import"
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "startup_timeline", "format": "chrome"}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+    assert msg["result"] == recording.as_chrome_trace()
+
+
+async def test_executor_stats(hass, websocket_client):
+    """Test fetching the executor stats."""
+
+    def job():
+        pass
+
+    job.__module__ = "homeassistant.components.hue.light"
+    await hass.async_add_executor_job(job)
+
+    await websocket_client.send_json({"id": 5, "type": "executor_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"]["partitions"]["default"] == 64
+    assert msg["result"]["integrations"]["hue"]["partition"] == "network"
+    assert msg["result"]["integrations"]["hue"]["jobs"] == 1
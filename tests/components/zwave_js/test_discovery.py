@@ -1,4 +1,9 @@
 """Test discovery of entities for device-specific schemas for the Z-Wave JS integration."""
+from homeassistant.components.zwave_js.discovery import (
+    DISCOVERY_SCHEMAS,
+    SCHEMAS_BY_COMMAND_CLASS,
+    async_get_node_schemas,
+)
 
 
 async def test_iblinds_v2(hass, client, iblinds_v2, integration):
@@ -35,3 +40,32 @@ async def test_inovelli_lzw36(hass, client, inovelli_lzw36, integration):
 
     state = hass.states.get("fan.family_room_combo_2")
     assert state
+
+
+def test_discovery_schema_index():
+    """Test the discovery schemas are indexed by command class in order."""
+    for command_class, indexes in SCHEMAS_BY_COMMAND_CLASS.items():
+        assert list(indexes) == sorted(indexes)
+        for idx in indexes:
+            schema = DISCOVERY_SCHEMAS[idx].primary_value
+            assert schema.command_class is None or command_class in schema.command_class
+
+    for idx, schema in enumerate(DISCOVERY_SCHEMAS):
+        for command_class in schema.primary_value.command_class or ():
+            assert idx in SCHEMAS_BY_COMMAND_CLASS[command_class]
+
+
+async def test_node_schemas(hass, client, ge_12730, integration):
+    """Test node level schema matching only includes matching device schemas."""
+    node_schemas = async_get_node_schemas(ge_12730)
+
+    for idx, schema in enumerate(DISCOVERY_SCHEMAS):
+        if schema.manufacturer_id is None or schema.platform != "fan":
+            continue
+        assert (idx in node_schemas) == (
+            ge_12730.manufacturer_id in schema.manufacturer_id
+            and ge_12730.product_id in schema.product_id
+        )
+
+    # the light schema has no node constraints
+    assert len(DISCOVERY_SCHEMAS) - 1 in node_schemas
@@ -5,8 +5,13 @@ import pytest
 
 from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import (
+    DATA_DISPATCHER,
     async_dispatcher_connect,
+    async_dispatcher_connect_keyed,
     async_dispatcher_send,
+    async_dispatcher_send_keyed,
+    async_dispatcher_subscriber_counts,
+    dispatcher_send_keyed,
 )
 
 
@@ -149,3 +154,82 @@ async def test_callback_exception_gets_logged(hass, caplog):
         f"Exception in functools.partial({bad_handler}) when dispatching 'test': ('bad',)"
         in caplog.text
     )
+
+
+async def test_unsub_cleans_up_signal(hass, caplog):
+    """Test removing the last listener removes the signal."""
+    unsub1 = async_dispatcher_connect(hass, "test", lambda: None)
+    unsub2 = async_dispatcher_connect(hass, "test", lambda: None)
+    assert len(hass.data[DATA_DISPATCHER]["test"]) == 2
+
+    unsub1()
+    assert len(hass.data[DATA_DISPATCHER]["test"]) == 1
+    unsub2()
+    assert "test" not in hass.data[DATA_DISPATCHER]
+
+    unsub2()
+    assert "Unable to remove unknown dispatcher" in caplog.text
+
+
+async def test_unsub_during_dispatch(hass):
+    """Test listeners can disconnect while a signal is dispatched."""
+    calls = []
+    unsubs = []
+
+    @callback
+    def test_funct(data):
+        """Test function."""
+        calls.append(data)
+        for unsub in unsubs:
+            unsub()
+        unsubs.clear()
+
+    unsubs.append(async_dispatcher_connect(hass, "test", test_funct))
+    unsubs.append(async_dispatcher_connect(hass, "test", test_funct))
+    async_dispatcher_send(hass, "test", 3)
+    await hass.async_block_till_done()
+
+    assert calls == [3, 3]
+    assert "test" not in hass.data[DATA_DISPATCHER]
+
+
+async def test_keyed_signal(hass):
+    """Test sending a keyed signal only reaches the listeners of that key."""
+    calls = []
+
+    @callback
+    def _listener(key):
+        @callback
+        def _handle(data):
+            calls.append((key, data))
+
+        return _handle
+
+    unsub = async_dispatcher_connect_keyed(hass, "test", "one", _listener("one"))
+    async_dispatcher_connect_keyed(hass, "test", ("two", 2), _listener("two"))
+    async_dispatcher_connect(hass, "test", _listener("unkeyed"))
+
+    async_dispatcher_send_keyed(hass, "test", "one", 1)
+    async_dispatcher_send_keyed(hass, "test", ("two", 2), 2)
+    async_dispatcher_send_keyed(hass, "test", "three", 3)
+    await hass.async_block_till_done()
+    assert calls == [("one", 1), ("two", 2)]
+
+    assert async_dispatcher_subscriber_counts(hass) == {"test": 3}
+
+    unsub()
+    async_dispatcher_send_keyed(hass, "test", "one", 4)
+    await hass.async_block_till_done()
+    assert calls == [("one", 1), ("two", 2)]
+    assert async_dispatcher_subscriber_counts(hass) == {"test": 2}
+
+
+async def test_keyed_signal_from_thread(hass):
+    """Test sending a keyed signal from a thread."""
+    calls = []
+
+    async_dispatcher_connect_keyed(hass, "test", "one", calls.append)
+    await hass.async_add_executor_job(dispatcher_send_keyed, hass, "test", "one", 1)
+    await hass.async_block_till_done()
+
+    assert calls == [1]
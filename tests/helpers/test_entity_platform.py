@@ -94,6 +94,114 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_spreads_entities_over_slots(hass):
+    """Test entities of large platforms are spread over the scan interval."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    entities = [MockEntity(should_poll=True) for _ in range(3)]
+    for ent in entities:
+        ent.async_update = Mock()
+
+    with patch.object(entity_platform, "POLL_SLOT_SIZE", 2), patch.object(
+        entity_platform.random, "random", return_value=0
+    ):
+        await component.async_add_entities(entities)
+
+    # Third entity is in a second slot polling at 1/MAX_POLL_SLOTS of the interval
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=3))
+    await hass.async_block_till_done()
+
+    assert not entities[0].async_update.called
+    assert not entities[1].async_update.called
+    assert entities[2].async_update.call_count == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert entities[0].async_update.call_count == 1
+    assert entities[1].async_update.call_count == 1
+
+    stats = entity_platform.async_get_entity_poller(hass).poll_statistics
+    assert stats[entities[0].entity_id]["polls"] == 1
+    assert stats[entities[1].entity_id]["polls"] == 1
+    assert stats[entities[0].entity_id]["last_duration"] >= 0
+
+
+async def test_polling_overrun_only_skips_entity(hass, caplog):
+    """Test an entity still updating is skipped without blocking others."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    block = asyncio.Event()
+    slow_updates = []
+    fast_updates = []
+    fast_updated = asyncio.Event()
+
+    async def slow_update():
+        slow_updates.append(None)
+        await block.wait()
+
+    async def fast_update():
+        fast_updates.append(None)
+        fast_updated.set()
+
+    slow_ent = MockEntity(should_poll=True)
+    slow_ent.async_update = slow_update
+    fast_ent = MockEntity(should_poll=True)
+    fast_ent.async_update = fast_update
+
+    await component.async_add_entities([slow_ent, fast_ent])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await asyncio.wait_for(fast_updated.wait(), 1)
+    fast_updated.clear()
+    assert len(slow_updates) == 1
+    assert len(fast_updates) == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    await asyncio.wait_for(fast_updated.wait(), 1)
+    assert len(slow_updates) == 1
+    assert len(fast_updates) == 2
+    assert (
+        f"Updating {DOMAIN} {slow_ent.entity_id} took longer than the scheduled "
+        "update interval" in caplog.text
+    )
+    stats = entity_platform.async_get_entity_poller(hass).poll_statistics
+    assert stats[slow_ent.entity_id]["overruns"] == 1
+
+    block.set()
+    await hass.async_block_till_done()
+
+
+async def test_polling_respects_parallel_updates(hass):
+    """Test polls of a platform run within its parallel updates."""
+    platform = MockPlatform()
+    platform.PARALLEL_UPDATES = 2
+    ent_platform = MockEntityPlatform(
+        hass, platform=platform, scan_interval=timedelta(seconds=20)
+    )
+
+    running = 0
+    max_running = 0
+
+    async def update():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    entities = [MockEntity(should_poll=True) for _ in range(5)]
+    for ent in entities:
+        ent.async_update = update
+
+    await ent_platform.async_add_entities(entities)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert max_running == 2
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -15,10 +15,13 @@ from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TIMER_WHEEL_HORIZON,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_active_timers,
+    async_state_change_listener_counts,
     async_track_point_in_time,
     async_track_point_in_utc_time,
     async_track_same_state,
@@ -93,6 +96,79 @@ async def test_track_point_in_time(hass):
     assert len(runs) == 2
 
 
+async def test_track_point_in_time_batches_timers(hass):
+    """Test timers due at the same time share a single handle."""
+    now = dt_util.utcnow()
+    point_in_time = now + timedelta(seconds=10)
+    runs = []
+
+    with patch.object(hass.loop, "call_later", wraps=hass.loop.call_later) as mock:
+        for idx in range(5):
+            async_track_point_in_utc_time(
+                hass, callback(lambda x, idx=idx: runs.append(idx)), point_in_time
+            )
+    assert len(mock.mock_calls) == 1
+    assert async_get_active_timers(hass) == {__name__: 5}
+
+    async_fire_time_changed(hass, point_in_time + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == [0, 1, 2, 3, 4]
+    assert async_get_active_timers(hass) == {}
+
+
+async def test_track_point_in_time_cancel_in_batch(hass):
+    """Test a timer cancelled by another timer of the same batch does not run."""
+    now = dt_util.utcnow()
+    point_in_time = now + timedelta(seconds=10)
+    runs = []
+    unsubs = []
+
+    @callback
+    def first(_):
+        runs.append("first")
+        unsubs[1]()
+
+    unsubs.append(async_track_point_in_utc_time(hass, first, point_in_time))
+    unsubs.append(
+        async_track_point_in_utc_time(
+            hass, callback(lambda x: runs.append("second")), point_in_time
+        )
+    )
+
+    async_fire_time_changed(hass, point_in_time + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == ["first"]
+
+    # Cancelling timers that already ran is a no-op
+    unsubs[0]()
+    unsubs[1]()
+
+
+async def test_track_point_in_time_far_future(hass):
+    """Test timers beyond the wheel horizon are moved closer and fire."""
+    now = dt_util.utcnow()
+    far_point = now + timedelta(seconds=TIMER_WHEEL_HORIZON * 3)
+    near_point = now + timedelta(seconds=5)
+    runs = []
+
+    async_track_point_in_utc_time(hass, callback(lambda x: runs.append(x)), far_point)
+    async_track_point_in_utc_time(hass, callback(lambda x: runs.append(x)), near_point)
+    assert async_get_active_timers(hass) == {__name__: 2}
+
+    async_fire_time_changed(hass, near_point + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == [near_point]
+
+    async_fire_time_changed(hass, far_point - timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == [near_point]
+    assert async_get_active_timers(hass) == {__name__: 1}
+
+    async_fire_time_changed(hass, far_point + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == [near_point, far_point]
+
+
 async def test_track_point_in_time_drift_rearm(hass):
     """Test tasks with the time rolling backwards."""
     specific_runs = []
@@ -531,6 +607,44 @@ async def test_async_track_state_change_event_with_empty_list(hass):
     unsub_single()
 
 
+async def test_async_track_state_change_event_listener_index(hass):
+    """Test state change listeners keep their order and can be counted."""
+    calls = []
+
+    unsub_first = async_track_state_change_event(
+        hass, ["light.bowl", "light.bowl"], ha.callback(lambda event: calls.append(1))
+    )
+    unsub_second = async_track_state_change_event(
+        hass,
+        ["light.bowl", "light.kitchen"],
+        ha.callback(lambda event: calls.append(2)),
+    )
+    unsub_third = async_track_state_change_event(
+        hass, "light.bowl", ha.callback(lambda event: calls.append(3))
+    )
+
+    assert async_state_change_listener_counts(hass) == {
+        "light.bowl": 3,
+        "light.kitchen": 1,
+    }
+
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    assert calls == [1, 2, 3]
+
+    unsub_second()
+    assert async_state_change_listener_counts(hass) == {"light.bowl": 2}
+
+    calls.clear()
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert calls == [1, 3]
+
+    unsub_first()
+    unsub_third()
+    assert async_state_change_listener_counts(hass) == {}
+
+
 async def test_async_track_state_added_domain(hass):
     """Test async_track_state_added_domain."""
     single_entity_id_tracker = []
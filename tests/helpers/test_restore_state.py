@@ -147,12 +147,12 @@ async def test_dump_data(hass):
     # b4 should not be written, since it is now expired
     # b5 should be written, since current state is restored by entity registry
     assert len(written_states) == 3
-    assert written_states[0]["state"]["entity_id"] == "input_boolean.b1"
-    assert written_states[0]["state"]["state"] == "on"
-    assert written_states[1]["state"]["entity_id"] == "input_boolean.b3"
-    assert written_states[1]["state"]["state"] == "off"
-    assert written_states[2]["state"]["entity_id"] == "input_boolean.b5"
-    assert written_states[2]["state"]["state"] == "off"
+    assert written_states[0].state.entity_id == "input_boolean.b1"
+    assert written_states[0].state.state == "on"
+    assert written_states[1].state.entity_id == "input_boolean.b3"
+    assert written_states[1].state.state == "off"
+    assert written_states[2].state.entity_id == "input_boolean.b5"
+    assert written_states[2].state.state == "off"
 
     # Test that removed entities are not persisted
     await entity.async_remove()
@@ -166,10 +166,10 @@ async def test_dump_data(hass):
     args = mock_write_data.mock_calls[0][1]
     written_states = args[0]
     assert len(written_states) == 2
-    assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
-    assert written_states[0]["state"]["state"] == "off"
-    assert written_states[1]["state"]["entity_id"] == "input_boolean.b5"
-    assert written_states[1]["state"]["state"] == "off"
+    assert written_states[0].state.entity_id == "input_boolean.b3"
+    assert written_states[0].state.state == "off"
+    assert written_states[1].state.entity_id == "input_boolean.b5"
+    assert written_states[1].state.state == "off"
 
 
 async def test_dump_error(hass):
@@ -271,3 +271,28 @@ async def test_restoring_invalid_entity_id(hass, hass_storage):
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+async def test_stored_state_decoded_lazily(hass):
+    """Test stored states are only decoded when accessed."""
+    now = dt_util.utcnow()
+    json_dict = {
+        "state": State("input_boolean.b0", "on").as_dict(),
+        "last_seen": now.isoformat(),
+    }
+
+    with patch(
+        "homeassistant.helpers.restore_state.State.from_dict",
+        wraps=State.from_dict,
+    ) as mock_from_dict:
+        stored_state = StoredState.from_dict(json_dict)
+        assert stored_state.last_seen == now
+        assert stored_state.as_dict() == {
+            "state": json_dict["state"],
+            "last_seen": now,
+        }
+        assert not mock_from_dict.called
+
+        assert stored_state.state.state == "on"
+        assert stored_state.state.entity_id == "input_boolean.b0"
+        assert mock_from_dict.call_count == 1
@@ -72,3 +72,82 @@ async def test_significant_change_extra(hass, checker):
         State(ent_id, "200", attrs), extra_arg=1
     )
     assert checker.async_is_significant_change(State(ent_id, "200", attrs), extra_arg=2)
+
+
+async def test_significant_change_prefilter(hass, checker):
+    """Test unchanged states are filtered before any check runs."""
+    ent_id = "test_domain.test_entity"
+    attrs = {ATTR_DEVICE_CLASS: DEVICE_CLASS_BATTERY}
+    calls = []
+
+    def extra_significant_check(
+        hass, old_state, old_attrs, old_extra_arg, new_state, new_attrs, new_extra_arg
+    ):
+        calls.append(new_extra_arg)
+        return old_extra_arg != new_extra_arg
+
+    checker.extra_significant_check = extra_significant_check
+
+    assert checker.async_prefilter(State(ent_id, "100", attrs))
+    assert checker.async_is_significant_change(State(ent_id, "100", attrs), extra_arg=1)
+
+    # Same state and attributes never reach the extra check
+    assert not checker.async_prefilter(State(ent_id, "100", attrs))
+    assert not checker.async_is_significant_change(
+        State(ent_id, "100", attrs), extra_arg=2
+    )
+    assert calls == []
+
+    # Rejected by the integration
+    assert not checker.async_prefilter(State(ent_id, "97", attrs))
+
+    assert checker.async_prefilter(State(ent_id, "90", attrs))
+    assert checker.async_is_significant_change(State(ent_id, "90", attrs), extra_arg=2)
+    assert calls == [2]
+
+
+async def test_significant_change_shared_cache(hass, checker):
+    """Test checkers share the result of the integration check."""
+    ent_id = "test_domain.test_entity"
+    other_checker = await significant_change.create_checker(hass, "other")
+    calls = []
+
+    def async_check_significant_change(
+        _hass, old_state, _old_attrs, new_state, _new_attrs, **kwargs
+    ):
+        calls.append(new_state)
+        return old_state != new_state
+
+    hass.data[significant_change.DATA_FUNCTIONS][
+        "test_domain"
+    ] = async_check_significant_change
+
+    old_state = State(ent_id, "100")
+    new_state = State(ent_id, "200")
+
+    for cur_checker in (checker, other_checker):
+        assert cur_checker.async_is_significant_change(old_state)
+        assert cur_checker.async_prefilter(new_state)
+        assert cur_checker.async_is_significant_change(new_state)
+
+    assert calls == ["200"]
+
+
+def test_check_attributes_changed():
+    """Test checking attributes against declared thresholds."""
+    thresholds = {"effect": None, "brightness": 3}
+
+    assert not significant_change.check_attributes_changed(
+        {"effect": "rainbow", "brightness": 100},
+        {"effect": "rainbow", "brightness": 102},
+        thresholds,
+    )
+    assert significant_change.check_attributes_changed(
+        {"brightness": 100}, {"brightness": 103}, thresholds
+    )
+    assert significant_change.check_attributes_changed(
+        {"effect": "rainbow"}, {"effect": "colorloop"}, thresholds
+    )
+    assert significant_change.check_attributes_changed(
+        {}, {"brightness": 1}, thresholds
+    )
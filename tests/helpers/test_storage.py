@@ -2,6 +2,7 @@
 import asyncio
 from datetime import timedelta
 import json
+import os
 from unittest.mock import Mock, patch
 
 import pytest
@@ -279,3 +280,81 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+def _mock_file_store(tmp_path, **kwargs):
+    """Return a store writing to a temporary directory."""
+    hass = Mock()
+    hass.config.path = lambda *parts: str(tmp_path.joinpath(*parts))
+    return storage.Store(hass, MOCK_VERSION, MOCK_KEY, **kwargs)
+
+
+def _write(store, data):
+    """Write data like a save would."""
+    store._write_data(
+        store.path, {"version": MOCK_VERSION, "key": MOCK_KEY, "data": data}
+    )
+
+
+def test_compact(tmp_path):
+    """Test compact stores are written without indentation."""
+    store = _mock_file_store(tmp_path, compact=True)
+    _write(store, MOCK_DATA)
+
+    with open(store.path) as fdesc:
+        assert fdesc.read() == (
+            '{"version":1,"key":"storage-test","data":{"hello":"world"}}'
+        )
+
+
+def test_journal(tmp_path):
+    """Test journaled stores only append the changes."""
+    store = _mock_file_store(tmp_path, journal=True)
+    data = {"items": [{"id": 1}, {"id": 2}, {"id": 3}], "name": "a", "old": 1}
+    _write(store, data)
+    full_size = os.path.getsize(store.path)
+
+    data = {"items": [{"id": 1}, {"id": 4}], "name": "a", "new": [1]}
+    _write(store, data)
+    data["items"].append({"id": 5})
+    _write(store, data)
+    # Nothing changed, nothing written
+    _write(store, data)
+
+    assert os.path.getsize(store.path) == full_size
+    with open(store.journal_path) as fdesc:
+        assert len(fdesc.readlines()) == 2
+
+    loaded = _mock_file_store(tmp_path, journal=True)._load_data()
+    assert loaded == {"version": MOCK_VERSION, "key": MOCK_KEY, "data": data}
+
+    # Changing the root type replaces everything
+    _write(store, ["list"])
+    assert _mock_file_store(tmp_path, journal=True)._load_data()["data"] == ["list"]
+
+    # Rewritten in full once the journal is long enough
+    with patch.object(storage, "JOURNAL_MAX_ENTRIES", 3):
+        _write(store, ["full"])
+
+    assert not os.path.exists(store.journal_path)
+    assert _mock_file_store(tmp_path, journal=True)._load_data()["data"] == ["full"]
+
+
+def test_journal_ignores_stale_and_partial_entries(tmp_path):
+    """Test journal entries are only applied to the store they belong to."""
+    store = _mock_file_store(tmp_path, journal=True)
+    _write(store, [1])
+    _write(store, [2])
+
+    with open(store.journal_path) as fdesc:
+        stale_entry = fdesc.read()
+
+    # Next process starts with a full write
+    store = _mock_file_store(tmp_path, journal=True)
+    _write(store, [3])
+
+    with open(store.journal_path, "w") as fdesc:
+        fdesc.write(stale_entry)
+        fdesc.write('{"journal":')
+
+    assert store._load_data()["data"] == [3]
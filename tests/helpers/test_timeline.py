@@ -0,0 +1,138 @@
+"""Test the startup timeline helper."""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.helpers import timeline
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockModule, mock_integration
+
+
+def _spans(hass):
+    """Return the recorded spans by name and category."""
+    return {
+        (span.name, span.category): span
+        for span in hass.data[timeline.DATA_TIMELINE].spans
+    }
+
+
+async def test_not_recording(hass):
+    """Test tracing without a timeline."""
+
+    async def work():
+        return 5
+
+    assert await timeline.async_trace(hass, "work", "test", work()) == 5
+
+    with timeline.trace_block(hass, "block", "test") as span:
+        assert span is None
+
+
+async def test_nested_spans(hass):
+    """Test spans are nested following the tasks that create them."""
+    recording = hass.data[timeline.DATA_TIMELINE] = timeline.Timeline()
+
+    async def child():
+        with timeline.trace_block(hass, "block", "test"):
+            pass
+        await asyncio.sleep(0)
+        return "child"
+
+    async def parent():
+        task = hass.async_create_task(
+            timeline.async_trace(hass, "child", "test", child(), number=1)
+        )
+        await asyncio.sleep(0)
+        return await task
+
+    assert await timeline.async_trace(hass, "parent", "test", parent()) == "child"
+
+    spans = _spans(hass)
+    assert spans["parent", "test"].parent is None
+    assert spans["child", "test"].parent is spans["parent", "test"]
+    assert spans["block", "test"].parent is spans["child", "test"]
+    assert all(span.end is not None for span in spans.values())
+
+    data = recording.as_dict()
+    assert not data["finished"]
+    assert [(span["name"], span["parent"]) for span in data["spans"]] == [
+        ("parent", None),
+        ("child", 0),
+        ("block", 1),
+    ]
+    assert data["spans"][1]["args"] == {"number": 1}
+
+    recording.async_finish()
+    assert await timeline.async_trace(hass, "late", "test", child()) == "child"
+    assert len(recording.spans) == 3
+    assert recording.as_dict()["finished"]
+
+
+async def test_exception_propagates(hass):
+    """Test exceptions are raised through the traced awaitable."""
+    hass.data[timeline.DATA_TIMELINE] = timeline.Timeline()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        await timeline.async_trace(hass, "fail", "test", fail())
+
+    assert _spans(hass)["fail", "test"].end is not None
+
+
+async def test_blocking_setup(hass, caplog):
+    """Test integrations that block the event loop are flagged."""
+    recording = hass.data[timeline.DATA_TIMELINE] = timeline.Timeline()
+
+    async def async_setup(hass, config):
+        await asyncio.sleep(0)
+        time.sleep(0.05)
+        return True
+
+    mock_integration(hass, MockModule("comp", async_setup=async_setup))
+
+    with patch.object(timeline, "BLOCKING_THRESHOLD", 0.04):
+        assert await async_setup_component(hass, "comp", {})
+
+        assert [span.name for span in recording.blocking()] == ["comp"]
+
+    spans = _spans(hass)
+    assert spans["comp", "setup"].parent is spans["comp", "integration"]
+    assert spans["comp", "config"].parent is spans["comp", "integration"]
+    assert spans["comp", "setup"].blocked >= 0.05
+    assert spans["comp", "setup"].cpu < spans["comp", "setup"].blocked
+    assert "Setup of comp blocked the event loop" in caplog.text
+
+
+async def test_chrome_trace(hass):
+    """Test the chrome trace puts overlapping spans in separate lanes."""
+    recording = hass.data[timeline.DATA_TIMELINE] = timeline.Timeline()
+    first_done = asyncio.Event()
+    second_done = asyncio.Event()
+
+    async def parent():
+        first = hass.async_create_task(
+            timeline.async_trace(hass, "first", "test", first_done.wait())
+        )
+        await asyncio.sleep(0)
+        second = hass.async_create_task(
+            timeline.async_trace(hass, "second", "test", second_done.wait())
+        )
+        await asyncio.sleep(0)
+        first_done.set()
+        await first
+        second_done.set()
+        await second
+
+    await timeline.async_trace(hass, "parent", "test", parent())
+
+    trace = recording.as_chrome_trace()
+    lanes = {event["name"]: event["tid"] for event in trace["traceEvents"]}
+    assert lanes["parent"] == lanes["first"] == 0
+    assert lanes["second"] == 1
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
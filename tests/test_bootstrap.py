@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, runner
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
@@ -608,3 +608,48 @@ async def test_setup_safe_mode_if_no_frontend(
     assert hass.config.skip_pip
     assert hass.config.internal_url == "http://192.168.1.100:8123"
     assert hass.config.external_url == "https://abcdef.ui.nabu.casa"
+
+
+async def test_preimport_integrations(hass):
+    """Test integrations and their platforms are imported before setup."""
+    integrations = {
+        domain: await loader.async_get_integration(hass, domain)
+        for domain in ("device_tracker", "sensor", "zone")
+    }
+    config = {"sensor": [{"platform": "template"}, {"platform": "non_existing"}]}
+    imported = []
+
+    def mock_import(name):
+        """Mock an import."""
+        imported.append(name)
+
+    with patch("homeassistant.bootstrap.importlib") as mock_importlib:
+        mock_importlib.import_module.side_effect = mock_import
+        await bootstrap._async_preimport_integrations(hass, config, integrations)
+
+    assert sorted(imported) == [
+        "homeassistant.components.device_tracker",
+        "homeassistant.components.sensor",
+        "homeassistant.components.template.sensor",
+        "homeassistant.components.zone",
+    ]
+    assert imported.index("homeassistant.components.zone") < imported.index(
+        "homeassistant.components.device_tracker"
+    )
+    assert set(hass.data[bootstrap.DATA_PREIMPORT_TIMES]) == set(imported)
+
+
+async def test_preimport_skips_missing_requirements(hass):
+    """Test integrations are not imported before their requirements."""
+    integrations = {
+        domain: await loader.async_get_integration(hass, domain)
+        for domain in ("device_tracker", "zone")
+    }
+
+    with patch("homeassistant.bootstrap.importlib") as mock_importlib, patch(
+        "homeassistant.bootstrap.is_installed", return_value=False
+    ), patch.object(integrations["zone"], "manifest", {"requirements": ["zone==1"]}):
+        await bootstrap._async_preimport_integrations(hass, {}, integrations)
+
+    # Device tracker depends on zone
+    assert not mock_importlib.import_module.called
@@ -1,4 +1,5 @@
 """Test to verify that we can load components."""
+import pathlib
 from unittest.mock import ANY, patch
 
 import pytest
@@ -6,8 +7,15 @@ import pytest
 from homeassistant import core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.generated.manifests import MANIFESTS
+from homeassistant.util import dt as dt_util
 
-from tests.common import MockModule, async_mock_service, mock_integration
+from tests.common import (
+    MockModule,
+    async_fire_time_changed,
+    async_mock_service,
+    mock_integration,
+)
 
 
 async def test_component_dependencies(hass):
@@ -200,6 +208,19 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_index(hass):
+    """Test built-in integrations are resolved from the manifest index."""
+    with patch.object(loader.Integration, "resolve_from_root") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "http")
+
+    assert not mock_resolve.mock_calls
+    assert integration.pkg_path == "homeassistant.components.http"
+    assert integration.file_path == pathlib.Path(http.__file__).parent
+    assert integration.name == MANIFESTS["http"]["name"]
+    assert integration.is_built_in
+    assert "is_built_in" not in MANIFESTS["http"]
+
+
 async def test_get_integration_legacy(hass):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
@@ -326,6 +347,42 @@ async def test_get_custom_components_internal(hass):
     assert integrations == {"test": ANY, "test_package": ANY}
 
 
+async def test_get_custom_components_cached_index(hass, hass_storage):
+    """Test that unchanged custom component manifests come from the index."""
+    # pylint: disable=protected-access
+    custom_path = pathlib.Path(hass.config.path("custom_components"))
+    test_manifest = custom_path / "test" / "manifest.json"
+    package_manifest = custom_path / "test_package" / "manifest.json"
+    hass_storage[loader.STORAGE_KEY] = {
+        "version": loader.STORAGE_VERSION,
+        "data": {
+            "dirs": {},
+            "manifests": {
+                str(test_manifest): [
+                    test_manifest.stat().st_mtime_ns,
+                    {"domain": "test", "name": "Cached Test"},
+                ],
+                str(package_manifest): [
+                    package_manifest.stat().st_mtime_ns - 1,
+                    {"domain": "test_package", "name": "Stale"},
+                ],
+            },
+        },
+    }
+
+    integrations = await loader._async_get_custom_components(hass)
+    assert integrations["test"].name == "Cached Test"
+    assert integrations["test_package"].name == "Test Package"
+    assert integrations["test_package"].pkg_path == "custom_components.test_package"
+
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+
+    index = hass_storage[loader.STORAGE_KEY]["data"]
+    assert str(custom_path) in index["dirs"]
+    assert index["manifests"][str(package_manifest)][1]["name"] == "Test Package"
+
+
 def _get_test_integration(hass, name, config_flow):
     """Return a generated test integration."""
     return loader.Integration(
@@ -507,3 +564,12 @@ async def test_get_custom_components_safe_mode(hass):
     """Test that we get empty custom components in safe mode."""
     hass.config.safe_mode = True
     assert await loader.async_get_custom_components(hass) == {}
+
+
+def test_get_executor_partition():
+    """Test the executor partition of integrations."""
+    assert loader.get_executor_partition("homeassistant") == "default"
+    assert loader.get_executor_partition("recorder") == "database"
+    assert loader.get_executor_partition("hue") == "network"
+    assert loader.get_executor_partition("automation") == "default"
+    assert loader.get_executor_partition("not_built_in") == "network"
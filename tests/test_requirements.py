@@ -4,7 +4,7 @@ from unittest.mock import call, patch
 
 import pytest
 
-from homeassistant import loader, setup
+from homeassistant import loader, requirements, setup
 from homeassistant.requirements import (
     CONSTRAINT_FILE,
     RequirementsNotFound,
@@ -91,6 +91,46 @@ async def test_install_missing_package(hass):
     assert len(mock_inst.mock_calls) == 1
 
 
+async def test_installed_packages_snapshot(hass, hass_storage):
+    """Test requirements are checked against a stored snapshot."""
+    hass_storage[requirements.STORAGE_KEY] = {
+        "version": requirements.STORAGE_VERSION,
+        "data": {
+            "mtimes": requirements._path_mtimes(),
+            "packages": {"hello-world": "1.0.0"},
+        },
+    }
+
+    with patch("homeassistant.util.package.installed_packages") as mock_packages, patch(
+        "homeassistant.util.package.install_package"
+    ) as mock_inst:
+        await async_process_requirements(hass, "test_component", ["Hello_World==1.0.0"])
+
+    assert len(mock_packages.mock_calls) == 0
+    assert len(mock_inst.mock_calls) == 0
+    assert hass.data[requirements.DATA_REQUIREMENTS_TIME] > 0
+
+    # A changed path rebuilds the snapshot, also after installing a package
+    hass.data.pop(requirements.DATA_PKG_CACHE)
+    hass_storage[requirements.STORAGE_KEY]["data"]["mtimes"] = {}
+
+    with patch.object(
+        requirements,
+        "_path_mtimes",
+        side_effect=[{"path": 1}, {"path": 2}, {"path": 3}],
+    ), patch(
+        "homeassistant.util.package.installed_packages", return_value={}
+    ) as mock_packages, patch(
+        "homeassistant.util.package.install_package", return_value=True
+    ) as mock_inst:
+        await async_process_requirements(
+            hass, "test_component", ["hello-world==1.0.0", "other==1.0.0"]
+        )
+
+    assert len(mock_packages.mock_calls) == 3
+    assert len(mock_inst.mock_calls) == 2
+
+
 async def test_get_integration_with_requirements(hass):
     """Check getting an integration with loaded requirements."""
     hass.config.skip_pip = False
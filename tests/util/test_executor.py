@@ -0,0 +1,139 @@
+"""Test the partitioned executor."""
+import functools
+import threading
+
+import pytest
+
+from homeassistant.util import executor as executor_util
+
+
+def _job(module, result=None):
+    """Return a job that looks like it is defined in module."""
+
+    def job(*args, **kwargs):
+        return result or (threading.current_thread().name, args, kwargs)
+
+    job.__module__ = module
+    return job
+
+
+@pytest.fixture
+def executor():
+    """Return a partitioned executor."""
+    partitions = {"hue": "network", "recorder": "database"}
+    pool = executor_util.PartitionedExecutor(
+        4,
+        lambda domain: partitions.get(domain, "default"),
+        {"network": 2, "database": 1},
+    )
+    yield pool
+    pool.shutdown()
+
+
+def test_domain_from_module():
+    """Test finding the integration of a module."""
+    assert executor_util.domain_from_module("homeassistant.components.hue") == "hue"
+    assert (
+        executor_util.domain_from_module("homeassistant.components.hue.light") == "hue"
+    )
+    assert executor_util.domain_from_module("custom_components.demo.sensor") == "demo"
+    assert executor_util.domain_from_module("homeassistant.core") == "homeassistant"
+    assert executor_util.domain_from_module("requests.api") == "homeassistant"
+
+
+def test_partition_routing(executor):
+    """Test jobs run in the pool of their partition."""
+    name, args, kwargs = executor.submit(
+        _job("homeassistant.components.hue.light"), 1, key=2
+    ).result()
+    assert name.startswith("SyncWorker-network")
+    assert args == (1,)
+    assert kwargs == {"key": 2}
+
+    name, _, _ = executor.submit(
+        functools.partial(_job("homeassistant.components.recorder.util"))
+    ).result()
+    assert name.startswith("SyncWorker-database")
+
+    name, _, _ = executor.submit(_job("homeassistant.helpers.storage")).result()
+    assert name.startswith("SyncWorker_")
+
+
+def test_partition_annotation(executor):
+    """Test jobs can pick their partition."""
+    job = executor_util.executor_partition("database")(
+        _job("homeassistant.components.hue")
+    )
+    name, _, _ = executor.submit(job).result()
+    assert name.startswith("SyncWorker-database")
+
+    stats = executor.as_dict()["integrations"]
+    assert stats["hue:database"]["partition"] == "database"
+    assert "hue" not in stats
+
+    with pytest.raises(ValueError):
+        executor_util.executor_partition("unknown")
+
+
+def test_stats(executor):
+    """Test queue wait and run time are accounted per integration."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait()
+
+    block.__module__ = "homeassistant.components.recorder"
+
+    first = executor.submit(block)
+    started.wait()
+    second = executor.submit(_job("homeassistant.components.recorder", "done"))
+
+    stats = executor.as_dict()["integrations"]["recorder"]
+    assert stats["running"] == 1
+    assert stats["jobs"] == 1
+
+    release.set()
+    first.result()
+    assert second.result() == "done"
+
+    data = executor.as_dict()
+    assert data["partitions"] == {"default": 4, "network": 2, "database": 1}
+    stats = data["integrations"]["recorder"]
+    assert stats["partition"] == "database"
+    assert stats["jobs"] == 2
+    assert stats["running"] == 0
+    assert stats["max_queue_wait"] > 0
+    assert stats["queue_wait"] >= stats["max_queue_wait"]
+    assert stats["run_time"] >= stats["max_run_time"] > 0
+
+
+def test_exception_accounted(executor):
+    """Test failing jobs are accounted and raise."""
+
+    def fail():
+        raise ValueError
+
+    fail.__module__ = "homeassistant.components.hue"
+
+    with pytest.raises(ValueError):
+        executor.submit(fail).result()
+
+    stats = executor.as_dict()["integrations"]["hue"]
+    assert stats["jobs"] == 1
+    assert stats["running"] == 0
+
+
+async def test_get_partitioned_executor(hass):
+    """Test the event loop runs executor jobs in partitions."""
+    assert executor_util.get_partitioned_executor(object()) is None
+
+    executor = executor_util.get_partitioned_executor(hass.loop)
+    assert isinstance(executor, executor_util.PartitionedExecutor)
+
+    name, _, _ = await hass.async_add_executor_job(
+        _job("homeassistant.components.hue.light")
+    )
+    assert name.startswith("SyncWorker-network")
+    assert executor.as_dict()["integrations"]["hue"]["jobs"] == 1
@@ -243,6 +243,19 @@ def test_check_package_global():
     assert package.is_installed(installed_package)
 
 
+def test_check_package_snapshot():
+    """Test for a package in a snapshot of installed packages."""
+    installed_package = list(pkg_resources.working_set)[0]
+    installed = package.installed_packages()
+    assert installed[package.normalize_name(installed_package.project_name)] == (
+        installed_package.version
+    )
+    assert package.is_installed(installed_package.project_name, installed)
+    assert package.is_installed("Hello_World==1.0", {"hello-world": "1.0"})
+    assert not package.is_installed("hello-world==1.1", {"hello-world": "1.0"})
+    assert not package.is_installed("hello-world==1.0", {})
+
+
 def test_check_package_zip():
     """Test for an installed zip package."""
     assert not package.is_installed(TEST_ZIP_REQ)
@@ -446,3 +446,114 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+def test_fast_loader_keeps_annotations():
+    """Test the fast loader annotates the same file and lines."""
+    content = io.StringIO("key:\n  - one\n  - nested: two\n")
+    content.name = "configuration.yaml"
+    fast = yaml_loader.parse_yaml(content)
+
+    content.seek(0)
+    slow = yaml_loader.yaml.load(content, Loader=yaml_loader.SafeLineLoader)
+
+    assert fast == slow
+    for fast_obj, slow_obj in (
+        (fast, slow),
+        (fast["key"], slow["key"]),
+        (fast["key"][1], slow["key"][1]),
+    ):
+        assert fast_obj.__config_file__ == slow_obj.__config_file__
+        assert fast_obj.__line__ == slow_obj.__line__
+
+
+def test_yaml_cache(tmp_path, monkeypatch):
+    """Test the cache only parses changed files again."""
+    monkeypatch.setenv("CACHE_TEST", "env")
+    config_path = tmp_path / YAML_CONFIG_FILE
+    config_path.write_text(
+        "included: !include included.yaml\n"
+        "listed: !include_dir_list listed\n"
+        "secret: !secret password\n"
+        "env: !env_var CACHE_TEST\n"
+    )
+    (tmp_path / "included.yaml").write_text("value: 1\n")
+    (tmp_path / "listed").mkdir()
+    (tmp_path / "listed" / "one.yaml").write_text("one\n")
+    (tmp_path / yaml.SECRET_YAML).write_text("password: pwhash\n")
+
+    def load(cache):
+        """Load the config and return the result and the number of files parsed."""
+        with patch.object(
+            yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+        ) as mock_parse:
+            result = yaml.load_yaml(str(config_path), yaml.Secrets(tmp_path), cache)
+        return result, len(mock_parse.mock_calls)
+
+    # Every new Secrets parses secrets.yaml again when a secret is resolved
+    cache = yaml.YamlCache()
+    expected, parsed = load(cache)
+    assert expected == {
+        "included": {"value": 1},
+        "listed": ["one"],
+        "secret": "pwhash",
+        "env": "env",
+    }
+    assert parsed == 4
+
+    result, parsed = load(cache)
+    assert result == expected
+    assert parsed == 0
+    assert result["included"].__config_file__ == str(config_path)
+    assert result["included"].__line__ == 0
+    assert result is not expected
+
+    (tmp_path / "included.yaml").write_text("value: 22\n")
+    result, parsed = load(cache)
+    assert result["included"] == {"value": 22}
+    assert parsed == 3
+
+    (tmp_path / "listed" / "two.yaml").write_text("two\n")
+    result, parsed = load(cache)
+    assert result["listed"] == ["one", "two"]
+    assert parsed == 3
+
+    (tmp_path / yaml.SECRET_YAML).write_text("password: other\n")
+    result, parsed = load(cache)
+    assert result["secret"] == "other"
+    assert parsed == 2
+
+    monkeypatch.setenv("CACHE_TEST", "changed")
+    result, parsed = load(cache)
+    assert result["env"] == "changed"
+    assert parsed == 2
+
+
+def test_yaml_cache_on_disk(tmp_path):
+    """Test the cache is persisted between runs."""
+    config_path = tmp_path / YAML_CONFIG_FILE
+    config_path.write_text("key: [1, 2]\n")
+    cache_path = str(tmp_path / ".yaml_cache")
+
+    cache = yaml.YamlCache(cache_path)
+    assert yaml.load_yaml(str(config_path), None, cache) == {"key": [1, 2]}
+    cache.save()
+
+    with patch.object(yaml_loader, "parse_yaml") as mock_parse:
+        result = yaml.load_yaml(str(config_path), None, yaml.YamlCache(cache_path))
+
+    assert result == {"key": [1, 2]}
+    assert result["key"].__line__ == 0
+    assert not mock_parse.mock_calls
+
+
+def test_yaml_cache_skips_missing_files():
+    """Test files that can not be found on disk are not cached."""
+    cache = yaml.YamlCache()
+    files = {YAML_CONFIG_FILE: "key: value"}
+    with patch_yaml_files(files):
+        assert load_yaml_config_file(YAML_CONFIG_FILE, None, cache) == {"key": "value"}
+
+    files = {YAML_CONFIG_FILE: "key: other"}
+    with patch_yaml_files(files):
+        assert load_yaml_config_file(YAML_CONFIG_FILE, None, cache) == {"key": "other"}